@@ -0,0 +1,282 @@
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, AsyncIterator, Tuple
+from .hh_api import (
+    HeadHunterAPI,
+    MAX_EMPLOYERS_PER_REQUEST,
+    group_by_employer,
+    is_truncated,
+)
+
+
+class AsyncHeadHunterAPI:
+    """
+    Асинхронный клиент hh.ru.
+    Позволяет одновременно загружать вакансии по многим запросам
+    с общим ограничением на число одновременных HTTP-запросов.
+
+    Не наследует BaseAPI: методы получения вакансий здесь — корутины,
+    а запросы выполняет синхронный клиент HeadHunterAPI.
+    """
+
+    def __init__(
+        self,
+        api: Optional[HeadHunterAPI] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Инициализация асинхронного клиента.
+
+        Args:
+            api (Optional[HeadHunterAPI]): Синхронный клиент, чья сессия, таймауты
+                и повторы используются для запросов. По умолчанию создается новый
+            max_concurrency (Optional[int]): Глобальный предел одновременных
+                запросов. По умолчанию равен размеру пула соединений клиента
+        """
+        self.api = api or HeadHunterAPI(pool_size=max_concurrency or 16)
+        self.max_concurrency = max_concurrency or self.api.pool_size
+        # requests блокирующий, поэтому запросы выполняются в отдельном пуле
+        # потоков, размер которого совпадает с пределом параллельности
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+    def close(self):
+        """Остановить пул потоков."""
+        self._executor.shutdown(wait=False)
+
+    async def _fetch_page(
+        self, search_query: str, page: int, semaphore: asyncio.Semaphore, **params
+    ) -> Optional[Dict[str, Any]]:
+        """Загрузить одну страницу выдачи с учетом глобального ограничения."""
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(self.api._fetch_page, search_query, page, **params),
+            )
+
+    async def _get_vacancies(
+        self, search_query: str, semaphore: asyncio.Semaphore, **params
+    ) -> List[Dict[str, Any]]:
+        """Загрузить все страницы по запросу, объединяя их в порядке страниц."""
+        first_page = await self._fetch_page(search_query, 0, semaphore, **params)
+        if first_page is None:
+            return []
+        vacancies, _ = await self._collect_pages(
+            first_page, search_query, semaphore, **params
+        )
+        return vacancies
+
+    async def _collect_pages(
+        self,
+        first_page: Dict[str, Any],
+        search_query: str,
+        semaphore: asyncio.Semaphore,
+        **params,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Догрузить остальные страницы выдачи одновременно.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Вакансии в порядке страниц
+                и признак полноты выдачи (см. HeadHunterAPI.fetch_vacancies)
+        """
+        vacancies = list(first_page.get("items", []))
+        pages = first_page.get("pages", 1)
+
+        rest = await asyncio.gather(
+            *(
+                self._fetch_page(search_query, page, semaphore, **params)
+                for page in range(1, pages)
+            )
+        )
+        for page_data in rest:
+            if page_data is not None:
+                vacancies.extend(page_data.get("items", []))
+
+        complete = None not in rest and not is_truncated(first_page)
+        return vacancies, complete
+
+    async def get_vacancies(
+        self, search_query: str, **params
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить вакансии с hh.ru по поисковому запросу (корутина).
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await self._get_vacancies(search_query, semaphore, **params)
+
+    async def iter_vacancies(
+        self, search_query: str, **params
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Получать вакансии по мере загрузки страниц (асинхронный генератор).
+
+        Пока потребитель обрабатывает текущую страницу, следующие
+        prefetch_pages страниц (см. HeadHunterAPI) загружаются в фоне.
+        Порядок страниц сохраняется.
+
+        Args:
+            search_query (str): Поисковый запрос
+            **params: Дополнительные параметры поиска hh.ru
+
+        Yields:
+            Dict[str, Any]: Вакансия в формате hh.ru
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        first_page = await self._fetch_page(search_query, 0, semaphore, **params)
+        if first_page is None:
+            return
+
+        pages = first_page.get("pages", 1)
+        prefetch = max(1, self.api.prefetch_pages)
+        tasks = deque()
+        next_page = 1
+        try:
+            while next_page < pages and len(tasks) < prefetch:
+                tasks.append(
+                    asyncio.ensure_future(
+                        self._fetch_page(search_query, next_page, semaphore, **params)
+                    )
+                )
+                next_page += 1
+
+            for vacancy in first_page.get("items", []):
+                yield vacancy
+
+            while tasks:
+                page_data = await tasks.popleft()
+                if next_page < pages:
+                    tasks.append(
+                        asyncio.ensure_future(
+                            self._fetch_page(
+                                search_query, next_page, semaphore, **params
+                            )
+                        )
+                    )
+                    next_page += 1
+                if page_data is not None:
+                    for vacancy in page_data.get("items", []):
+                        yield vacancy
+        finally:
+            # Если потребитель прервал обход, незавершенные загрузки отменяются
+            for task in tasks:
+                task.cancel()
+
+    async def get_vacancies_many(
+        self, search_queries: Iterable[str], **params
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Получить вакансии сразу по нескольким запросам.
+
+        Все запросы и все их страницы выполняются одновременно под одним
+        семафором, поэтому общее время определяется самым медленным запросом.
+
+        Args:
+            search_queries (Iterable[str]): Поисковые запросы
+            **params: Дополнительные параметры поиска, общие для всех запросов
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Вакансии по каждому запросу
+        """
+        queries = list(search_queries)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._get_vacancies(query, semaphore, **params) for query in queries)
+        )
+        return dict(zip(queries, results))
+
+    async def _get_employers_chunk(
+        self,
+        employer_ids: List[int],
+        search_query: str,
+        semaphore: asyncio.Semaphore,
+        **params,
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        Загрузить вакансии группы работодателей, деля ее при усечении выдачи.
+
+        Выдача одного работодателя, которая больше глубины поиска, дальше
+        первой страницы не загружается: ее нужно делить на подзапросы.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[int]]: Вакансии и работодатели,
+                чья выдача получена не полностью
+        """
+        first_page = await self._fetch_page(
+            search_query, 0, semaphore, employer_id=employer_ids, **params
+        )
+        if first_page is None:
+            return [], list(employer_ids)
+        if is_truncated(first_page):
+            if len(employer_ids) == 1:
+                return list(first_page.get("items", [])), list(employer_ids)
+            middle = len(employer_ids) // 2
+            halves = await asyncio.gather(
+                self._get_employers_chunk(
+                    employer_ids[:middle], search_query, semaphore, **params
+                ),
+                self._get_employers_chunk(
+                    employer_ids[middle:], search_query, semaphore, **params
+                ),
+            )
+            return halves[0][0] + halves[1][0], halves[0][1] + halves[1][1]
+        vacancies, complete = await self._collect_pages(
+            first_page, search_query, semaphore, employer_id=employer_ids, **params
+        )
+        return vacancies, [] if complete else list(employer_ids)
+
+    async def fetch_vacancies_by_employers(
+        self, employer_ids: List[int], search_query: str = "", **params
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], List[int]]:
+        """
+        Получить вакансии нескольких работодателей одновременно.
+
+        Работодатели объединяются в группы по MAX_EMPLOYERS_PER_REQUEST
+        идентификаторов на запрос, все группы и страницы загружаются
+        под одним семафором. Группа с усеченной выдачей делится пополам;
+        работодатель, чья выдача сама больше глубины поиска, возвращается
+        в списке неполных сразу после первой страницы, без загрузки
+        остальных — его вакансии нужно получать через QueryPlanner.
+
+        Args:
+            employer_ids (List[int]): Идентификаторы работодателей на hh.ru
+            search_query (str): Дополнительный текстовый фильтр
+            **params: Дополнительные параметры поиска hh.ru
+
+        Returns:
+            Tuple[Dict[int, List[Dict[str, Any]]], List[int]]: Вакансии по
+                каждому работодателю и работодатели, чья выдача получена
+                не полностью
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        chunks = [
+            employer_ids[start:start + MAX_EMPLOYERS_PER_REQUEST]
+            for start in range(0, len(employer_ids), MAX_EMPLOYERS_PER_REQUEST)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._get_employers_chunk(chunk, search_query, semaphore, **params)
+                for chunk in chunks
+            )
+        )
+        vacancies = [vacancy for chunk, _ in results for vacancy in chunk]
+        incomplete = [employer_id for _, ids in results for employer_id in ids]
+        return group_by_employer(vacancies, employer_ids), incomplete
+
+    async def get_vacancies_by_employers(
+        self, employer_ids: List[int], search_query: str = "", **params
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Получить вакансии нескольких работодателей одновременно.
+
+        То же, что fetch_vacancies_by_employers, без списка неполных выдач.
+
+        Returns:
+            Dict[int, List[Dict[str, Any]]]: Вакансии по каждому работодателю
+        """
+        grouped, _ = await self.fetch_vacancies_by_employers(
+            employer_ids, search_query, **params
+        )
+        return grouped
@@ -1,16 +1,46 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterator
+from .rate_limiter import RequestScheduler, RequestSlot, get_default_scheduler
 
 
 class BaseAPI(ABC):
     """
     Абстрактный класс для работы с API сервисов вакансий.
     Определяет интерфейс для получения вакансий с различных платформ.
+
+    Все запросы реализаций должны проходить через планировщик
+    (метод _schedule), общий для всех клиентов по умолчанию.
     """
 
+    scheduler: Optional[RequestScheduler] = None
+    priority: Optional[int] = None
+
+    def _schedule(self, endpoint: str) -> RequestSlot:
+        """
+        Дождаться разрешения планировщика на запрос к эндпоинту.
+
+        Args:
+            endpoint (str): Имя эндпоинта
+
+        Returns:
+            RequestSlot: Контекстный менеджер, освобождающий место по завершении
+        """
+        if self.scheduler is None:
+            self.scheduler = get_default_scheduler()
+        return self.scheduler.slot(endpoint, self.priority)
+
     @abstractmethod
-    def get_vacancies(self, search_query: str) -> List[Dict[str, Any]]:
+    def get_vacancies(self, search_query: str, **params) -> List[Dict[str, Any]]:
         """
         Получить вакансии по поисковому запросу.
         """
         pass
+
+    def iter_vacancies(self, search_query: str, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Получать вакансии по поисковому запросу по мере их загрузки.
+
+        Реализация по умолчанию отдает результат get_vacancies; клиенты,
+        умеющие загружать выдачу постранично, переопределяют этот метод.
+        """
+        yield from self.get_vacancies(search_query, **params)
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from utils.files import atomic_write
+
+
+class CacheEntry:
+    """
+    Запись кэша ответа API.
+    Хранит данные ответа, время сохранения, TTL и валидаторы для
+    условных запросов (ETag, Last-Modified).
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        stored_at: float,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.data = data
+        self.stored_at = stored_at
+        self.ttl = ttl
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self) -> bool:
+        """Проверить, не истек ли срок жизни записи."""
+        return time.time() - self.stored_at < self.ttl
+
+    def validation_headers(self) -> Dict[str, str]:
+        """Заголовки для условного запроса к API."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразовать запись в словарь для сохранения на диск."""
+        return {
+            "data": self.data,
+            "stored_at": self.stored_at,
+            "ttl": self.ttl,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+
+    @classmethod
+    def from_dict(cls, entry_dict: Dict[str, Any]) -> "CacheEntry":
+        """Восстановить запись из словаря."""
+        return cls(
+            data=entry_dict["data"],
+            stored_at=entry_dict["stored_at"],
+            ttl=entry_dict["ttl"],
+            etag=entry_dict.get("etag"),
+            last_modified=entry_dict.get("last_modified"),
+        )
+
+
+class ResponseCache:
+    """
+    Дисковый кэш ответов API с TTL и вытеснением по LRU.
+    Каждая запись хранится в отдельном файле, ключ строится по URL и
+    параметрам запроса.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".hh_cache",
+        default_ttl: float = 3600,
+        max_entries: int = 1000,
+    ):
+        """
+        Инициализация кэша.
+
+        Args:
+            cache_dir (str): Каталог для файлов кэша
+            default_ttl (float): Срок жизни записи по умолчанию в секундах
+            max_entries (int): Максимальное количество записей в кэше
+        """
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Порядок ключей соответствует давности использования (LRU)
+        self._index: "OrderedDict[str, None]" = OrderedDict()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Построить LRU-индекс по времени изменения файлов кэша."""
+        entries = []
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".json"):
+                path = os.path.join(self.cache_dir, filename)
+                entries.append((os.path.getmtime(path), filename[: -len(".json")]))
+        for _, key in sorted(entries):
+            self._index[key] = None
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу записи."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Построить ключ кэша по URL и параметрам запроса.
+
+        Порядок параметров не влияет на ключ.
+        """
+        canonical = json.dumps(
+            [url, sorted((params or {}).items())], ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Получить запись из кэша (в том числе устаревшую).
+
+        Returns:
+            Optional[CacheEntry]: Запись или None, если ее нет
+        """
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    entry = CacheEntry.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError):
+                self._remove(key)
+                return None
+            self._index.move_to_end(key)
+            try:
+                os.utime(self._path(key))
+            except OSError:
+                pass
+            return entry
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        """
+        Сохранить ответ в кэш, вытесняя давно неиспользуемые записи.
+
+        Returns:
+            CacheEntry: Сохраненная запись
+        """
+        entry = CacheEntry(
+            data=data,
+            stored_at=time.time(),
+            ttl=self.default_ttl if ttl is None else ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        with self._lock:
+            self._write(key, entry)
+            self._index[key] = None
+            self._index.move_to_end(key)
+            while len(self._index) > self.max_entries:
+                oldest_key = next(iter(self._index))
+                self._remove(oldest_key)
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, ttl: Optional[float] = None):
+        """Продлить срок жизни записи после ответа 304 Not Modified."""
+        self.set(key, entry.data, ttl, entry.etag, entry.last_modified)
+
+    def clear(self):
+        """Удалить все записи кэша."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _write(self, key: str, entry: CacheEntry):
+        """Атомарно записать файл записи."""
+        # Потерянная при сбое запись кэша просто запрашивается заново
+        atomic_write(
+            self._path(key),
+            lambda f: json.dump(entry.to_dict(), f, ensure_ascii=False),
+            fsync=False,
+        )
+
+    def _remove(self, key: str):
+        """Удалить запись из индекса и с диска."""
+        self._index.pop(key, None)
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,182 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from utils.files import read_json_lines
+from .hh_api import HeadHunterAPI
+
+
+class _TextExtractor(HTMLParser):
+    """Извлечение текста из HTML-описания вакансии."""
+
+    BLOCK_TAGS = {"p", "br", "li", "ul", "ol", "div", "h1", "h2", "h3", "h4"}
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Преобразовать HTML-описание вакансии в обычный текст.
+
+    Args:
+        html (str): Описание в формате HTML
+
+    Returns:
+        str: Текст без тегов
+    """
+    extractor = _TextExtractor()
+    extractor.feed(html or "")
+    extractor.close()
+    lines = (" ".join(line.split()) for line in "".join(extractor.parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+class DetailStore:
+    """
+    Локальное хранилище подробностей вакансий.
+    Подробности записываются в файл JSON Lines по одной вакансии на строку
+    сразу после загрузки, поэтому прерванный проход можно продолжить.
+    """
+
+    def __init__(self, filename: str = "vacancy_details.jsonl"):
+        """
+        Инициализация хранилища.
+
+        Args:
+            filename (str): Имя файла с подробностями вакансий
+        """
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._details: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        """Загрузить ранее сохраненные подробности."""
+        for details in read_json_lines(self.filename):
+            self._details[str(details["id"])] = details
+
+    def __contains__(self, vacancy_id: Any) -> bool:
+        return str(vacancy_id) in self._details
+
+    def __len__(self) -> int:
+        return len(self._details)
+
+    def get(self, vacancy_id: Any) -> Optional[Dict[str, Any]]:
+        """Получить подробности вакансии или None, если их нет."""
+        return self._details.get(str(vacancy_id))
+
+    def add(self, details: Dict[str, Any]):
+        """Сохранить подробности вакансии (в память и в конец файла)."""
+        line = json.dumps(details, ensure_ascii=False)
+        with self._lock:
+            self._details[str(details["id"])] = details
+            with open(self.filename, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class VacancyEnricher:
+    """
+    Дополнение вакансий из поисковой выдачи подробностями с /vacancies/{id}:
+    полным описанием, ключевыми навыками и требуемым опытом.
+    Подробности загружаются параллельно, уже загруженные вакансии
+    повторно не запрашиваются.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        store: Optional[DetailStore] = None,
+        max_workers: int = 8,
+    ):
+        """
+        Инициализация.
+
+        Args:
+            api (HeadHunterAPI): Клиент hh.ru
+            store (Optional[DetailStore]): Хранилище подробностей
+            max_workers (int): Число одновременно загружаемых вакансий
+        """
+        self.api = api
+        self.store = store if store is not None else DetailStore()
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _extract(vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        """Выбрать нужные поля из подробного ответа hh.ru."""
+        return {
+            "id": str(vacancy["id"]),
+            "description": html_to_text(vacancy.get("description", "")),
+            "key_skills": [
+                skill["name"]
+                for skill in vacancy.get("key_skills") or []
+                if skill.get("name")
+            ],
+            "experience": (vacancy.get("experience") or {}).get("name", ""),
+        }
+
+    def _fetch_one(self, vacancy_id: str) -> Optional[Dict[str, Any]]:
+        """Загрузить и сохранить подробности одной вакансии."""
+        vacancy = self.api.get_vacancy(vacancy_id)
+        if vacancy is None:
+            return None
+        details = self._extract(vacancy)
+        self.store.add(details)
+        return details
+
+    def fetch_details(self, vacancy_ids: Iterable[Any]) -> int:
+        """
+        Загрузить подробности вакансий, которых еще нет в хранилище.
+
+        Args:
+            vacancy_ids (Iterable[Any]): Идентификаторы вакансий hh.ru
+
+        Returns:
+            int: Количество загруженных вакансий
+        """
+        missing = []
+        queued = set()
+        for vacancy_id in vacancy_ids:
+            vacancy_id = str(vacancy_id)
+            if vacancy_id not in self.store and vacancy_id not in queued:
+                queued.add(vacancy_id)
+                missing.append(vacancy_id)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self._fetch_one, missing)
+            return sum(1 for details in results if details is not None)
+
+    def enrich(self, vacancies: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Дополнить вакансии из выдачи подробностями.
+
+        Недостающие подробности сначала загружаются, затем к каждой вакансии
+        добавляются поля description, key_skills и experience.
+
+        Args:
+            vacancies (List[Dict[str, Any]]): Вакансии в формате поисковой выдачи
+
+        Yields:
+            Dict[str, Any]: Вакансия с подробностями (если их удалось получить)
+        """
+        self.fetch_details(v["id"] for v in vacancies if v.get("id"))
+        for vacancy in vacancies:
+            details = self.store.get(vacancy.get("id"))
+            if details is None:
+                yield vacancy
+            else:
+                yield {
+                    **vacancy,
+                    "description": details["description"],
+                    "key_skills": details["key_skills"],
+                    "experience": details["experience"],
+                }
@@ -0,0 +1,95 @@
+import json
+import time
+from typing import Dict
+from models.salary import RUB_CURRENCY
+from utils.files import atomic_write
+from .hh_api import HeadHunterAPI
+
+
+class ExchangeRates:
+    """
+    Курсы валют из справочника hh.ru (/dictionaries).
+    Курсы хранятся в локальном файле и запрашиваются у hh.ru не чаще,
+    чем раз в refresh_interval. Если обновить курсы не удалось, используются
+    последние сохраненные.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        filename: str = "currency_rates.json",
+        refresh_interval: float = 24 * 3600,
+    ):
+        """
+        Инициализация.
+
+        Args:
+            api (HeadHunterAPI): Клиент hh.ru
+            filename (str): Имя файла с сохраненными курсами
+            refresh_interval (float): Через сколько секунд курсы обновляются
+        """
+        self.api = api
+        self.filename = filename
+        self.refresh_interval = refresh_interval
+        self._rates: Dict[str, float] = {}
+        self._fetched_at = 0.0
+        self._load()
+
+    def _load(self):
+        """Загрузить сохраненные курсы."""
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._rates = dict(data["rates"])
+            self._fetched_at = float(data["fetched_at"])
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            pass
+
+    def _save(self):
+        """Атомарно сохранить курсы в файл."""
+        data = {"fetched_at": self._fetched_at, "rates": self._rates}
+        atomic_write(
+            self.filename,
+            lambda f: json.dump(data, f, ensure_ascii=False, indent=2),
+        )
+
+    @property
+    def is_fresh(self) -> bool:
+        """Не истек ли срок обновления курсов."""
+        return bool(self._rates) and (
+            time.time() - self._fetched_at < self.refresh_interval
+        )
+
+    def refresh(self) -> bool:
+        """
+        Запросить курсы у hh.ru и сохранить их.
+
+        Returns:
+            bool: True, если курсы обновлены
+        """
+        dictionaries = self.api.get_dictionaries()
+        if not dictionaries:
+            return False
+        rates = {
+            currency["code"]: float(currency["rate"])
+            for currency in dictionaries.get("currency", [])
+            if currency.get("code") and currency.get("rate")
+        }
+        if not rates:
+            return False
+        self._rates = rates
+        self._fetched_at = time.time()
+        self._save()
+        return True
+
+    def get(self) -> Dict[str, float]:
+        """
+        Получить курсы валют, при необходимости обновив их.
+
+        Returns:
+            Dict[str, float]: Код валюты → сколько единиц валюты стоит
+                один рубль
+        """
+        if not self.is_fresh and not self.refresh() and not self._rates:
+            print("Не удалось получить курсы валют, зарплаты не пересчитываются")
+        return {RUB_CURRENCY: 1.0, **self._rates}
@@ -1,6 +1,28 @@
+import copy
+import random
+import time
 import requests
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from urllib.parse import urlsplit
 from .base_api import BaseAPI
+from .cache import ResponseCache
+from .metrics import (
+    MetricsRegistry,
+    SIZE_BUCKETS,
+    TimedHTTPAdapter,
+    connect_timer,
+    get_default_registry,
+)
+from .rate_limiter import RequestScheduler
+
+# Коды ответа, после которых запрос имеет смысл повторить
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Сколько идентификаторов работодателей передавать в одном запросе
+MAX_EMPLOYERS_PER_REQUEST = 20
 
 
 class HeadHunterAPI(BaseAPI):
@@ -9,36 +31,541 @@ class HeadHunterAPI(BaseAPI):
     Реализует получение вакансий с платформы hh.ru.
     """
 
-    def __init__(self):
-        self.base_url = "https://api.hh.ru/vacancies"
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_page: int = 100,
+        pool_size: int = 10,
+        timeout: Tuple[float, float] = (3.05, 15.0),
+        max_retries: int = 4,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        priority: Optional[int] = None,
+        prefetch_pages: int = 2,
+        api_url: str = "https://api.hh.ru",
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Инициализация клиента hh.ru.
+
+        Args:
+            max_workers (int): Максимальное число страниц, загружаемых параллельно
+            per_page (int): Количество вакансий на одной странице выдачи
+            pool_size (int): Размер пула keep-alive соединений
+            timeout (Tuple[float, float]): Таймауты (подключение, чтение) в секундах
+            max_retries (int): Количество повторов при 429/5xx и сетевых ошибках
+            backoff_factor (float): Базовая задержка экспоненциального отката
+            backoff_max (float): Максимальная задержка между повторами
+            cache (Optional[ResponseCache]): Кэш ответов. Если не задан,
+                каждый запрос выполняется к API
+            scheduler (Optional[RequestScheduler]): Планировщик запросов.
+                По умолчанию используется общий для всех клиентов
+            priority (Optional[int]): Приоритет запросов этого клиента
+            prefetch_pages (int): Сколько следующих страниц загружать заранее
+                при потоковом получении вакансий (iter_vacancies)
+            api_url (str): Адрес API (например, локальной заглушки для тестов)
+            metrics (Optional[MetricsRegistry]): Реестр метрик запросов.
+                По умолчанию используется общий для процесса
+        """
+        self.api_url = api_url.rstrip("/")
+        self.base_url = f"{self.api_url}/vacancies"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        self.max_workers = max_workers
+        self.per_page = per_page
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.pool_size = pool_size
+        self.cache = cache
+        self.scheduler = scheduler
+        self.priority = priority
+        self.prefetch_pages = prefetch_pages
+        self.metrics = metrics or get_default_registry()
+        self._init_metrics()
+        self.session = self._create_session(pool_size)
+
+    def _init_metrics(self):
+        """Зарегистрировать метрики запросов к API."""
+        self._requests_total = self.metrics.counter(
+            "hh_requests_total", "Запросы к API hh.ru по кодам ответа"
+        )
+        self._retries_total = self.metrics.counter(
+            "hh_retries_total", "Повторные попытки запросов к API hh.ru"
+        )
+        self._cache_total = self.metrics.counter(
+            "hh_cache_requests_total", "Обращения к кэшу ответов (hit/miss/revalidated)"
+        )
+        self._duration = self.metrics.histogram(
+            "hh_request_phase_seconds",
+            "Длительность фаз запроса: queue, connect, ttfb, download, decode, total",
+        )
+        self._response_bytes = self.metrics.histogram(
+            "hh_response_bytes", "Размер тела ответа API hh.ru", buckets=SIZE_BUCKETS
+        )
+
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """Создать долгоживущую сессию с пулом соединений."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        # Повторы выполняются в _request, адаптер их не делает
+        adapter = TimedHTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
-    def get_vacancies(self, search_query: str) -> List[Dict[str, Any]]:
+    def close(self):
+        """Закрыть сессию и освободить соединения."""
+        self.session.close()
+
+    def with_priority(self, priority: int) -> "HeadHunterAPI":
         """
-        Получить вакансии с hh.ru по поисковому запросу.
+        Получить копию клиента с другим приоритетом запросов.
+
+        Копия использует ту же сессию, кэш и планировщик.
+        """
+        api = copy.copy(self)
+        api.priority = priority
+        return api
+
+    def _retry_delay(
+        self, attempt: int, response: Optional[requests.Response]
+    ) -> float:
+        """
+        Вычислить задержку перед повтором.
+
+        Учитывает заголовок Retry-After, иначе использует экспоненциальный
+        откат с полным джиттером.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.backoff_max)
+                except ValueError:
+                    try:
+                        retry_at = parsedate_to_datetime(retry_after).timestamp()
+                        return min(max(retry_at - time.time(), 0.0), self.backoff_max)
+                    except (TypeError, ValueError):
+                        pass
+
+        ceiling = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _cache_ttl(response: requests.Response) -> Optional[float]:
+        """Срок жизни ответа из заголовка Cache-Control (max-age)."""
+        cache_control = response.headers.get("Cache-Control", "")
+        for directive in cache_control.split(","):
+            name, _, value = directive.strip().partition("=")
+            if name.lower() == "max-age" and value.isdigit():
+                return float(value)
+        return None
+
+    def _request(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Выполнить GET-запрос с повторами при временных ошибках.
+
+        Если подключен кэш, свежие записи возвращаются без обращения к API,
+        а устаревшие перепроверяются условным запросом (ETag/Last-Modified).
+
+        Returns:
+            Optional[Dict[str, Any]]: Ответ API или None при ошибке
+        """
+        cache_key = None
+        cached = None
+        headers = {}
+        if self.cache is not None:
+            cache_key = self.cache.make_key(url, params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if cached.is_fresh():
+                    self._cache_total.inc(result="hit")
+                    return cached.data
+                headers = cached.validation_headers()
+
+        endpoint = urlsplit(url).path.strip("/").split("/")[0]
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self._retries_total.inc(endpoint=endpoint)
+            response = None
+            try:
+                queued_at = time.perf_counter()
+                with self._schedule(endpoint) as slot:
+                    connect_timer.reset()
+                    started = time.perf_counter()
+                    response = self.session.get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=self.timeout,
+                        stream=True,
+                    )
+                    headers_at = time.perf_counter()
+                    body = response.content
+                    finished = time.perf_counter()
+                    slot.status_code = response.status_code
+
+                self._observe(endpoint, "queue", started - queued_at)
+                self._observe(endpoint, "connect", connect_timer.elapsed)
+                self._observe(
+                    endpoint, "ttfb", headers_at - started - connect_timer.elapsed
+                )
+                self._observe(endpoint, "download", finished - headers_at)
+                self._observe(endpoint, "total", finished - started)
+                self._response_bytes.observe(len(body), endpoint=endpoint)
+                self._requests_total.inc(
+                    endpoint=endpoint, status=response.status_code
+                )
+
+                if response.status_code == 304 and cached is not None:
+                    self._cache_total.inc(result="revalidated")
+                    self.cache.refresh(cache_key, cached, self._cache_ttl(response))
+                    return cached.data
+                if response.status_code == 200:
+                    decode_started = time.perf_counter()
+                    data = response.json()
+                    self._observe(
+                        endpoint, "decode", time.perf_counter() - decode_started
+                    )
+                    if self.cache is not None:
+                        self._cache_total.inc(result="miss")
+                        self.cache.set(
+                            cache_key,
+                            data,
+                            ttl=self._cache_ttl(response),
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+                    return data
+                if response.status_code not in RETRY_STATUS_CODES:
+                    print(f"Ошибка при получении вакансий: {response.status_code}")
+                    return None
+                error = f"код ответа {response.status_code}"
+
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._requests_total.inc(endpoint=endpoint, status="error")
+                error = str(e)
+            except requests.RequestException as e:
+                self._requests_total.inc(endpoint=endpoint, status="error")
+                print(f"Ошибка сети при получении вакансий: {e}")
+                return None
+            except Exception as e:
+                print(f"Неожиданная ошибка: {e}")
+                return None
+
+            if attempt < self.max_retries:
+                time.sleep(self._retry_delay(attempt, response))
+
+        print(f"Ошибка при получении вакансий ({self.max_retries} повторов): {error}")
+        return None
+
+    def _observe(self, endpoint: str, phase: str, seconds: float):
+        """Записать длительность фазы запроса."""
+        self._duration.observe(max(seconds, 0.0), endpoint=endpoint, phase=phase)
+
+    def _build_params(self, search_query: str, page: int, **params) -> Dict[str, Any]:
         """
-        params = {
+        Сформировать параметры запроса для страницы выдачи.
+
+        Дополнительные параметры hh.ru (например, area) переопределяют
+        значения по умолчанию.
+        """
+        request_params = {
             "text": search_query,
             "area": 113,  # Россия
-            "per_page": 100,
-            "page": 0,
+            "per_page": self.per_page,
         }
+        request_params.update(params)
+        request_params["page"] = page
+        return request_params
+
+    def _fetch_page(
+        self, search_query: str, page: int, **params
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Загрузить одну страницу выдачи.
+
+        Returns:
+            Optional[Dict[str, Any]]: Ответ API или None при ошибке
+        """
+        return self._request(
+            self.base_url, self._build_params(search_query, page, **params)
+        )
+
+    def iter_vacancies(self, search_query: str, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Получать вакансии с hh.ru по мере загрузки страниц.
+
+        Пока потребитель обрабатывает текущую страницу, следующие
+        prefetch_pages страниц загружаются в фоне. Порядок страниц сохраняется.
 
+        Args:
+            search_query (str): Поисковый запрос
+            **params: Дополнительные параметры поиска hh.ru
+
+        Yields:
+            Dict[str, Any]: Вакансия в формате hh.ru
+        """
+        first_page = self._fetch_page(search_query, 0, **params)
+        if first_page is None:
+            return
+
+        pages = first_page.get("pages", 1)
+        executor = ThreadPoolExecutor(max_workers=max(1, self.prefetch_pages))
+        futures = deque()
+        next_page = 1
         try:
-            response = requests.get(self.base_url, params=params, headers=self.headers)
+            while next_page < pages and len(futures) < self.prefetch_pages:
+                futures.append(
+                    executor.submit(self._fetch_page, search_query, next_page, **params)
+                )
+                next_page += 1
 
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("items", [])
-            else:
-                print(f"Ошибка при получении вакансий: {response.status_code}")
-                return []
+            yield from first_page.get("items", [])
 
-        except requests.RequestException as e:
-            print(f"Ошибка сети при получении вакансий: {e}")
-            return []
-        except Exception as e:
-            print(f"Неожиданная ошибка: {e}")
+            while futures:
+                page_data = futures.popleft().result()
+                if next_page < pages:
+                    futures.append(
+                        executor.submit(
+                            self._fetch_page, search_query, next_page, **params
+                        )
+                    )
+                    next_page += 1
+                if page_data is not None:
+                    yield from page_data.get("items", [])
+        finally:
+            # Если потребитель прервал обход, незапущенные загрузки отменяются
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def count_vacancies(self, search_query: str, **params) -> Optional[int]:
+        """
+        Узнать общее число вакансий по запросу (поле "found").
+
+        Returns:
+            Optional[int]: Количество вакансий или None при ошибке
+        """
+        params["per_page"] = 1
+        page_data = self._fetch_page(search_query, 0, **params)
+        if page_data is None:
+            return None
+        return page_data.get("found", 0)
+
+    def get_vacancy(self, vacancy_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Получить подробное описание вакансии (/vacancies/{id}).
+
+        Returns:
+            Optional[Dict[str, Any]]: Вакансия или None при ошибке
+        """
+        return self._request(f"{self.base_url}/{vacancy_id}", {})
+
+    def get_dictionaries(self) -> Optional[Dict[str, Any]]:
+        """
+        Получить справочники hh.ru (/dictionaries), в том числе курсы валют.
+
+        Returns:
+            Optional[Dict[str, Any]]: Справочники или None при ошибке
+        """
+        return self._request(f"{self.api_url}/dictionaries", {})
+
+    def get_area_children(self, area_id: Any) -> List[Dict[str, Any]]:
+        """
+        Получить дочерние регионы из справочника регионов hh.ru.
+
+        Args:
+            area_id (Any): Идентификатор региона
+
+        Returns:
+            List[Dict[str, Any]]: Дочерние регионы (пустой список для города)
+        """
+        area = self._request(f"{self.api_url}/areas/{area_id}", {})
+        if area is None:
             return []
+        return area.get("areas", [])
+
+    def get_vacancies(self, search_query: str, **params) -> List[Dict[str, Any]]:
+        """
+        Получить вакансии с hh.ru по поисковому запросу.
+
+        Первая страница определяет общее количество страниц (поле "pages"),
+        остальные загружаются параллельно и объединяются в порядке страниц.
+        """
+        return self.fetch_vacancies(search_query, **params)[0]
+
+    def fetch_vacancies(
+        self, search_query: str, **params
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Получить вакансии по запросу вместе с признаком полноты выдачи.
+
+        Выдача неполная, если какая-либо страница не загрузилась после всех
+        повторов или найдено больше вакансий, чем доступно постранично.
+
+        Args:
+            search_query (str): Поисковый запрос
+            **params: Дополнительные параметры поиска hh.ru
+
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Полученные вакансии и True,
+                если получены все найденные вакансии
+        """
+        first_page = self._fetch_page(search_query, 0, **params)
+        if first_page is None:
+            return [], False
+        return self._collect_pages(first_page, search_query, **params)
+
+    def _collect_pages(
+        self, first_page: Dict[str, Any], search_query: str, **params
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Догрузить остальные страницы выдачи параллельно.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Вакансии в порядке страниц
+                и признак полноты выдачи (см. fetch_vacancies)
+        """
+        pages = first_page.get("pages", 1)
+        rest: List[Optional[Dict[str, Any]]] = []
+        if pages > 1:
+            # executor.map сохраняет порядок страниц независимо от порядка ответов
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                rest = list(
+                    executor.map(
+                        lambda page: self._fetch_page(search_query, page, **params),
+                        range(1, pages),
+                    )
+                )
+
+        vacancies = list(first_page.get("items", []))
+        for page_data in rest:
+            if page_data is not None:
+                vacancies.extend(page_data.get("items", []))
+        complete = None not in rest and not is_truncated(first_page)
+        return vacancies, complete
+
+    def fetch_vacancies_by_employers(
+        self, employer_ids: List[int], search_query: str = "", **params
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], List[int]]:
+        """
+        Получить вакансии нескольких работодателей по их идентификаторам hh.ru.
+
+        В одном запросе передается до MAX_EMPLOYERS_PER_REQUEST значений
+        employer_id, результат раскладывается по работодателям. Если выдача
+        по группе работодателей упирается в ограничение глубины поиска,
+        группа делится пополам. Работодатель, чья выдача сама больше глубины
+        поиска, возвращается в списке неполных сразу после первой страницы,
+        без загрузки остальных — его вакансии нужно получать через
+        QueryPlanner.
+
+        Args:
+            employer_ids (List[int]): Идентификаторы работодателей на hh.ru
+            search_query (str): Дополнительный текстовый фильтр
+            **params: Дополнительные параметры поиска hh.ru
+
+        Returns:
+            Tuple[Dict[int, List[Dict[str, Any]]], List[int]]: Вакансии по
+                каждому работодателю и работодатели, чья выдача получена
+                не полностью
+        """
+        vacancies = []
+        incomplete = []
+        for start in range(0, len(employer_ids), MAX_EMPLOYERS_PER_REQUEST):
+            chunk = employer_ids[start:start + MAX_EMPLOYERS_PER_REQUEST]
+            chunk_vacancies, chunk_incomplete = self._get_employers_chunk(
+                chunk, search_query, **params
+            )
+            vacancies.extend(chunk_vacancies)
+            incomplete.extend(chunk_incomplete)
+        return group_by_employer(vacancies, employer_ids), incomplete
+
+    def get_vacancies_by_employers(
+        self, employer_ids: List[int], search_query: str = "", **params
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Получить вакансии нескольких работодателей по их идентификаторам hh.ru.
+
+        То же, что fetch_vacancies_by_employers, без списка неполных выдач.
+
+        Returns:
+            Dict[int, List[Dict[str, Any]]]: Вакансии по каждому работодателю
+        """
+        grouped, _ = self.fetch_vacancies_by_employers(
+            employer_ids, search_query, **params
+        )
+        return grouped
+
+    def _get_employers_chunk(
+        self, employer_ids: List[int], search_query: str, **params
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        Загрузить вакансии группы работодателей одним запросом.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[int]]: Вакансии и работодатели,
+                чья выдача получена не полностью
+        """
+        first_page = self._fetch_page(
+            search_query, 0, employer_id=employer_ids, **params
+        )
+        if first_page is None:
+            return [], list(employer_ids)
+        if is_truncated(first_page):
+            if len(employer_ids) == 1:
+                return list(first_page.get("items", [])), list(employer_ids)
+            middle = len(employer_ids) // 2
+            first_half = self._get_employers_chunk(
+                employer_ids[:middle], search_query, **params
+            )
+            second_half = self._get_employers_chunk(
+                employer_ids[middle:], search_query, **params
+            )
+            return first_half[0] + second_half[0], first_half[1] + second_half[1]
+        vacancies, complete = self._collect_pages(
+            first_page, search_query, employer_id=employer_ids, **params
+        )
+        return vacancies, [] if complete else list(employer_ids)
+
+
+def is_truncated(first_page: Dict[str, Any]) -> bool:
+    """
+    Проверить, упирается ли выдача в ограничение глубины поиска hh.ru.
+
+    Args:
+        first_page (Dict[str, Any]): Первая страница выдачи
+
+    Returns:
+        bool: True, если постраничный обход не покроет все найденные вакансии
+    """
+    return first_page.get("found", 0) > first_page.get("pages", 1) * first_page.get(
+        "per_page", len(first_page.get("items", []))
+    )
+
+
+def group_by_employer(
+    vacancies: List[Dict[str, Any]], employer_ids: List[int]
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Разложить вакансии по работодателям.
+
+    Args:
+        vacancies (List[Dict[str, Any]]): Вакансии в формате hh.ru
+        employer_ids (List[int]): Идентификаторы работодателей
+
+    Returns:
+        Dict[int, List[Dict[str, Any]]]: Вакансии по каждому работодателю
+    """
+    grouped = {employer_id: [] for employer_id in employer_ids}
+    by_key = {str(employer_id): employer_id for employer_id in employer_ids}
+    for vacancy in vacancies:
+        employer_id = by_key.get(str((vacancy.get("employer") or {}).get("id")))
+        if employer_id is not None:
+            grouped[employer_id].append(vacancy)
+    return grouped
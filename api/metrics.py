@@ -0,0 +1,253 @@
+import bisect
+import json
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Границы корзин гистограмм по умолчанию
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    """Преобразовать метки в неизменяемый ключ."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Dict[str, str]] = None) -> str:
+    """Сформировать метки в формате Prometheus."""
+    pairs = list(key) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    formatted = (f'{name}="{_escape(value)}"' for name, value in pairs)
+    return "{" + ",".join(formatted) + "}"
+
+
+def _escape(value: str) -> str:
+    """Экранировать значение метки для формата Prometheus."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    """Счетчик, значение которого только увеличивается."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """Увеличить счетчик для набора меток."""
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """Текущее значение счетчика для набора меток."""
+        return self._values.get(_label_key(labels), 0)
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {"labels": dict(key), "value": value}
+                for key, value in self._values.items()
+            ]
+
+    def to_prometheus(self) -> List[str]:
+        with self._lock:
+            return [
+                f"{self.name}{_format_labels(key)} {value}"
+                for key, value in self._values.items()
+            ]
+
+
+class Histogram:
+    """Гистограмма значений с фиксированными границами корзин."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """Добавить наблюдение для набора меток."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0}
+                self._series[key] = series
+            series["counts"][bisect.bisect_left(self.buckets, value)] += 1
+            series["sum"] += value
+
+    def count(self, **labels) -> int:
+        """Количество наблюдений для набора меток."""
+        series = self._series.get(_label_key(labels))
+        return sum(series["counts"]) if series else 0
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            bounds = [str(b) for b in self.buckets] + ["+Inf"]
+            return [
+                {
+                    "labels": dict(key),
+                    "buckets": dict(zip(bounds, series["counts"])),
+                    "sum": series["sum"],
+                    "count": sum(series["counts"]),
+                }
+                for key, series in self._series.items()
+            ]
+
+    def to_prometheus(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, series in self._series.items():
+                cumulative = 0
+                bounds = [str(b) for b in self.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, series["counts"]):
+                    cumulative += count
+                    lines.append(
+                        f"{self.name}_bucket{_format_labels(key, {'le': bound})} "
+                        f"{cumulative}"
+                    )
+                lines.append(f"{self.name}_sum{_format_labels(key)} {series['sum']}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик процесса.
+    Хранит счетчики и гистограммы и выгружает их в JSON или в текстовом
+    формате Prometheus.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, description: str, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, description, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Метрика {name} уже зарегистрирована с другим типом")
+            return metric
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Получить (или создать) счетчик."""
+        return self._get_or_create(Counter, name, description)
+
+    def histogram(
+        self, name: str, description: str = "", buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        """Получить (или создать) гистограмму."""
+        return self._get_or_create(Histogram, name, description, buckets=buckets)
+
+    def to_json(self) -> str:
+        """Выгрузить все метрики в JSON."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return json.dumps(
+            {
+                metric.name: {
+                    "type": metric.kind,
+                    "help": metric.description,
+                    "series": metric.to_dict(),
+                }
+                for metric in metrics
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    def to_prometheus(self) -> str:
+        """Выгрузить все метрики в текстовом формате Prometheus."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.to_prometheus())
+        return "\n".join(lines) + "\n"
+
+
+_default_registry: Optional[MetricsRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> MetricsRegistry:
+    """Получить общий для процесса реестр метрик."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = MetricsRegistry()
+        return _default_registry
+
+
+class _ConnectTimer(threading.local):
+    """Время установки соединений в текущем потоке (DNS, TCP и TLS)."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    def reset(self):
+        self.elapsed = 0.0
+
+
+connect_timer = _ConnectTimer()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.elapsed += time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.elapsed += time.perf_counter() - started
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    Адаптер requests, замеряющий время установки новых соединений.
+    Замер накапливается в connect_timer потока, выполнившего запрос.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
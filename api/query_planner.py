@@ -0,0 +1,262 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from .hh_api import HeadHunterAPI
+
+# hh.ru отдает не больше 2000 вакансий на один поисковый запрос
+MAX_SEARCH_DEPTH = 2000
+
+# Поиск hh.ru по умолчанию охватывает вакансии за последние 30 дней
+SEARCH_PERIOD = timedelta(days=30)
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+class QueryPlanner:
+    """
+    Планировщик поисковых запросов к hh.ru.
+    Если запрос находит больше вакансий, чем доступно для постраничного
+    обхода, он рекурсивно разбивается на непересекающиеся подзапросы
+    по регионам, а затем по окну дат публикации. Подзапросы выполняются
+    параллельно, результаты объединяются без дубликатов.
+
+    Если дочерние регионы вместе находят меньше вакансий, чем регион-родитель
+    (часть вакансий привязана непосредственно к нему), родитель делится
+    не по регионам, а по окну дат, чтобы эти вакансии не потерялись.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        max_depth: int = MAX_SEARCH_DEPTH,
+        max_workers: int = 8,
+        min_window: timedelta = timedelta(minutes=10),
+    ):
+        """
+        Инициализация планировщика.
+
+        Args:
+            api (HeadHunterAPI): Клиент hh.ru
+            max_depth (int): Максимальное число вакансий, доступное в одном запросе
+            max_workers (int): Число подзапросов, выполняемых параллельно
+            min_window (timedelta): Минимальное окно дат, дальше которого
+                запрос не делится
+        """
+        self.api = api
+        self.max_depth = max_depth
+        self.max_workers = max_workers
+        self.min_window = min_window
+
+    def _split(
+        self, search_query: str, params: Dict[str, Any], found: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Разбить параметры запроса на непересекающиеся части.
+
+        Запрос по нескольким работодателям сначала делится на группы
+        работодателей, затем по дочерним регионам, затем (для регионов
+        без дочерних и регионов с вакансиями вне дочерних) пополам
+        по окну дат публикации.
+
+        Args:
+            search_query (str): Поисковый запрос
+            params (Dict[str, Any]): Параметры запроса
+            found (int): Число вакансий, найденных запросом
+
+        Returns:
+            List[Dict[str, Any]]: Параметры подзапросов или пустой список,
+                если запрос делить дальше нельзя
+        """
+        params = {key: value for key, value in params.items() if key != "_found"}
+        employer_ids = params.get("employer_id")
+        if isinstance(employer_ids, list) and len(employer_ids) > 1:
+            middle = len(employer_ids) // 2
+            return [
+                {**params, "employer_id": employer_ids[:middle]},
+                {**params, "employer_id": employer_ids[middle:]},
+            ]
+
+        if not params.get("_area_is_leaf"):
+            children = self.api.get_area_children(params.get("area", 113))
+            if children:
+                parts = [{**params, "area": child["id"]} for child in children]
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    counts = list(
+                        executor.map(lambda p: self._count(search_query, p), parts)
+                    )
+                # Найденное число запоминается, чтобы не считать подзапрос снова
+                if None not in counts and sum(counts) >= found:
+                    return [
+                        {**part, "_found": count} for part, count in zip(parts, counts)
+                    ]
+            params = {**params, "_area_is_leaf": True}
+
+        date_to = (
+            datetime.strptime(params["date_to"], DATE_FORMAT)
+            if "date_to" in params
+            else datetime.now(timezone.utc).replace(microsecond=0)
+        )
+        date_from = (
+            datetime.strptime(params["date_from"], DATE_FORMAT)
+            if "date_from" in params
+            else date_to - SEARCH_PERIOD
+        )
+        if date_to - date_from <= self.min_window:
+            return []
+
+        middle = date_from + (date_to - date_from) / 2
+        middle = middle.replace(microsecond=0)
+        return [
+            {
+                **params,
+                "date_from": date_from.strftime(DATE_FORMAT),
+                "date_to": middle.strftime(DATE_FORMAT),
+            },
+            {
+                **params,
+                "date_from": (middle + timedelta(seconds=1)).strftime(DATE_FORMAT),
+                "date_to": date_to.strftime(DATE_FORMAT),
+            },
+        ]
+
+    def _count(self, search_query: str, params: Dict[str, Any]) -> Optional[int]:
+        """Узнать число вакансий для подзапроса (если оно еще не известно)."""
+        if "_found" in params:
+            return params["_found"]
+        return self.api.count_vacancies(search_query, **_public(params))
+
+    def plan(self, search_query: str, **params) -> List[Dict[str, Any]]:
+        """
+        Построить список подзапросов, каждый из которых можно обойти целиком.
+
+        Подсчет вакансий для подзапросов одного уровня выполняется параллельно.
+
+        Args:
+            search_query (str): Поисковый запрос
+            **params: Дополнительные параметры поиска hh.ru
+
+        Returns:
+            List[Dict[str, Any]]: Параметры подзапросов
+        """
+        return self._plan(search_query, params)[0]
+
+    def _plan(
+        self, search_query: str, params: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Построить подзапросы и определить, покрывают ли они всю выдачу.
+
+        Выдача покрыта не полностью, если подсчет для какого-либо подзапроса
+        не удался или подзапрос не удалось разбить до глубины поиска.
+        """
+        planned = []
+        complete = True
+        frontier = [params]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while frontier:
+                counts = list(
+                    executor.map(lambda p: self._count(search_query, p), frontier)
+                )
+                next_frontier = []
+                for sub_params, found in zip(frontier, counts):
+                    if found is None:
+                        complete = False
+                        continue
+                    if found == 0:
+                        continue
+                    if found <= self.max_depth:
+                        planned.append(_public(sub_params))
+                        continue
+                    parts = self._split(search_query, sub_params, found)
+                    if parts:
+                        next_frontier.extend(parts)
+                    else:
+                        print(
+                            f"Запрос не удалось разбить: доступно {self.max_depth} "
+                            f"из {found} вакансий ({_public(sub_params)})"
+                        )
+                        complete = False
+                        planned.append(_public(sub_params))
+                frontier = next_frontier
+        return planned, complete
+
+    def _iter_results(
+        self, search_query: str, sub_queries: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[List[Dict[str, Any]], bool]]:
+        """Выполнить подзапросы параллельно, отдавая результаты по готовности."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.api.fetch_vacancies, search_query, **sub_params)
+                for sub_params in sub_queries
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def iter_vacancies(self, search_query: str, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Получить все вакансии по запросу, обходя ограничение глубины поиска.
+
+        Подзапросы выполняются параллельно, вакансии отдаются по мере
+        завершения подзапросов, дубликаты (по id) отбрасываются.
+
+        Args:
+            search_query (str): Поисковый запрос
+            **params: Дополнительные параметры поиска hh.ru
+
+        Yields:
+            Dict[str, Any]: Вакансия в формате hh.ru
+        """
+        seen = set()
+        for vacancies, _ in self._iter_results(
+            search_query, self.plan(search_query, **params)
+        ):
+            yield from _unique(vacancies, seen)
+
+    def fetch_vacancies(
+        self, search_query: str, **params
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Получить все вакансии по запросу вместе с признаком полноты выдачи.
+
+        Выдача неполная, если не удалось подсчитать или разбить какой-либо
+        подзапрос либо загрузить какую-либо страницу.
+
+        Args:
+            search_query (str): Поисковый запрос
+            **params: Дополнительные параметры поиска hh.ru
+
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Вакансии без дубликатов и True,
+                если получены все найденные вакансии
+        """
+        sub_queries, complete = self._plan(search_query, params)
+        seen = set()
+        result = []
+        for vacancies, sub_complete in self._iter_results(search_query, sub_queries):
+            result.extend(_unique(vacancies, seen))
+            complete = complete and sub_complete
+        return result, complete
+
+    def get_vacancies(self, search_query: str, **params) -> List[Dict[str, Any]]:
+        """
+        Получить все вакансии по запросу списком.
+        """
+        return list(self.iter_vacancies(search_query, **params))
+
+
+def _unique(
+    vacancies: List[Dict[str, Any]], seen: set
+) -> Iterator[Dict[str, Any]]:
+    """Отбросить вакансии, чей id уже встречался (seen пополняется)."""
+    for vacancy in vacancies:
+        vacancy_id = vacancy.get("id")
+        if vacancy_id in seen:
+            continue
+        if vacancy_id is not None:
+            seen.add(vacancy_id)
+        yield vacancy
+
+
+def _public(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Убрать служебные ключи планировщика из параметров запроса."""
+    return {key: value for key, value in params.items() if not key.startswith("_")}
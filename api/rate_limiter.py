@@ -0,0 +1,175 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Optional
+
+# Приоритеты запросов: меньшее значение обслуживается раньше
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_BULK = 10
+
+
+class RequestSlot:
+    """
+    Разрешение на выполнение одного запроса.
+    Используется как контекстный менеджер; код ответа, записанный
+    в status_code, используется планировщиком для адаптации.
+    """
+
+    def __init__(self, scheduler: "RequestScheduler"):
+        self.scheduler = scheduler
+        self.status_code: Optional[int] = None
+
+    def __enter__(self) -> "RequestSlot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.scheduler.release(self.status_code)
+        return False
+
+
+class RequestScheduler:
+    """
+    Планировщик запросов к API.
+    Ограничивает частоту запросов (token bucket), число одновременных
+    запросов (адаптивно, по схеме AIMD) и обслуживает ожидающие запросы
+    в порядке приоритета.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[int] = None,
+        initial_concurrency: float = 8,
+        min_concurrency: float = 1,
+        max_concurrency: float = 32,
+        decrease_factor: float = 0.5,
+        endpoint_priorities: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Инициализация планировщика.
+
+        Args:
+            rate (float): Максимальное число запросов в секунду
+            burst (Optional[int]): Емкость корзины токенов (по умолчанию равна rate)
+            initial_concurrency (float): Начальный предел одновременных запросов
+            min_concurrency (float): Нижняя граница предела
+            max_concurrency (float): Верхняя граница предела
+            decrease_factor (float): Множитель предела при ответе 429
+            endpoint_priorities (Optional[Dict[str, int]]): Приоритеты по
+                умолчанию для отдельных эндпоинтов
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.concurrency = float(initial_concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.endpoint_priorities = dict(endpoint_priorities or {})
+
+        self._cond = threading.Condition()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._waiters = []
+        self._sequence = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        """Количество выполняемых в данный момент запросов."""
+        return self._in_flight
+
+    def _refill(self):
+        """Пополнить корзину токенов за прошедшее время."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+    def _resolve_priority(self, endpoint: str, priority: Optional[int]) -> int:
+        """Определить приоритет запроса."""
+        if priority is not None:
+            return priority
+        return self.endpoint_priorities.get(endpoint, PRIORITY_DEFAULT)
+
+    def acquire(self, endpoint: str = "", priority: Optional[int] = None):
+        """
+        Дождаться разрешения на выполнение запроса.
+
+        Args:
+            endpoint (str): Имя эндпоинта (для приоритета по умолчанию)
+            priority (Optional[int]): Явный приоритет запроса
+        """
+        ticket = (self._resolve_priority(endpoint, priority), next(self._sequence))
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    timeout = None
+                    if (
+                        self._waiters[0] == ticket
+                        and self._in_flight < max(1, int(self.concurrency))
+                    ):
+                        self._refill()
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            heapq.heappop(self._waiters)
+                            self._in_flight += 1
+                            self._cond.notify_all()
+                            return
+                        timeout = (1 - self._tokens) / self.rate
+                    self._cond.wait(timeout)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+
+    def release(self, status_code: Optional[int] = None):
+        """
+        Освободить место после завершения запроса и адаптировать предел.
+
+        Ответ 429 уменьшает предел одновременных запросов в decrease_factor
+        раз, успешный ответ увеличивает его примерно на единицу за «окно».
+
+        Args:
+            status_code (Optional[int]): Код ответа (None при сетевой ошибке)
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if status_code == 429:
+                self.concurrency = max(
+                    self.min_concurrency, self.concurrency * self.decrease_factor
+                )
+            elif status_code is not None and status_code < 500:
+                self.concurrency = min(
+                    self.max_concurrency, self.concurrency + 1 / self.concurrency
+                )
+            self._cond.notify_all()
+
+    def slot(self, endpoint: str = "", priority: Optional[int] = None) -> RequestSlot:
+        """
+        Получить разрешение на запрос в виде контекстного менеджера.
+
+        Пример:
+            with scheduler.slot("vacancies") as slot:
+                response = session.get(...)
+                slot.status_code = response.status_code
+        """
+        self.acquire(endpoint, priority)
+        return RequestSlot(self)
+
+
+_default_scheduler: Optional[RequestScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler() -> RequestScheduler:
+    """Получить общий для всех клиентов API планировщик запросов."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RequestScheduler()
+        return _default_scheduler
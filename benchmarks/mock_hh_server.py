@@ -0,0 +1,277 @@
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+
+class MockHHConfig:
+    """
+    Сценарий работы заглушки hh.ru.
+    Определяет объем данных, задержки ответов и внедряемые ошибки.
+    """
+
+    def __init__(
+        self,
+        found: int = 5000,
+        max_depth: int = 2000,
+        employer_ids: Optional[List[int]] = None,
+        latency: str = "fixed",
+        latency_ms: float = 0.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        fail_first: int = 0,
+        fail_pages: Optional[List[int]] = None,
+        seed: int = 0,
+    ):
+        """
+        Инициализация сценария.
+
+        Args:
+            found (int): Общее количество вакансий в выдаче
+            max_depth (int): Сколько вакансий можно получить постранично
+            employer_ids (Optional[List[int]]): Работодатели, между которыми
+                вакансии распределяются по кругу
+            latency (str): Распределение задержки: fixed, uniform или lognormal
+            latency_ms (float): Средняя задержка ответа в миллисекундах
+            latency_sigma (float): Параметр разброса для lognormal
+            error_rate (float): Вероятность ответа 503
+            throttle_rate (float): Вероятность ответа 429
+            retry_after (Optional[float]): Значение заголовка Retry-After для 429
+            fail_first (int): Сколько первых запросов завершить ответом 503
+            fail_pages (Optional[List[int]]): Номера страниц выдачи, которые
+                всегда отвечают 503
+            seed (int): Начальное значение генератора случайных чисел
+        """
+        self.found = found
+        self.max_depth = max_depth
+        self.employer_ids = employer_ids or [1740, 3529, 78638]
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.fail_first = fail_first
+        self.fail_pages = set(fail_pages or ())
+        self.seed = seed
+
+
+class MockHHServer:
+    """
+    Локальная заглушка API hh.ru.
+    Поддерживает /vacancies (пагинация, employer_id, ограничение глубины),
+    /vacancies/{id}, /areas/{id} и /dictionaries (курсы валют).
+    Запускается в фоновом потоке.
+
+    Пример:
+        with MockHHServer(MockHHConfig(found=300)) as server:
+            api = HeadHunterAPI(api_url=server.url)
+    """
+
+    def __init__(self, config: Optional[MockHHConfig] = None, port: int = 0):
+        """
+        Инициализация заглушки.
+
+        Args:
+            config (Optional[MockHHConfig]): Сценарий работы
+            port (int): Порт (0 — выбрать свободный)
+        """
+        self.config = config or MockHHConfig()
+        self.request_count = 0
+        self.status_counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._now = datetime.now(timezone.utc).replace(microsecond=0)
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Адрес заглушки для HeadHunterAPI(api_url=...)."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockHHServer":
+        """Запустить заглушку в фоновом потоке."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Остановить заглушку."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockHHServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def _vacancy(self, index: int) -> Dict[str, Any]:
+        """Сгенерировать вакансию по порядковому номеру."""
+        employer_id = self.config.employer_ids[index % len(self.config.employer_ids)]
+        published_at = self._now - timedelta(minutes=index)
+        salary_from = 50000 + (index * 7919) % 250000
+        return {
+            "id": str(index + 1),
+            "name": f"Python Developer {index + 1}",
+            "alternate_url": f"https://hh.ru/vacancy/{index + 1}",
+            "salary": (
+                None
+                if index % 5 == 0
+                else {
+                    "from": salary_from,
+                    "to": salary_from + 50000,
+                    "currency": "RUR",
+                    "gross": False,
+                }
+            ),
+            "snippet": {"requirement": f"Опыт работы с Python от {index % 6} лет"},
+            "employer": {"id": str(employer_id), "name": f"Employer {employer_id}"},
+            "area": {"id": "1", "name": "Москва"},
+            "published_at": published_at.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "archived": False,
+        }
+
+    def _sleep(self):
+        """Выдержать задержку ответа по заданному распределению."""
+        config = self.config
+        if config.latency_ms <= 0:
+            return
+        with self._lock:
+            if config.latency == "uniform":
+                delay = self._random.uniform(0, 2 * config.latency_ms)
+            elif config.latency == "lognormal":
+                mu = math.log(config.latency_ms) - config.latency_sigma**2 / 2
+                delay = self._random.lognormvariate(mu, config.latency_sigma)
+            else:
+                delay = config.latency_ms
+        time.sleep(delay / 1000)
+
+    def _injected_error(self) -> Optional[int]:
+        """Определить, нужно ли ответить ошибкой на текущий запрос."""
+        with self._lock:
+            self.request_count += 1
+            if self.request_count <= self.config.fail_first:
+                return 503
+            roll = self._random.random()
+        if roll < self.config.throttle_rate:
+            return 429
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            return 503
+        return None
+
+    def _search(self, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        """Обработать поисковый запрос /vacancies."""
+        per_page = int(query.get("per_page", ["20"])[0])
+        page = int(query.get("page", ["0"])[0])
+        if page in self.config.fail_pages:
+            return 503, {"errors": [{"type": "injected", "value": 503}]}
+        indexes = range(self.config.found)
+        if "employer_id" in query:
+            employer_ids = set(query["employer_id"])
+            employers = self.config.employer_ids
+            indexes = [
+                i for i in indexes if str(employers[i % len(employers)]) in employer_ids
+            ]
+        found = len(indexes)
+        reachable = min(found, self.config.max_depth)
+        pages = math.ceil(reachable / per_page) if per_page else 0
+        if per_page and (page + 1) * per_page > self.config.max_depth:
+            return 400, {"errors": [{"type": "bad_argument", "value": "page"}]}
+        start = page * per_page
+        page_indexes = list(indexes)[start:min(start + per_page, reachable)]
+        items = [self._vacancy(i) for i in page_indexes]
+        return 200, {
+            "items": items,
+            "found": found,
+            "pages": pages,
+            "per_page": per_page,
+            "page": page,
+        }
+
+    def _route(
+        self, path: str, query: Dict[str, List[str]]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Выбрать обработчик по пути запроса."""
+        if path == "/vacancies":
+            return self._search(query)
+        match = re.fullmatch(r"/vacancies/(\d+)", path)
+        if match:
+            index = int(match.group(1)) - 1
+            if not 0 <= index < self.config.found:
+                return 404, {"errors": [{"type": "not_found"}]}
+            vacancy = self._vacancy(index)
+            vacancy["description"] = f"<p>{vacancy['snippet']['requirement']}</p>"
+            vacancy["key_skills"] = [{"name": "Python"}, {"name": "SQL"}]
+            vacancy["experience"] = {"id": "between1And3", "name": "От 1 года до 3 лет"}
+            return 200, vacancy
+        if path == "/dictionaries":
+            return 200, {
+                "currency": [
+                    {"code": "RUR", "abbr": "₽", "rate": 1.0},
+                    {"code": "USD", "abbr": "$", "rate": 0.0125},
+                    {"code": "EUR", "abbr": "€", "rate": 0.0115},
+                ]
+            }
+        match = re.fullmatch(r"/areas/(\d+)", path)
+        if match:
+            return 200, {"id": match.group(1), "areas": []}
+        return 404, {"errors": [{"type": "not_found"}]}
+
+    def _make_handler(self):
+        """Создать класс обработчика запросов, связанный с заглушкой."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._sleep()
+                status = server._injected_error()
+                headers = {}
+                if status is None:
+                    parts = urlsplit(self.path)
+                    status, body = server._route(parts.path, parse_qs(parts.query))
+                else:
+                    body = {"errors": [{"type": "injected", "value": status}]}
+                    if status == 429 and server.config.retry_after is not None:
+                        headers["Retry-After"] = str(server.config.retry_after)
+
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                if status == 200:
+                    etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+                    headers["ETag"] = etag
+                    if self.headers.get("If-None-Match") == etag:
+                        status, payload = 304, b""
+                with server._lock:
+                    server.status_counts[status] = (
+                        server.status_counts.get(status, 0) + 1
+                    )
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,172 @@
+"""
+Нагрузочный стенд для клиента hh.ru.
+
+Запускает локальную заглушку API и сравнивает стратегии загрузки вакансий
+по числу запросов в секунду, перцентилям задержки и общему времени.
+
+Пример:
+    python -m benchmarks.run_benchmark --latency-ms 50 --latency lognormal
+"""
+import argparse
+import asyncio
+import threading
+import time
+from typing import List, Dict, Callable
+from api.async_hh_api import AsyncHeadHunterAPI
+from api.hh_api import HeadHunterAPI
+from api.rate_limiter import RequestScheduler
+from benchmarks.mock_hh_server import MockHHConfig, MockHHServer
+
+
+class LatencyRecorder:
+    """Сбор задержек ответов через хук сессии requests."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, response, *args, **kwargs):
+        with self._lock:
+            self.latencies.append(response.elapsed.total_seconds())
+        return response
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Вычислить перцентиль методом ближайшего ранга.
+
+    Args:
+        values (List[float]): Значения
+        fraction (float): Доля от 0 до 1 (например, 0.95)
+
+    Returns:
+        float: Значение перцентиля (0, если значений нет)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _sequential(api: HeadHunterAPI, queries: List[str]) -> int:
+    api.max_workers = 1
+    return sum(len(api.get_vacancies(query)) for query in queries)
+
+
+def _threaded(api: HeadHunterAPI, queries: List[str]) -> int:
+    return sum(len(api.get_vacancies(query)) for query in queries)
+
+
+def _streaming(api: HeadHunterAPI, queries: List[str]) -> int:
+    return sum(1 for query in queries for _ in api.iter_vacancies(query))
+
+
+def _async(api: HeadHunterAPI, queries: List[str]) -> int:
+    async_api = AsyncHeadHunterAPI(api)
+    try:
+        results = asyncio.run(async_api.get_vacancies_many(queries))
+    finally:
+        async_api.close()
+    return sum(len(vacancies) for vacancies in results.values())
+
+
+STRATEGIES: Dict[str, Callable[[HeadHunterAPI, List[str]], int]] = {
+    "sequential": _sequential,
+    "threaded": _threaded,
+    "streaming": _streaming,
+    "async": _async,
+}
+
+
+def run_strategy(name: str, server: MockHHServer, args) -> Dict[str, float]:
+    """
+    Выполнить одну стратегию загрузки и собрать показатели.
+
+    Returns:
+        Dict[str, float]: Показатели стратегии
+    """
+    recorder = LatencyRecorder()
+    api = HeadHunterAPI(
+        api_url=server.url,
+        max_workers=args.workers,
+        pool_size=args.workers,
+        prefetch_pages=args.workers,
+        backoff_factor=args.backoff,
+        scheduler=RequestScheduler(
+            rate=args.rate, initial_concurrency=args.workers, max_concurrency=256
+        ),
+    )
+    api.session.hooks["response"].append(recorder)
+    queries = [f"query {i}" for i in range(args.queries)]
+    requests_before = server.request_count
+
+    start = time.perf_counter()
+    items = STRATEGIES[name](api, queries)
+    wall_time = time.perf_counter() - start
+    api.close()
+
+    requests_made = server.request_count - requests_before
+    return {
+        "items": items,
+        "requests": requests_made,
+        "rps": requests_made / wall_time if wall_time else 0.0,
+        "p50": percentile(recorder.latencies, 0.50) * 1000,
+        "p95": percentile(recorder.latencies, 0.95) * 1000,
+        "p99": percentile(recorder.latencies, 0.99) * 1000,
+        "wall": wall_time,
+    }
+
+
+def print_report(results: Dict[str, Dict[str, float]]):
+    """Вывести таблицу с результатами."""
+    header = (
+        f"{'Стратегия':<12} {'Вакансий':>9} {'Запросов':>9} {'RPS':>8} "
+        f"{'p50, мс':>9} {'p95, мс':>9} {'p99, мс':>9} {'Время, с':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        print(
+            f"{name:<12} {r['items']:>9} {r['requests']:>9} {r['rps']:>8.1f} "
+            f"{r['p50']:>9.1f} {r['p95']:>9.1f} {r['p99']:>9.1f} {r['wall']:>9.2f}"
+        )
+
+
+def parse_args(argv=None):
+    """Разобрать аргументы командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES))
+    parser.add_argument("--queries", type=int, default=4)
+    parser.add_argument("--found", type=int, default=2000)
+    parser.add_argument("--max-depth", type=int, default=2000)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=1000.0)
+    parser.add_argument("--backoff", type=float, default=0.05)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Запустить стенд."""
+    args = parse_args(argv)
+    config = MockHHConfig(
+        found=args.found,
+        max_depth=args.max_depth,
+        latency=args.latency or "fixed",
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+    )
+    results = {}
+    with MockHHServer(config) as server:
+        for name in args.strategies:
+            results[name] = run_strategy(name, server, args)
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import os
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import List, Tuple, Optional
+from psycopg2.extras import RealDictCursor, execute_values
+from typing import List, Tuple, Optional, Dict, Any, Iterable
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -43,7 +43,64 @@ class DBManager:
                     company_id INTEGER REFERENCES companies(id)
                 )
             ''')
+            # Колонки для инкрементальной синхронизации (добавляются и в
+            # ранее созданную таблицу)
+            cursor.execute('''
+                ALTER TABLE vacancies
+                    ADD COLUMN IF NOT EXISTS hh_id TEXT,
+                    ADD COLUMN IF NOT EXISTS published_at TIMESTAMPTZ,
+                    ADD COLUMN IF NOT EXISTS archived BOOLEAN NOT NULL DEFAULT FALSE,
+                    ADD COLUMN IF NOT EXISTS key_skills TEXT,
+                    ADD COLUMN IF NOT EXISTS experience TEXT
+            ''')
+            cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS vacancies_hh_id_key
+                ON vacancies (hh_id)
+            ''')
             self.conn.commit()
+        self.backfill_hh_ids()
+
+    def backfill_hh_ids(self) -> int:
+        """
+        Заполнить hh_id вакансий, загруженных без него, по ссылке на hh.ru.
+
+        Без hh_id вакансии не обновляются синхронизацией и не дополняются
+        подробностями. Если одна и та же вакансия была загружена несколько
+        раз, идентификатор получает самая ранняя строка, а остальные копии
+        удаляются.
+
+        Returns:
+            int: Количество строк, получивших hh_id
+        """
+        with self.conn.cursor() as cursor:
+            cursor.execute('''
+                UPDATE vacancies SET hh_id = legacy.hh_id
+                FROM (
+                    SELECT DISTINCT ON (hh_id) id, hh_id
+                    FROM (
+                        SELECT id, substring(url from '/vacancy/([0-9]+)') AS hh_id
+                        FROM vacancies
+                        WHERE hh_id IS NULL
+                    ) AS parsed
+                    WHERE hh_id IS NOT NULL
+                    ORDER BY hh_id, id
+                ) AS legacy
+                WHERE vacancies.id = legacy.id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM vacancies AS existing
+                      WHERE existing.hh_id = legacy.hh_id
+                  )
+            ''')
+            updated = cursor.rowcount
+            cursor.execute('''
+                DELETE FROM vacancies
+                WHERE hh_id IS NULL
+                  AND substring(url from '/vacancy/([0-9]+)') IN (
+                      SELECT hh_id FROM vacancies WHERE hh_id IS NOT NULL
+                  )
+            ''')
+            self.conn.commit()
+            return updated
 
     def close(self):
         self.conn.close()
@@ -86,15 +143,227 @@ class DBManager:
             self.conn.commit()
             return True
 
+    def upsert_vacancies(
+        self, vacancies: Iterable[Dict[str, Any]], company_hh_id: int
+    ) -> int:
+        """
+        Добавить или обновить вакансии компании одной транзакцией.
+
+        Вакансии сопоставляются по идентификатору hh.ru (hh_id). Если
+        вакансия встречается несколько раз (страницы выдачи сдвигаются
+        во время загрузки), записывается последняя копия. При ошибке
+        транзакция откатывается, чтобы соединение оставалось рабочим.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Словари с ключами hh_id, title,
+                url, salary, description, requirements, published_at, archived,
+                key_skills, experience (None, если подробности не загружались)
+            company_hh_id (int): Идентификатор компании на hh.ru
+
+        Returns:
+            int: Количество обработанных вакансий
+        """
+        # ON CONFLICT DO UPDATE не может изменить одну строку дважды
+        # за одну команду, поэтому повторы убираются заранее
+        latest = {v["hh_id"]: v for v in vacancies}
+        try:
+            return self._upsert_vacancies(latest.values(), company_hh_id)
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            print(f"Ошибка при сохранении вакансий: {e}")
+            return 0
+
+    def _upsert_vacancies(
+        self, vacancies: Iterable[Dict[str, Any]], company_hh_id: int
+    ) -> int:
+        """Записать вакансии компании без повторяющихся hh_id."""
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                'SELECT id FROM companies WHERE hh_id = %s', (company_hh_id,)
+            )
+            company = cursor.fetchone()
+            if not company:
+                return 0
+            company_id = company[0]
+            rows = [
+                (
+                    v["hh_id"],
+                    v["title"],
+                    v["url"],
+                    v["salary"],
+                    v["description"],
+                    v["requirements"],
+                    company_id,
+                    v["published_at"],
+                    v["archived"],
+                    v["key_skills"],
+                    v["experience"],
+                )
+                for v in vacancies
+            ]
+            if not rows:
+                return 0
+            execute_values(
+                cursor,
+                '''
+                INSERT INTO vacancies (hh_id, title, url, salary, description,
+                                       requirements, company_id, published_at, archived,
+                                       key_skills, experience)
+                VALUES %s
+                ON CONFLICT (hh_id) DO UPDATE SET
+                    title = EXCLUDED.title,
+                    url = EXCLUDED.url,
+                    salary = EXCLUDED.salary,
+                    -- Полное описание не заменяется коротким из поисковой выдачи
+                    description = CASE
+                        WHEN EXCLUDED.key_skills IS NULL
+                             AND vacancies.key_skills IS NOT NULL
+                        THEN vacancies.description
+                        ELSE EXCLUDED.description
+                    END,
+                    requirements = EXCLUDED.requirements,
+                    company_id = EXCLUDED.company_id,
+                    published_at = EXCLUDED.published_at,
+                    archived = EXCLUDED.archived,
+                    key_skills = COALESCE(EXCLUDED.key_skills, vacancies.key_skills),
+                    experience = COALESCE(EXCLUDED.experience, vacancies.experience)
+                ''',
+                rows,
+            )
+            self.conn.commit()
+            return len(rows)
+
+    def mark_expired_vacancies(
+        self, company_hh_id: int, published_before: str
+    ) -> int:
+        """
+        Пометить как архивные вакансии компании, опубликованные раньше даты.
+
+        Архивные вакансии остаются в таблице, но не учитываются в запросах
+        списков, счетчиков и средней зарплаты.
+
+        Это приближение для инкрементальной синхронизации, которая видит
+        только новые вакансии: закрытые досрочно остаются активными, а
+        продленные без новой даты публикации помечаются архивными. Точно
+        архивирует вакансии archive_missing_vacancies по полной выдаче.
+
+        Args:
+            company_hh_id (int): Идентификатор компании на hh.ru
+            published_before (str): Граница даты публикации (ISO 8601)
+
+        Returns:
+            int: Количество помеченных вакансий
+        """
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                '''
+                UPDATE vacancies SET archived = TRUE
+                FROM companies
+                WHERE vacancies.company_id = companies.id
+                  AND companies.hh_id = %s
+                  AND vacancies.published_at < %s
+                  AND NOT vacancies.archived
+                ''',
+                (company_hh_id, published_before),
+            )
+            self.conn.commit()
+            return cursor.rowcount
+
+    def archive_missing_vacancies(
+        self, company_hh_id: int, active_hh_ids: Iterable[str]
+    ) -> int:
+        """
+        Пометить как архивные вакансии компании, которых нет в полной выдаче.
+
+        Вакансии из выдачи, помеченные архивными ранее, снова становятся
+        активными при записи через upsert_vacancies.
+
+        Args:
+            company_hh_id (int): Идентификатор компании на hh.ru
+            active_hh_ids (Iterable[str]): Идентификаторы hh.ru всех вакансий
+                компании из полной (не усеченной) выдачи
+
+        Returns:
+            int: Количество помеченных вакансий
+        """
+        try:
+            with self.conn.cursor() as cursor:
+                cursor.execute(
+                    '''
+                    UPDATE vacancies SET archived = TRUE
+                    FROM companies
+                    WHERE vacancies.company_id = companies.id
+                      AND companies.hh_id = %s
+                      AND vacancies.hh_id <> ALL(%s::text[])
+                      AND NOT vacancies.archived
+                    ''',
+                    (company_hh_id, list(active_hh_ids)),
+                )
+                self.conn.commit()
+                return cursor.rowcount
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            print(f"Ошибка при архивации вакансий: {e}")
+            return 0
+
+    def get_vacancy_ids_without_details(self) -> List[str]:
+        """
+        Получить идентификаторы hh.ru актуальных вакансий без подробностей.
+
+        Вакансии, загруженные без hh_id, получают его при создании таблиц
+        (см. backfill_hh_ids), поэтому тоже попадают в выборку.
+        """
+        with self.conn.cursor() as cursor:
+            cursor.execute('''
+                SELECT hh_id FROM vacancies
+                WHERE hh_id IS NOT NULL AND key_skills IS NULL AND NOT archived
+            ''')
+            return [row[0] for row in cursor.fetchall()]
+
+    def update_vacancy_details(self, details: Iterable[Dict[str, Any]]) -> int:
+        """
+        Записать подробности вакансий одной транзакцией.
+
+        Args:
+            details (Iterable[Dict[str, Any]]): Словари с ключами id,
+                description, key_skills (список), experience
+
+        Returns:
+            int: Количество обновленных вакансий
+        """
+        rows = [
+            (d["id"], d["description"], ", ".join(d["key_skills"]), d["experience"])
+            for d in details
+        ]
+        if not rows:
+            return 0
+        with self.conn.cursor() as cursor:
+            execute_values(
+                cursor,
+                '''
+                UPDATE vacancies SET
+                    description = data.description,
+                    key_skills = data.key_skills,
+                    experience = data.experience
+                FROM (VALUES %s) AS data (hh_id, description, key_skills, experience)
+                WHERE vacancies.hh_id = data.hh_id
+                ''',
+                rows,
+            )
+            self.conn.commit()
+            return cursor.rowcount
+
     def get_companies_and_vacancy_counts(self) -> List[Tuple[str, int]]:
         """
         Получить список всех компаний и количества вакансий у каждой компании.
+        Архивные вакансии не учитываются.
         """
         with self.conn.cursor() as cursor:
             cursor.execute('''
                 SELECT companies.name, COUNT(vacancies.id) as vacancy_count
                 FROM companies
                 LEFT JOIN vacancies ON companies.id = vacancies.company_id
+                    AND NOT vacancies.archived
                 GROUP BY companies.id
             ''')
             return cursor.fetchall()
@@ -102,27 +371,32 @@ class DBManager:
     def get_all_vacancies(self) -> List[Tuple[str, str, Optional[int], str]]:
         """
         Получить список всех вакансий с названием компании, вакансии, зарплатой и ссылкой.
+        Архивные вакансии не выводятся.
         """
         with self.conn.cursor() as cursor:
             cursor.execute('''
                 SELECT companies.name, vacancies.title, vacancies.salary, vacancies.url
                 FROM vacancies
                 JOIN companies ON vacancies.company_id = companies.id
+                WHERE NOT vacancies.archived
             ''')
             return cursor.fetchall()
 
     def get_avg_salary(self) -> Optional[float]:
         """
-        Получить среднюю зарплату по всем вакансиям.
+        Получить среднюю зарплату по всем активным (не архивным) вакансиям.
         """
         with self.conn.cursor() as cursor:
-            cursor.execute('SELECT AVG(salary) FROM vacancies WHERE salary IS NOT NULL AND salary > 0')
+            cursor.execute('''
+                SELECT AVG(salary) FROM vacancies
+                WHERE salary IS NOT NULL AND salary > 0 AND NOT archived
+            ''')
             result = cursor.fetchone()
             return result[0] if result and result[0] is not None else None
 
     def get_vacancies_with_higher_salary(self) -> List[Tuple[str, str, int, str]]:
         """
-        Получить вакансии с зарплатой выше средней.
+        Получить активные вакансии с зарплатой выше средней.
         """
         avg_salary = self.get_avg_salary()
         if avg_salary is None:
@@ -133,7 +407,7 @@ class DBManager:
                 SELECT companies.name, vacancies.title, vacancies.salary, vacancies.url
                 FROM vacancies
                 JOIN companies ON vacancies.company_id = companies.id
-                WHERE vacancies.salary > %s
+                WHERE vacancies.salary > %s AND NOT vacancies.archived
                 ''',
                 (avg_salary,),
             )
@@ -141,7 +415,7 @@ class DBManager:
 
     def get_vacancies_with_keyword(self, keyword: str) -> List[Tuple[str, str, Optional[int], str]]:
         """
-        Получить вакансии, в названии которых содержится keyword.
+        Получить активные вакансии, в названии которых содержится keyword.
         """
         with self.conn.cursor() as cursor:
             cursor.execute(
@@ -149,7 +423,7 @@ class DBManager:
                 SELECT companies.name, vacancies.title, vacancies.salary, vacancies.url
                 FROM vacancies
                 JOIN companies ON vacancies.company_id = companies.id
-                WHERE vacancies.title ILIKE %s
+                WHERE vacancies.title ILIKE %s AND NOT vacancies.archived
                 ''',
                 (f'%{keyword}%',),
             )
@@ -1,10 +1,21 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from api.async_hh_api import AsyncHeadHunterAPI
+from api.cache import ResponseCache
+from api.enrichment import VacancyEnricher
+from api.exchange_rates import ExchangeRates
 from api.hh_api import HeadHunterAPI
+from api.query_planner import QueryPlanner
+from api.rate_limiter import PRIORITY_INTERACTIVE, PRIORITY_BULK
+from models.salary import Salary
 from models.vacancy import Vacancy
 from storage.json_saver import JSONSaver
+from storage.sync_state import SyncState, parse_hh_date
 from utils.filters import (
     filter_vacancies,
     get_vacancies_by_salary,
     get_top_vacancies,
+    parse_salary_range,
     print_vacancies,
     print_statistics,
 )
@@ -21,9 +32,11 @@ def user_interaction():
     print("=" * 60)
 
     # Инициализация компонентов
-    hh_api = HeadHunterAPI()
+    hh_api = HeadHunterAPI(cache=ResponseCache(), priority=PRIORITY_INTERACTIVE)
     json_saver = JSONSaver()
     db_manager = DBManager()
+    sync_state = SyncState()
+    exchange_rates = ExchangeRates(hh_api)
 
     # Заполнение компаний (пример 10 компаний с hh_id)
     companies = [
@@ -55,12 +68,15 @@ def user_interaction():
         print("11. Показать среднюю зарплату (БД)")
         print("12. Показать вакансии с зарплатой выше средней (БД)")
         print("13. Поиск вакансий по ключевому слову (БД)")
+        print("14. Синхронизировать новые вакансии компаний (hh.ru → БД)")
+        print("15. Дополнить вакансии в БД полным описанием и навыками (hh.ru → БД)")
+        print("16. Показать метрики запросов к hh.ru")
         print("0. Выход")
 
         choice = input("\nВведите номер действия: ").strip()
 
         if choice == "1":
-            search_vacancies(hh_api, json_saver)
+            search_vacancies(hh_api, json_saver, exchange_rates)
         elif choice == "2":
             show_saved_vacancies(json_saver)
         elif choice == "3":
@@ -74,7 +90,7 @@ def user_interaction():
         elif choice == "7":
             clear_vacancies(json_saver)
         elif choice == "8":
-            load_vacancies_to_db(hh_api, db_manager, companies)
+            load_vacancies_to_db(hh_api, db_manager, companies, exchange_rates)
         elif choice == "9":
             show_companies_and_vacancy_counts(db_manager)
         elif choice == "10":
@@ -85,15 +101,26 @@ def user_interaction():
             show_vacancies_higher_salary_db(db_manager)
         elif choice == "13":
             search_vacancies_by_keyword_db(db_manager)
+        elif choice == "14":
+            sync_vacancies_to_db(
+                hh_api, db_manager, companies, sync_state, exchange_rates
+            )
+        elif choice == "15":
+            enrich_vacancies_db(hh_api, db_manager)
+        elif choice == "16":
+            show_api_metrics(hh_api)
         elif choice == "0":
             db_manager.close()
+            hh_api.close()
             print("До свидания!")
             break
         else:
             print("Неверный выбор. Попробуйте снова.")
 
 
-def search_vacancies(hh_api: HeadHunterAPI, json_saver: JSONSaver):
+def search_vacancies(
+    hh_api: HeadHunterAPI, json_saver: JSONSaver, exchange_rates: ExchangeRates
+):
     """Поиск вакансий на hh.ru и сохранение результатов."""
     search_query = input("Введите поисковый запрос: ").strip()
 
@@ -103,16 +130,16 @@ def search_vacancies(hh_api: HeadHunterAPI, json_saver: JSONSaver):
 
     print(f"Поиск вакансий по запросу: '{search_query}'...")
 
-    # Получение вакансий с hh.ru
-    hh_vacancies = hh_api.get_vacancies(search_query)
+    # Получение вакансий с hh.ru и преобразование в объекты Vacancy
+    # по мере загрузки страниц, зарплаты пересчитываются в рубли
+    vacancies_list = Vacancy.cast_to_object_list(
+        hh_api.iter_vacancies(search_query), rates=exchange_rates.get()
+    )
 
-    if not hh_vacancies:
+    if not vacancies_list:
         print("Вакансии не найдены.")
         return
 
-    # Преобразование в объекты Vacancy
-    vacancies_list = Vacancy.cast_to_object_list(hh_vacancies)
-
     print(f"Найдено {len(vacancies_list)} вакансий.")
 
     # Сохранение в файл
@@ -185,9 +212,12 @@ def filter_by_salary_range(json_saver: JSONSaver):
         print("Диапазон зарплат не указан.")
         return
 
-    vacancies = json_saver.get_vacancies()
+    # Границы передаются хранилищу, чтобы отбор шел по индексу зарплат
+    bounds = parse_salary_range(salary_range)
+    criteria = {"min_salary": bounds[0], "max_salary": bounds[1]} if bounds else {}
+    vacancies = json_saver.get_vacancies(**criteria)
 
-    if not vacancies:
+    if not vacancies and not criteria:
         print("Сохраненных вакансий нет.")
         return
 
@@ -221,37 +251,156 @@ def clear_vacancies(json_saver: JSONSaver):
         print("Операция отменена.")
 
 
-def load_vacancies_to_db(hh_api, db_manager, companies):
-    print("Загрузка вакансий для 10 компаний...")
+# Срок публикации вакансии на hh.ru, после которого она уходит в архив
+VACANCY_LIFETIME = timedelta(days=30)
+
+# Запас отметки синхронизации: вакансии, которые hh.ru проиндексировал
+# позже даты публикации, попадут в следующую синхронизацию
+SYNC_OVERLAP = timedelta(hours=6)
+
+
+def _vacancy_to_row(v, rates=None):
+    """
+    Преобразовать вакансию hh.ru в строку для таблицы vacancies.
+
+    Если заданы курсы валют, зарплата пересчитывается в рубли.
+    """
+    salary = Salary.from_json(v.get("salary"))
+    if salary is not None and rates:
+        salary = salary.in_rub(rates)
+    salary_val = salary.value if salary is not None else None
+    snippet = v.get("snippet") or {}
+    return {
+        "hh_id": v.get("id"),
+        "title": v.get("name", ""),
+        "url": v.get("alternate_url", ""),
+        "salary": salary_val,
+        "description": snippet.get("requirement", ""),
+        "requirements": snippet.get("requirement", ""),
+        "published_at": v.get("published_at"),
+        "archived": bool(v.get("archived", False)),
+        "key_skills": ", ".join(v["key_skills"]) if "key_skills" in v else None,
+        "experience": (v.get("experience") or {}).get("name"),
+    }
+
+
+def load_vacancies_to_db(hh_api, db_manager, companies, exchange_rates):
+    print(f"Загрузка вакансий для {len(companies)} компаний...")
+    # Все компании и все их страницы загружаются одновременно, вакансии
+    # выбираются по идентификатору работодателя, а не по тексту названия.
+    # Массовая загрузка уступает очередь интерактивному поиску
+    async_api = AsyncHeadHunterAPI(hh_api.with_priority(PRIORITY_BULK))
+    try:
+        results, incomplete = asyncio.run(
+            async_api.fetch_vacancies_by_employers([hh_id for _, hh_id in companies])
+        )
+    finally:
+        async_api.close()
+    rates = exchange_rates.get()
+    planner = QueryPlanner(hh_api.with_priority(PRIORITY_BULK))
+
     for name, hh_id in companies:
         print(f"\nКомпания: {name}")
-        vacancies = hh_api.get_vacancies(name)
-        if not vacancies:
-            print("  Нет вакансий.")
-            continue
-        for v in vacancies:
-            title = v.get("name", "")
-            url = v.get("alternate_url", "")
-            salary = v.get("salary")
-            # Вытаскиваем максимальную зарплату, если есть
-            if isinstance(salary, dict):
-                if salary.get("to") is not None:
-                    salary_val = salary["to"]
-                elif salary.get("from") is not None:
-                    salary_val = salary["from"]
-                else:
-                    salary_val = None
-            else:
-                salary_val = None
-            description = v.get("snippet", {}).get("requirement", "")
-            requirements = v.get("snippet", {}).get("requirement", "")
-            db_manager.insert_vacancy(
-                title, url, salary_val, description, requirements, hh_id
+        vacancies = results.get(hh_id, [])
+        complete = hh_id not in incomplete
+        if not complete:
+            # Выдача больше глубины поиска (загружена только первая страница)
+            # или не загрузилась целиком: получаем ее через подзапросы
+            vacancies, complete = planner.fetch_vacancies("", employer_id=hh_id)
+        # Вакансии записываются по идентификатору hh.ru, поэтому повторная
+        # загрузка и последующая синхронизация обновляют их, а не дублируют
+        rows = [_vacancy_to_row(v, rates) for v in vacancies if v.get("id")]
+        upserted = db_manager.upsert_vacancies(rows, hh_id)
+        if complete:
+            # Вакансии, которых нет в полной выдаче, закрыты на hh.ru
+            archived = db_manager.archive_missing_vacancies(
+                hh_id, [row["hh_id"] for row in rows]
             )
-        print(f"  Загружено: {len(vacancies)} вакансий.")
+            print(f"  Загружено: {upserted} вакансий, в архиве: {archived}.")
+        elif rows:
+            print(f"  Загружено: {upserted} вакансий (выдача неполная).")
+        else:
+            print("  Нет вакансий.")
     print("\nЗагрузка завершена!")
 
 
+def sync_vacancies_to_db(hh_api, db_manager, companies, sync_state, exchange_rates):
+    """
+    Инкрементальная синхронизация вакансий компаний с БД.
+
+    Для каждой компании запрашиваются только вакансии, опубликованные
+    (или обновленные) после сохраненной отметки, они добавляются или
+    обновляются в БД, а вакансии старше срока публикации помечаются архивными.
+
+    Выдача больше глубины поиска hh.ru делится планировщиком на подзапросы.
+    Отметка сдвигается только после полной выдачи, иначе пропущенные
+    вакансии будут запрошены при следующей синхронизации. Отметка отстает
+    от самой свежей вакансии на SYNC_OVERLAP, повторно полученные вакансии
+    просто обновляются по hh_id.
+
+    Ограничение: по новым вакансиям нельзя узнать, какие вакансии закрыты,
+    поэтому архивация здесь идет по сроку публикации (см.
+    DBManager.mark_expired_vacancies). Точно архив обновляет полная
+    загрузка (load_vacancies_to_db).
+    """
+    print(f"Синхронизация вакансий для {len(companies)} компаний...")
+    planner = QueryPlanner(hh_api.with_priority(PRIORITY_BULK))
+    expired_before = (datetime.now(timezone.utc) - VACANCY_LIFETIME).isoformat()
+    rates = exchange_rates.get()
+
+    for name, hh_id in companies:
+        key = f"company:{hh_id}"
+        params = {"order_by": "publication_time"}
+        since = sync_state.get(key)
+        if since:
+            params["date_from"] = since
+
+        vacancies, complete = planner.fetch_vacancies("", employer_id=hh_id, **params)
+        rows = [_vacancy_to_row(v, rates) for v in vacancies if v.get("id")]
+        upserted = db_manager.upsert_vacancies(rows, hh_id)
+        expired = db_manager.mark_expired_vacancies(hh_id, expired_before)
+
+        published = [row["published_at"] for row in rows if row["published_at"]]
+        if published and complete:
+            sync_state.update(
+                key, max(published, key=parse_hh_date), overlap=SYNC_OVERLAP
+            )
+
+        print(f"  {name}: обновлено {upserted}, в архиве {expired}")
+        if not complete:
+            print("    Выдача получена не полностью, отметка синхронизации сохранена")
+    print("\nСинхронизация завершена!")
+
+
+def enrich_vacancies_db(hh_api, db_manager):
+    """
+    Дополнить вакансии в БД подробностями с hh.ru.
+
+    Подробности сохраняются в локальный файл по мере загрузки, поэтому
+    прерванный проход при повторном запуске продолжается с того же места.
+    """
+    vacancy_ids = db_manager.get_vacancy_ids_without_details()
+    if not vacancy_ids:
+        print("Все вакансии уже дополнены.")
+        return
+
+    print(f"Загрузка подробностей для {len(vacancy_ids)} вакансий...")
+    enricher = VacancyEnricher(hh_api.with_priority(PRIORITY_BULK))
+    fetched = enricher.fetch_details(vacancy_ids)
+    details = filter(None, (enricher.store.get(v_id) for v_id in vacancy_ids))
+    updated = db_manager.update_vacancy_details(details)
+    print(f"Загружено с hh.ru: {fetched}, обновлено в БД: {updated}")
+
+
+def show_api_metrics(hh_api: HeadHunterAPI):
+    """Вывести метрики запросов к hh.ru в JSON или в формате Prometheus."""
+    metrics_format = input("Формат вывода (json/prometheus): ").strip().lower()
+    if metrics_format == "prometheus":
+        print(hh_api.metrics.to_prometheus())
+    else:
+        print(hh_api.metrics.to_json())
+
+
 def show_companies_and_vacancy_counts(db_manager):
     data = db_manager.get_companies_and_vacancy_counts()
     print("\nКомпании и количество вакансий:")
@@ -0,0 +1,146 @@
+import sys
+from typing import List, Dict, Any, Callable, Iterable
+
+# Поля с небольшим числом различных значений: кодируются номером
+# в общем словаре
+DICTIONARY_FIELDS = ("company", "employer_id", "experience", "requirements")
+
+# Формат файла со словарным кодированием
+ENCODED_FORMAT = "dictionary-v1"
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Интернировать строку, чтобы одинаковые значения хранились одним объектом.
+
+    Args:
+        value (Any): Значение поля
+
+    Returns:
+        Any: Интернированная строка или исходное значение, если это не строка
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_all(values: Iterable[Any]) -> List[Any]:
+    """Интернировать все строки последовательности."""
+    return [intern_value(value) for value in values]
+
+
+class _Dictionary:
+    """Словарь значений одного поля: значение → номер."""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+
+def encode_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Закодировать записи вакансий с общими словарями повторяющихся значений.
+
+    Поля из DICTIONARY_FIELDS и ключевые навыки заменяются номерами
+    в словарях, ссылка — номером префикса (например, https://hh.ru/vacancy/)
+    и оставшейся частью.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Записи в формате JSONSaver
+
+    Returns:
+        Dict[str, Any]: Словари и закодированные записи
+    """
+    dictionaries = {field: _Dictionary() for field in DICTIONARY_FIELDS}
+    skills = _Dictionary()
+    url_prefixes = _Dictionary()
+
+    encoded = []
+    for record in records:
+        row = dict(record)
+        for field, dictionary in dictionaries.items():
+            if field in row:
+                row[field] = dictionary.encode(row[field])
+        if row.get("key_skills"):
+            row["key_skills"] = [skills.encode(skill) for skill in row["key_skills"]]
+        url = row.get("url")
+        if isinstance(url, str):
+            split = url.rfind("/") + 1
+            row["url"] = [url_prefixes.encode(url[:split]), url[split:]]
+        encoded.append(row)
+
+    return {
+        "format": ENCODED_FORMAT,
+        "dictionaries": {
+            **{field: d.values for field, d in dictionaries.items()},
+            "key_skills": skills.values,
+            "url_prefix": url_prefixes.values,
+        },
+        "vacancies": encoded,
+    }
+
+
+def is_encoded(data: Any) -> bool:
+    """Закодированы ли данные функцией encode_records."""
+    return isinstance(data, dict) and data.get("format") == ENCODED_FORMAT
+
+
+def record_decoder(
+    dictionaries: Dict[str, List[Any]]
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Функция, восстанавливающая одну запись по словарям encode_records.
+
+    Позволяет декодировать записи по одной, не держа в памяти весь файл.
+
+    Args:
+        dictionaries (Dict[str, List[Any]]): Словари из поля "dictionaries"
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Функция декодирования
+            записи (изменяет и возвращает переданный словарь)
+    """
+    dictionaries = {name: intern_all(values) for name, values in dictionaries.items()}
+    fields = [
+        (field, dictionaries[field])
+        for field in DICTIONARY_FIELDS
+        if field in dictionaries
+    ]
+    skills = dictionaries.get("key_skills", [])
+    url_prefixes = dictionaries.get("url_prefix", [])
+
+    def decode(row: Dict[str, Any]) -> Dict[str, Any]:
+        for field, values in fields:
+            if field in row:
+                row[field] = values[row[field]]
+        if row.get("key_skills"):
+            row["key_skills"] = [skills[code] for code in row["key_skills"]]
+        url = row.get("url")
+        if isinstance(url, list):
+            row["url"] = url_prefixes[url[0]] + url[1]
+        return row
+
+    return decode
+
+
+def decode_records(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Восстановить записи, закодированные функцией encode_records.
+
+    Одинаковые значения в восстановленных записях ссылаются на один
+    и тот же объект строки из словаря.
+
+    Args:
+        data (Dict[str, Any]): Словари и закодированные записи
+
+    Returns:
+        List[Dict[str, Any]]: Записи в формате JSONSaver
+    """
+    decode = record_decoder(data["dictionaries"])
+    return [decode(row) for row in data["vacancies"]]
@@ -0,0 +1,153 @@
+from typing import Dict, Any, Optional, Tuple
+from models.encoding import intern_value
+
+# Код рубля в справочниках hh.ru
+RUB_CURRENCY = "RUR"
+
+# Границы «от» и «до», валюта и признак gross
+SalaryFields = Tuple[Optional[int], Optional[int], str, Optional[bool]]
+
+
+class Salary:
+    """
+    Зарплата вакансии в формате hh.ru: границы «от» и «до», валюта
+    и признак «до вычета налогов». Умеет пересчитываться в рубли
+    по курсам из справочника hh.ru.
+    """
+
+    __slots__ = ("salary_from", "salary_to", "currency", "gross")
+
+    def __init__(
+        self,
+        salary_from: Optional[int] = None,
+        salary_to: Optional[int] = None,
+        currency: Optional[str] = RUB_CURRENCY,
+        gross: Optional[bool] = None,
+    ):
+        """
+        Инициализация зарплаты.
+
+        Args:
+            salary_from (Optional[int]): Нижняя граница
+            salary_to (Optional[int]): Верхняя граница
+            currency (Optional[str]): Код валюты hh.ru (RUR, USD, EUR, ...)
+            gross (Optional[bool]): Указана ли зарплата до вычета налогов
+        """
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.currency = intern_value(currency) if currency else RUB_CURRENCY
+        self.gross = gross
+
+    @classmethod
+    def from_json(cls, salary: Any) -> Optional["Salary"]:
+        """
+        Создать зарплату из поля salary вакансии hh.ru.
+
+        Args:
+            salary (Any): Зарплата в формате hh.ru
+
+        Returns:
+            Optional[Salary]: Зарплата или None, если она не указана
+        """
+        fields = salary_fields(salary)
+        return cls(*fields) if fields is not None else None
+
+    def to_json(self) -> Dict[str, Any]:
+        """Зарплата в формате hh.ru."""
+        return {
+            "from": self.salary_from,
+            "to": self.salary_to,
+            "currency": self.currency,
+            "gross": self.gross,
+        }
+
+    @property
+    def value(self) -> int:
+        """Зарплата одним числом: верхняя граница, а если ее нет — нижняя."""
+        return salary_value(self.salary_from, self.salary_to)
+
+    def in_rub(self, rates: Dict[str, float]) -> "Salary":
+        """
+        Пересчитать зарплату в рубли.
+
+        Args:
+            rates (Dict[str, float]): Курсы валют hh.ru (сколько единиц
+                валюты стоит один рубль)
+
+        Returns:
+            Salary: Зарплата в рублях (та же, если валюта уже рубли или курс
+                неизвестен)
+        """
+        rate = rates.get(self.currency)
+        if self.currency == RUB_CURRENCY or not rate:
+            return self
+        return Salary(*_to_rub(self.salary_from, self.salary_to, rate), self.gross)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Salary):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    def __repr__(self) -> str:
+        return (
+            f"Salary(from={self.salary_from}, to={self.salary_to}, "
+            f"currency='{self.currency}', gross={self.gross})"
+        )
+
+
+def salary_fields(
+    salary: Any, rates: Optional[Dict[str, float]] = None
+) -> Optional[SalaryFields]:
+    """
+    Разобрать поле salary вакансии hh.ru без создания объекта Salary.
+
+    Args:
+        salary (Any): Зарплата в формате hh.ru
+        rates (Optional[Dict[str, float]]): Курсы валют hh.ru; если заданы,
+            зарплата пересчитывается в рубли (как Salary.in_rub)
+
+    Returns:
+        Optional[SalaryFields]: Границы, валюта и признак gross или None,
+            если зарплата не указана
+    """
+    if not isinstance(salary, dict):
+        return None
+    salary_from = _amount(salary.get("from"))
+    salary_to = _amount(salary.get("to"))
+    if salary_from is None and salary_to is None:
+        return None
+    currency = salary.get("currency")
+    currency = intern_value(currency) if currency else RUB_CURRENCY
+    if rates and currency != RUB_CURRENCY:
+        rate = rates.get(currency)
+        if rate:
+            salary_from, salary_to, currency = _to_rub(salary_from, salary_to, rate)
+    return salary_from, salary_to, currency, salary.get("gross")
+
+
+def salary_value(salary_from: Optional[int], salary_to: Optional[int]) -> int:
+    """Зарплата одним числом: верхняя граница, а если ее нет — нижняя."""
+    if salary_to is not None:
+        return salary_to
+    if salary_from is not None:
+        return salary_from
+    return 0
+
+
+def _to_rub(
+    salary_from: Optional[int], salary_to: Optional[int], rate: float
+) -> Tuple[Optional[int], Optional[int], str]:
+    """Границы зарплаты, пересчитанные в рубли по курсу hh.ru."""
+    return _convert(salary_from, rate), _convert(salary_to, rate), RUB_CURRENCY
+
+
+def _amount(value: Any) -> Optional[int]:
+    """Граница зарплаты как целое число."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    return None
+
+
+def _convert(amount: Optional[int], rate: float) -> Optional[int]:
+    """Пересчитать сумму в рубли по курсу hh.ru."""
+    return None if amount is None else int(round(amount / rate))
@@ -1,12 +1,47 @@
-from typing import List, Dict, Any, Optional
+import gc
+import re
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Sequence, Tuple, Union
+from models.encoding import intern_all, intern_value
+from models.salary import Salary, RUB_CURRENCY, salary_fields, salary_value
+
+# Идентификатор вакансии в ссылке hh.ru (https://hh.ru/vacancy/93353083)
+_HH_VACANCY_URL = re.compile(r"/vacancy/([0-9]+)")
 
 
 class Vacancy:
     """
     Класс для работы с вакансиями.
     Поддерживает методы сравнения по зарплате и валидацию данных.
+
+    Операторы сравнения (в том числе ==) сравнивают зарплаты и нужны для
+    сортировки. Для поиска дубликатов используется идентичность вакансии:
+    свойство key (см. identity_key), по нему же работают same_as, unique
+    и хранилища.
+
+    Атрибуты хранятся в слотах (без __dict__), что заметно уменьшает
+    расход памяти при сотнях тысяч вакансий. По той же причине границы,
+    валюта и признак gross зарплаты хранятся в слотах самой вакансии,
+    а объект Salary (свойство salary_range) создается по запросу.
     """
 
+    __slots__ = (
+        "title",
+        "url",
+        "salary",
+        "description",
+        "requirements",
+        "company",
+        "key_skills",
+        "experience",
+        "salary_from",
+        "salary_to",
+        "currency",
+        "gross",
+        "hh_id",
+        "employer_id",
+    )
+
     def __init__(
         self,
         title: str,
@@ -15,6 +50,11 @@ class Vacancy:
         description: str,
         requirements: str = "",
         company: str = "",
+        key_skills: Optional[Iterable[str]] = None,
+        experience: str = "",
+        hh_id: Optional[str] = None,
+        employer_id: Optional[str] = None,
+        rates: Optional[Dict[str, float]] = None,
     ):
         """
         Инициализация вакансии.
@@ -26,13 +66,129 @@ class Vacancy:
             description (str): Описание вакансии
             requirements (str): Требования к кандидату
             company (str): Название компании
+            key_skills (Optional[Iterable[str]]): Ключевые навыки
+            experience (str): Требуемый опыт работы
+            hh_id (Optional[str]): Идентификатор вакансии на hh.ru
+            employer_id (Optional[str]): Идентификатор работодателя на hh.ru
+            rates (Optional[Dict[str, float]]): Курсы валют hh.ru; если заданы,
+                зарплата пересчитывается в рубли (как в iter_from_json)
         """
         self.title = self._validate_title(title)
         self.url = self._validate_url(url)
-        self.salary = self._validate_salary(salary)
+        # Зарплата разбирается один раз, число берется из разобранных границ
+        fields = salary_fields(salary, rates)
+        if fields is not None:
+            self.salary_from, self.salary_to, self.currency, self.gross = fields
+            self.salary = salary_value(self.salary_from, self.salary_to)
+        else:
+            self.salary_from = self.salary_to = self.currency = self.gross = None
+            self.salary = self._validate_salary(salary)
         self.description = self._validate_description(description)
         self.requirements = requirements
-        self.company = company
+        self.company = intern_value(company)
+        self.key_skills = tuple(intern_all(key_skills)) if key_skills else ()
+        self.experience = intern_value(experience)
+        self.hh_id = str(hh_id) if hh_id else None
+        self.employer_id = intern_value(str(employer_id)) if employer_id else None
+
+    @classmethod
+    def from_trusted(
+        cls,
+        title: str,
+        url: str,
+        salary: int,
+        description: str,
+        requirements: str = "",
+        company: str = "",
+        key_skills: Optional[Iterable[str]] = None,
+        experience: str = "",
+        salary_range: Optional[Salary] = None,
+        hh_id: Optional[str] = None,
+        employer_id: Optional[str] = None,
+    ) -> "Vacancy":
+        """
+        Создать вакансию из уже проверенных данных без повторной валидации.
+
+        Предназначен для данных, ранее сохраненных из объектов Vacancy
+        (файл JSONSaver, БД): зарплата передается готовым числом.
+
+        Args:
+            title (str): Название вакансии
+            url (str): Ссылка на вакансию
+            salary (int): Зарплата
+            description (str): Описание вакансии
+            requirements (str): Требования к кандидату
+            company (str): Название компании
+            key_skills (Optional[Iterable[str]]): Ключевые навыки
+            experience (str): Требуемый опыт работы
+            salary_range (Optional[Salary]): Зарплата с границами и валютой
+            hh_id (Optional[str]): Идентификатор вакансии на hh.ru
+            employer_id (Optional[str]): Идентификатор работодателя на hh.ru
+
+        Returns:
+            Vacancy: Объект вакансии
+        """
+        vacancy = cls.__new__(cls)
+        vacancy.title = title
+        vacancy.url = url
+        vacancy.salary = salary
+        vacancy.description = description
+        vacancy.requirements = requirements
+        vacancy.company = company
+        vacancy.key_skills = tuple(key_skills) if key_skills else ()
+        vacancy.experience = experience
+        vacancy.salary_range = salary_range
+        vacancy.hh_id = hh_id
+        vacancy.employer_id = employer_id
+        return vacancy
+
+    @property
+    def salary_range(self) -> Optional[Salary]:
+        """Зарплата с границами и валютой (None, если границы не указаны)."""
+        if self.salary_from is None and self.salary_to is None:
+            return None
+        return Salary(self.salary_from, self.salary_to, self.currency, self.gross)
+
+    @salary_range.setter
+    def salary_range(self, salary_range: Optional[Salary]):
+        if salary_range is None:
+            self.salary_from = self.salary_to = self.currency = self.gross = None
+        else:
+            self.salary_from = salary_range.salary_from
+            self.salary_to = salary_range.salary_to
+            self.currency = salary_range.currency
+            self.gross = salary_range.gross
+
+    @property
+    def key(self) -> Tuple[str, ...]:
+        """
+        Ключ идентичности вакансии для словарей и множеств.
+
+        Returns:
+            Tuple[str, ...]: ("hh", id) для вакансий hh.ru, иначе
+                ("url", url, title) (см. identity_key)
+        """
+        return identity_key(self.hh_id, self.url, self.title)
+
+    def same_as(self, other: "Vacancy") -> bool:
+        """Проверить, что объекты описывают одну и ту же вакансию (по key)."""
+        return self.key == other.key
+
+    @staticmethod
+    def unique(vacancies: Iterable["Vacancy"]) -> List["Vacancy"]:
+        """
+        Убрать повторы вакансий, сохранив порядок первых вхождений.
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии
+
+        Returns:
+            List[Vacancy]: Вакансии без повторов (по key)
+        """
+        seen = {}
+        for vacancy in vacancies:
+            seen.setdefault(vacancy.key, vacancy)
+        return list(seen.values())
 
     def _validate_title(self, title: str) -> str:
         """Валидация названия вакансии."""
@@ -46,26 +202,13 @@ class Vacancy:
             raise ValueError("URL вакансии должен быть непустой строкой")
         return url.strip()
 
-    def _validate_salary(self, salary: Optional[Dict[str, Any]]) -> int:
+    def _validate_salary(
+        self,
+        salary: Optional[Dict[str, Any]],
+        rates: Optional[Dict[str, float]] = None,
+    ) -> int:
         """Валидация и обработка зарплаты."""
-        if salary is None:
-            return 0
-
-        # Извлекаем зарплату из структуры hh.ru
-        if isinstance(salary, dict):
-            # Приоритет отдаем максимальной зарплате, если она указана
-            if salary.get("to") is not None:
-                return salary["to"]
-            elif salary.get("from") is not None:
-                return salary["from"]
-            else:
-                return 0
-
-        # Если зарплата передана как число
-        if isinstance(salary, (int, float)):
-            return int(salary)
-
-        return 0
+        return salary_to_int(salary, rates)
 
     def _validate_description(self, description: str) -> str:
         """Валидация описания вакансии."""
@@ -111,9 +254,12 @@ class Vacancy:
 
     def __str__(self) -> str:
         """Строковое представление вакансии."""
-        salary_str = (
-            f"{self.salary:,} руб." if self.salary > 0 else "Зарплата не указана"
-        )
+        if self.salary <= 0:
+            salary_str = "Зарплата не указана"
+        elif self.currency and self.currency != RUB_CURRENCY:
+            salary_str = f"{self.salary:,} {self.currency}"
+        else:
+            salary_str = f"{self.salary:,} руб."
         return f"{self.title} | {self.company} | {salary_str}"
 
     def __repr__(self) -> str:
@@ -121,40 +267,285 @@ class Vacancy:
         return f"Vacancy(title='{self.title}', salary={self.salary})"
 
     @staticmethod
-    def cast_to_object_list(vacancies_json: List[Dict[str, Any]]) -> List["Vacancy"]:
+    def cast_to_object_list(
+        vacancies_json: Iterable[Dict[str, Any]],
+        report: Optional["ConversionReport"] = None,
+        rates: Optional[Dict[str, float]] = None,
+    ) -> List["Vacancy"]:
         """
         Преобразование JSON-данных в список объектов Vacancy.
 
         Args:
-            vacancies_json (List[Dict[str, Any]]): Список вакансий в формате JSON
+            vacancies_json (Iterable[Dict[str, Any]]): Вакансии в формате JSON
+            report (Optional[ConversionReport]): Отчет, в который записываются
+                отброшенные вакансии (без него итог выводится одной строкой)
+            rates (Optional[Dict[str, float]]): Курсы валют hh.ru для пересчета
+                зарплат в рубли (ExchangeRates.get)
 
         Returns:
             List[Vacancy]: Список объектов Vacancy
         """
-        vacancies = []
+        # Объекты вакансий не образуют циклов ссылок, а сборщик мусора
+        # на больших пачках срабатывает постоянно и обходит всю кучу.
+        # Итератор (например, HeadHunterAPI.iter_vacancies) загружает данные
+        # по ходу перебора, и на время загрузки сборщик не отключается
+        with gc_paused(isinstance(vacancies_json, Sequence)):
+            return list(Vacancy.iter_from_json(vacancies_json, report, rates))
+
+    @staticmethod
+    def iter_from_json(
+        vacancies_json: Iterable[Dict[str, Any]],
+        report: Optional["ConversionReport"] = None,
+        rates: Optional[Dict[str, float]] = None,
+    ) -> Iterator["Vacancy"]:
+        """
+        Преобразовывать JSON-данные в объекты Vacancy по мере поступления.
+
+        Подходит для потоковой обработки результата HeadHunterAPI.iter_vacancies.
+        Данные проверяются один раз при разборе, поэтому объекты создаются
+        через from_trusted. Некорректные вакансии не прерывают обработку,
+        а учитываются в отчете.
+
+        Args:
+            vacancies_json (Iterable[Dict[str, Any]]): Вакансии в формате JSON
+            report (Optional[ConversionReport]): Отчет, в который записываются
+                отброшенные вакансии (без него итог выводится одной строкой
+                после обработки всех данных)
+            rates (Optional[Dict[str, float]]): Курсы валют hh.ru для пересчета
+                зарплат в рубли (ExchangeRates.get)
+
+        Yields:
+            Vacancy: Объект вакансии
+        """
+        own_report = report is None
+        if own_report:
+            report = ConversionReport()
 
         for vacancy_data in vacancies_json:
-            try:
-                # Извлекаем данные из структуры hh.ru
-                title = vacancy_data.get("name", "")
-                url = vacancy_data.get("alternate_url", "")
-                salary = vacancy_data.get("salary")
-                description = vacancy_data.get("snippet", {}).get("requirement", "")
-                requirements = vacancy_data.get("snippet", {}).get("requirement", "")
-                company = vacancy_data.get("employer", {}).get("name", "")
-
-                vacancy = Vacancy(
-                    title=title,
-                    url=url,
-                    salary=salary,
-                    description=description,
-                    requirements=requirements,
-                    company=company,
-                )
-                vacancies.append(vacancy)
-
-            except Exception as e:
-                print(f"Ошибка при создании объекта вакансии: {e}")
+            fields = parse_vacancy_json(vacancy_data, rates)
+            if isinstance(fields, str):
+                report.reject(fields, vacancy_data)
                 continue
+            report.converted += 1
+            yield Vacancy.from_trusted(*fields)
+
+        if own_report and report.rejected_count:
+            print(report)
+
+
+class ConversionReport:
+    """
+    Итог преобразования вакансий из формата hh.ru.
+    Хранит число принятых вакансий, число отброшенных по каждой причине
+    и несколько примеров отброшенных данных.
+    """
+
+    def __init__(self, max_samples: int = 5):
+        """
+        Инициализация отчета.
+
+        Args:
+            max_samples (int): Сколько отброшенных вакансий сохранить как примеры
+        """
+        self.max_samples = max_samples
+        self.converted = 0
+        self.rejected: Dict[str, int] = {}
+        self.samples: List[Dict[str, Any]] = []
+
+    @property
+    def rejected_count(self) -> int:
+        """Общее число отброшенных вакансий."""
+        return sum(self.rejected.values())
+
+    @property
+    def total(self) -> int:
+        """Общее число обработанных вакансий."""
+        return self.converted + self.rejected_count
+
+    def reject(self, reason: str, vacancy_data: Any):
+        """Учесть отброшенную вакансию."""
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append({"reason": reason, "data": vacancy_data})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Отчет в виде словаря."""
+        return {
+            "total": self.total,
+            "converted": self.converted,
+            "rejected": dict(self.rejected),
+            "samples": list(self.samples),
+        }
+
+    def __str__(self) -> str:
+        """Краткий итог преобразования."""
+        summary = f"Преобразовано вакансий: {self.converted} из {self.total}"
+        if self.rejected:
+            reasons = "; ".join(
+                f"{reason} — {count}" for reason, count in self.rejected.items()
+            )
+            summary += f". Отброшено: {self.rejected_count} ({reasons})"
+        return summary
+
+
+def identity_key(
+    hh_id: Optional[str], url: Optional[str], title: Optional[str]
+) -> Tuple[str, ...]:
+    """
+    Ключ идентичности вакансии — единое правило для Vacancy и хранилищ.
+
+    Вакансия определяется идентификатором hh.ru. Если он не сохранен
+    (данные, записанные до его появления), идентификатор берется из ссылки
+    на вакансию hh.ru, как в DBManager.backfill_hh_ids. Остальные вакансии
+    определяются ссылкой с названием.
+
+    Args:
+        hh_id (Optional[str]): Идентификатор вакансии на hh.ru
+        url (Optional[str]): Ссылка на вакансию
+        title (Optional[str]): Название вакансии
+
+    Returns:
+        Tuple[str, ...]: ("hh", id) или ("url", url, title)
+    """
+    if not hh_id and url:
+        match = _HH_VACANCY_URL.search(url)
+        hh_id = match.group(1) if match else None
+    if hh_id:
+        return ("hh", str(hh_id))
+    return ("url", url, title)
+
+
+@contextmanager
+def gc_paused(active: bool = True):
+    """
+    Приостановить циклический сборщик мусора на время массового создания.
+
+    Args:
+        active (bool): Приостанавливать ли сборщик (False — ничего не делать)
+    """
+    if not active:
+        yield
+        return
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def normalize_salary(
+    salary: Any, rates: Optional[Dict[str, float]] = None
+) -> Optional[Salary]:
+    """
+    Зарплата hh.ru, при заданных курсах пересчитанная в рубли.
+
+    Args:
+        salary (Any): Зарплата в формате hh.ru
+        rates (Optional[Dict[str, float]]): Курсы валют hh.ru
+
+    Returns:
+        Optional[Salary]: Зарплата или None, если она не указана
+    """
+    result = Salary.from_json(salary)
+    if result is not None and rates:
+        result = result.in_rub(rates)
+    return result
+
+
+def salary_to_int(salary: Any, rates: Optional[Dict[str, float]] = None) -> int:
+    """
+    Привести зарплату hh.ru к одному числу.
+
+    Приоритет отдается максимальной зарплате, если она указана (Salary.value).
+    Все способы создания вакансий приводят зарплату этой функцией или
+    через Salary, поэтому вакансии сравниваются по одному правилу.
+
+    Args:
+        salary (Any): Зарплата в формате hh.ru, число или None
+        rates (Optional[Dict[str, float]]): Курсы валют hh.ru; если заданы,
+            зарплата в другой валюте пересчитывается в рубли
+
+    Returns:
+        int: Зарплата (0 — зарплата не указана)
+    """
+    # Извлекаем зарплату из структуры hh.ru
+    if isinstance(salary, dict):
+        result = normalize_salary(salary, rates)
+        return result.value if result is not None else 0
+
+    # Если зарплата передана как число
+    if isinstance(salary, (int, float)) and not isinstance(salary, bool):
+        return int(salary)
+
+    return 0
+
+
+def parse_vacancy_json(
+    vacancy_data: Any, rates: Optional[Dict[str, float]] = None
+) -> Union[Tuple[Any, ...], str]:
+    """
+    Проверить вакансию в формате hh.ru и извлечь поля для Vacancy.from_trusted.
+
+    Применяет те же правила, что и конструктор Vacancy, но не выбрасывает
+    исключения: для некорректных данных возвращается причина отказа.
+
+    Args:
+        vacancy_data (Any): Вакансия в формате JSON
+        rates (Optional[Dict[str, float]]): Курсы валют hh.ru; если заданы,
+            зарплата пересчитывается в рубли
+
+    Returns:
+        Union[Tuple[Any, ...], str]: Поля (title, url, salary, description,
+            requirements, company, key_skills, experience, salary_range,
+            hh_id, employer_id) или причина отказа
+    """
+    if not isinstance(vacancy_data, dict):
+        return "Вакансия должна быть объектом JSON"
+
+    title = vacancy_data.get("name")
+    if not title or not isinstance(title, str):
+        return "Название вакансии должно быть непустой строкой"
+    url = vacancy_data.get("alternate_url")
+    if not url or not isinstance(url, str):
+        return "URL вакансии должен быть непустой строкой"
+
+    # Извлекаем данные из структуры hh.ru
+    snippet = vacancy_data.get("snippet")
+    requirements = snippet.get("requirement") if isinstance(snippet, dict) else None
+    requirements = requirements if isinstance(requirements, str) else ""
+    # Полное описание есть только у дополненных вакансий
+    description = vacancy_data.get("description") or requirements
+    description = (
+        description.strip()
+        if description and isinstance(description, str)
+        else "Описание не указано"
+    )
+    employer = vacancy_data.get("employer")
+    if isinstance(employer, dict):
+        company = employer.get("name") or ""
+        employer_id = employer.get("id")
+    else:
+        company, employer_id = "", None
+    experience = vacancy_data.get("experience") or ""
+    if isinstance(experience, dict):
+        experience = experience.get("name", "")
+    key_skills = vacancy_data.get("key_skills")
+    hh_id = vacancy_data.get("id")
+    salary = normalize_salary(vacancy_data.get("salary"), rates)
 
-        return vacancies
+    # Компании, опыт, навыки и требования в выдаче сильно повторяются
+    return (
+        title.strip(),
+        url.strip(),
+        salary.value if salary else 0,
+        description,
+        intern_value(requirements),
+        intern_value(company),
+        intern_all(key_skills) if isinstance(key_skills, (list, tuple)) else None,
+        intern_value(experience),
+        salary,
+        str(hh_id) if hh_id else None,
+        intern_value(str(employer_id)) if employer_id else None,
+    )
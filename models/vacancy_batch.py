@@ -0,0 +1,447 @@
+import copy
+from typing import List, Dict, Any, Optional, Iterable, Sequence
+import numpy as np
+from models.salary import Salary, RUB_CURRENCY
+from models.vacancy import (
+    Vacancy,
+    ConversionReport,
+    gc_paused,
+    parse_vacancy_json,
+)
+
+
+class VacancyBatch:
+    """
+    Колоночное представление набора вакансий.
+    Зарплаты хранятся в массивах NumPy, текстовые поля — в массивах
+    объектов, поэтому фильтрация по зарплате, выбор топ-N, статистика
+    и пересчет зарплат в рубли выполняются векторно, без обхода объектов
+    Vacancy.
+    """
+
+    def __init__(
+        self,
+        titles: Sequence[str],
+        urls: Sequence[str],
+        salaries: Sequence[int],
+        descriptions: Sequence[str],
+        requirements: Optional[Sequence[str]] = None,
+        companies: Optional[Sequence[str]] = None,
+        key_skills: Optional[Sequence[Iterable[str]]] = None,
+        experience: Optional[Sequence[str]] = None,
+        salary_ranges: Optional[Sequence[Optional[Salary]]] = None,
+        hh_ids: Optional[Sequence[Optional[str]]] = None,
+        employer_ids: Optional[Sequence[Optional[str]]] = None,
+    ):
+        """
+        Инициализация набора из готовых колонок одинаковой длины.
+
+        Args:
+            titles (Sequence[str]): Названия вакансий
+            urls (Sequence[str]): Ссылки на вакансии
+            salaries (Sequence[int]): Зарплаты (0 — зарплата не указана)
+            descriptions (Sequence[str]): Описания вакансий
+            requirements (Optional[Sequence[str]]): Требования к кандидату
+            companies (Optional[Sequence[str]]): Названия компаний
+            key_skills (Optional[Sequence[Iterable[str]]]): Ключевые навыки
+            experience (Optional[Sequence[str]]): Требуемый опыт работы
+            salary_ranges (Optional[Sequence[Optional[Salary]]]): Зарплаты
+                с границами и валютой (раскладываются по колонкам salary_from,
+                salary_to, currencies, gross)
+            hh_ids (Optional[Sequence[Optional[str]]]): Идентификаторы hh.ru
+            employer_ids (Optional[Sequence[Optional[str]]]): Идентификаторы
+                работодателей на hh.ru
+        """
+        size = len(titles)
+        self.titles = _object_column(titles)
+        self.urls = _object_column(urls)
+        self.salaries = np.asarray(salaries, dtype=np.int64).reshape(size)
+        self.descriptions = _object_column(descriptions)
+        self.requirements = _object_column(requirements, size, "")
+        self.companies = _object_column(companies, size, "")
+        self.key_skills = _object_column(
+            (
+                [tuple(skills) for skills in key_skills]
+                if key_skills is not None
+                else None
+            ),
+            size,
+            (),
+        )
+        self.experience = _object_column(experience, size, "")
+        self.hh_ids = _object_column(hh_ids, size, None)
+        self.employer_ids = _object_column(employer_ids, size, None)
+
+        # Границы зарплаты; NaN — граница не указана
+        self.salary_from = np.full(size, np.nan)
+        self.salary_to = np.full(size, np.nan)
+        self.currencies = _object_column(None, size, RUB_CURRENCY)
+        self.gross = _object_column(None, size, None)
+        for row, salary in enumerate(salary_ranges or ()):
+            if salary is None:
+                continue
+            if salary.salary_from is not None:
+                self.salary_from[row] = salary.salary_from
+            if salary.salary_to is not None:
+                self.salary_to[row] = salary.salary_to
+            self.currencies[row] = salary.currency
+            self.gross[row] = salary.gross
+
+        for name in ("urls", "descriptions", "hh_ids", "employer_ids"):
+            if len(getattr(self, name)) != size:
+                raise ValueError(f"Колонка {name} не совпадает по длине с titles")
+
+    @property
+    def has_salary(self) -> np.ndarray:
+        """Маска вакансий с указанной зарплатой."""
+        return self.salaries > 0
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "VacancyBatch":
+        """
+        Собрать набор из объектов Vacancy.
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии
+
+        Returns:
+            VacancyBatch: Колоночный набор вакансий
+        """
+        vacancies = list(vacancies)
+        return cls(
+            titles=[v.title for v in vacancies],
+            urls=[v.url for v in vacancies],
+            salaries=[v.salary for v in vacancies],
+            descriptions=[v.description for v in vacancies],
+            requirements=[v.requirements for v in vacancies],
+            companies=[v.company for v in vacancies],
+            key_skills=[v.key_skills for v in vacancies],
+            experience=[v.experience for v in vacancies],
+            salary_ranges=[v.salary_range for v in vacancies],
+            hh_ids=[v.hh_id for v in vacancies],
+            employer_ids=[v.employer_id for v in vacancies],
+        )
+
+    @classmethod
+    def from_json(
+        cls,
+        vacancies_json: Iterable[Dict[str, Any]],
+        report: Optional[ConversionReport] = None,
+        rates: Optional[Dict[str, float]] = None,
+    ) -> "VacancyBatch":
+        """
+        Собрать набор из вакансий в формате hh.ru без создания объектов Vacancy.
+
+        Принимает те же данные, что и Vacancy.cast_to_object_list, и применяет
+        те же правила: некорректные вакансии пропускаются и учитываются
+        в отчете.
+
+        Args:
+            vacancies_json (Iterable[Dict[str, Any]]): Вакансии в формате JSON
+            report (Optional[ConversionReport]): Отчет об отброшенных вакансиях
+                (без него итог выводится одной строкой)
+            rates (Optional[Dict[str, float]]): Курсы валют hh.ru; если заданы,
+                зарплаты пересчитываются в рубли сразу для всего набора
+
+        Returns:
+            VacancyBatch: Колоночный набор вакансий
+        """
+        own_report = report is None
+        if own_report:
+            report = ConversionReport()
+
+        rows = []
+        # Сборщик приостанавливается только для уже загруженных данных
+        # (см. Vacancy.cast_to_object_list)
+        with gc_paused(isinstance(vacancies_json, Sequence)):
+            for vacancy_data in vacancies_json:
+                fields = parse_vacancy_json(vacancy_data)
+                if isinstance(fields, str):
+                    report.reject(fields, vacancy_data)
+                    continue
+                rows.append(fields)
+            columns = [list(column) for column in zip(*rows)] or [[]] * 11
+        report.converted += len(rows)
+        if own_report and report.rejected_count:
+            print(report)
+
+        (
+            titles,
+            urls,
+            salaries,
+            descriptions,
+            requirements,
+            companies,
+            key_skills,
+            experience,
+            salary_ranges,
+            hh_ids,
+            employer_ids,
+        ) = columns
+        batch = cls(
+            titles=titles,
+            urls=urls,
+            salaries=salaries,
+            descriptions=descriptions,
+            requirements=requirements,
+            companies=companies,
+            key_skills=[skills or () for skills in key_skills],
+            experience=experience,
+            salary_ranges=salary_ranges,
+            hh_ids=hh_ids,
+            employer_ids=employer_ids,
+        )
+        return batch.normalize(rates) if rates else batch
+
+    def __len__(self) -> int:
+        return len(self.salaries)
+
+    def __getitem__(self, index: int) -> Vacancy:
+        """Получить вакансию по номеру строки."""
+        return Vacancy.from_trusted(
+            title=self.titles[index],
+            url=self.urls[index],
+            salary=int(self.salaries[index]),
+            description=self.descriptions[index],
+            requirements=self.requirements[index],
+            company=self.companies[index],
+            key_skills=self.key_skills[index],
+            experience=self.experience[index],
+            salary_range=self._salary_range(index),
+            hh_id=self.hh_ids[index],
+            employer_id=self.employer_ids[index],
+        )
+
+    def _salary_range(self, index: int) -> Optional[Salary]:
+        """Собрать зарплату строки из колонок."""
+        salary_from = self.salary_from[index]
+        salary_to = self.salary_to[index]
+        if np.isnan(salary_from) and np.isnan(salary_to):
+            return None
+        return Salary(
+            None if np.isnan(salary_from) else int(salary_from),
+            None if np.isnan(salary_to) else int(salary_to),
+            self.currencies[index],
+            self.gross[index],
+        )
+
+    def take(self, indices) -> "VacancyBatch":
+        """
+        Выбрать строки по массиву номеров или булевой маске.
+
+        Args:
+            indices: Номера строк или булева маска
+
+        Returns:
+            VacancyBatch: Новый набор из выбранных строк
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            # Номера строк считаются один раз, а не для каждой колонки
+            indices = np.flatnonzero(indices)
+        batch = self.__class__.__new__(self.__class__)
+        for name in _COLUMNS:
+            setattr(batch, name, getattr(self, name)[indices])
+        return batch
+
+    def normalize(self, rates: Dict[str, float]) -> "VacancyBatch":
+        """
+        Пересчитать зарплаты в рубли по курсам валют hh.ru.
+
+        Курс для каждой строки берется по коду валюты одним обращением
+        к массиву, пересчет выполняется для всего набора сразу. Строки
+        с неизвестной валютой остаются без изменений.
+
+        Args:
+            rates (Dict[str, float]): Курсы валют (ExchangeRates.get)
+
+        Returns:
+            VacancyBatch: Набор с зарплатами в рублях
+        """
+        codes, inverse = np.unique(self.currencies.astype(str), return_inverse=True)
+        table = np.array(
+            [
+                1.0 if code == RUB_CURRENCY else rates.get(code) or np.nan
+                for code in codes
+            ]
+        )
+        row_rates = table[inverse]
+        known = ~np.isnan(row_rates)
+        divisor = np.where(known, row_rates, 1.0)
+
+        batch = copy.copy(self)
+        batch.salary_from = np.rint(self.salary_from / divisor)
+        batch.salary_to = np.rint(self.salary_to / divisor)
+        batch.salaries = np.where(
+            ~np.isnan(batch.salary_to),
+            batch.salary_to,
+            np.where(~np.isnan(batch.salary_from), batch.salary_from, self.salaries),
+        ).astype(np.int64)
+        batch.currencies = np.where(known, RUB_CURRENCY, self.currencies).astype(
+            object
+        )
+        return batch
+
+    def filter_salary(
+        self, min_salary: int = 0, max_salary: Optional[int] = None
+    ) -> "VacancyBatch":
+        """
+        Отобрать вакансии с зарплатой в диапазоне [min_salary, max_salary].
+
+        Args:
+            min_salary (int): Нижняя граница
+            max_salary (Optional[int]): Верхняя граница (None — без ограничения)
+
+        Returns:
+            VacancyBatch: Вакансии из диапазона
+        """
+        return self.take(salary_mask(self.salaries, min_salary, max_salary))
+
+    def top(self, top_n: int) -> "VacancyBatch":
+        """
+        Получить топ N вакансий по зарплате (по убыванию).
+
+        Сначала N наибольших зарплат выбираются через argpartition, затем
+        сортируются только они. Порядок вакансий с одинаковой зарплатой
+        сохраняется, как и у sorted().
+
+        Args:
+            top_n (int): Количество вакансий
+
+        Returns:
+            VacancyBatch: Топ N вакансий
+        """
+        return self.take(top_positions(self.salaries, top_n))
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Получить статистику по зарплатам.
+
+        Returns:
+            Dict[str, int]: Те же ключи, что и у get_vacancies_statistics
+        """
+        return salary_statistics(self.salaries)
+
+    def to_vacancies(self) -> List[Vacancy]:
+        """
+        Преобразовать набор в список объектов Vacancy (например, для вывода).
+
+        Returns:
+            List[Vacancy]: Вакансии в порядке строк набора
+        """
+        with gc_paused():
+            return [
+                Vacancy.from_trusted(*row)
+                for row in zip(
+                    self.titles.tolist(),
+                    self.urls.tolist(),
+                    self.salaries.tolist(),
+                    self.descriptions.tolist(),
+                    self.requirements.tolist(),
+                    self.companies.tolist(),
+                    self.key_skills.tolist(),
+                    self.experience.tolist(),
+                    map(self._salary_range, range(len(self))),
+                    self.hh_ids.tolist(),
+                    self.employer_ids.tolist(),
+                )
+            ]
+
+
+_COLUMNS = (
+    "titles",
+    "urls",
+    "salaries",
+    "descriptions",
+    "requirements",
+    "companies",
+    "key_skills",
+    "experience",
+    "hh_ids",
+    "employer_ids",
+    "salary_from",
+    "salary_to",
+    "currencies",
+    "gross",
+)
+
+
+def _object_column(
+    values: Optional[Sequence[Any]], size: int = 0, default: Any = ""
+) -> np.ndarray:
+    """Создать одномерный массив объектов (значения не разворачиваются)."""
+    if values is None:
+        values = [default] * size
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def salary_column(vacancies: Sequence[Vacancy]) -> np.ndarray:
+    """
+    Зарплаты списка вакансий одним массивом.
+
+    Позволяет применять векторные операции набора к обычному списку
+    объектов Vacancy, не собирая остальные колонки.
+    """
+    return np.fromiter(
+        (vacancy.salary for vacancy in vacancies), dtype=np.int64, count=len(vacancies)
+    )
+
+
+def salary_mask(
+    salaries: np.ndarray, min_salary: int = 0, max_salary: Optional[int] = None
+) -> np.ndarray:
+    """Маска зарплат в диапазоне [min_salary, max_salary]."""
+    mask = salaries >= min_salary
+    if max_salary is not None:
+        mask &= salaries <= max_salary
+    return mask
+
+
+def top_positions(salaries: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    Номера N наибольших зарплат по убыванию (см. VacancyBatch.top).
+
+    Args:
+        salaries (np.ndarray): Зарплаты
+        top_n (int): Количество номеров
+
+    Returns:
+        np.ndarray: Номера зарплат; равные зарплаты идут в исходном порядке
+    """
+    size = len(salaries)
+    top_n = max(0, min(top_n, size))
+    if top_n == 0:
+        return np.arange(0)
+    if top_n < size:
+        # argpartition выбирает из равных на границе произвольные, поэтому
+        # равные N-й зарплате берутся первыми по порядку
+        threshold = np.partition(salaries, size - top_n)[size - top_n]
+        above = np.flatnonzero(salaries > threshold)
+        equal = np.flatnonzero(salaries == threshold)[: top_n - len(above)]
+        candidates = np.sort(np.concatenate([above, equal]))
+    else:
+        candidates = np.arange(size)
+    order = np.argsort(-salaries[candidates], kind="stable")
+    return candidates[order]
+
+
+def salary_statistics(salaries: np.ndarray) -> Dict[str, int]:
+    """
+    Статистика по зарплатам (0 — зарплата не указана).
+
+    Returns:
+        Dict[str, int]: Те же ключи, что и у get_vacancies_statistics
+    """
+    with_salary = salaries[salaries > 0]
+    stats = {
+        "total_count": len(salaries),
+        "with_salary_count": len(with_salary),
+        "avg_salary": 0,
+        "max_salary": 0,
+        "min_salary": 0,
+    }
+    if len(with_salary):
+        stats["avg_salary"] = int(with_salary.sum()) // len(with_salary)
+        stats["max_salary"] = int(with_salary.max())
+        stats["min_salary"] = int(with_salary.min())
+    return stats
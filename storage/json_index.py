@@ -0,0 +1,252 @@
+import json
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any, Optional, Tuple
+from .records import record_key
+from utils.files import atomic_write
+
+# Версия формата файла индексов
+INDEX_VERSION = 3
+
+Key = Tuple[str, ...]
+
+
+def _salary(record: Dict[str, Any]) -> int:
+    return record.get("salary") or 0
+
+
+def _company(record: Dict[str, Any]) -> str:
+    return (record.get("company") or "").lower()
+
+
+def _key_name(key: Key) -> str:
+    """Строковый ключ индекса для ключа идентичности."""
+    # В ссылке и названии не бывает символа NUL, поэтому ключ однозначен
+    return "\0".join(key)
+
+
+class JSONIndex:
+    """
+    Вторичные индексы записей файла JSONSaver.
+
+    Хранит номера записей (позиции в массиве файла):
+    - отсортированный по зарплате массив для поиска диапазона бинарным поиском;
+    - компания (в нижнем регистре) → номера ее записей;
+    - ключ идентичности (см. record_key) → номер записи;
+    - байтовые смещения записей в файле, если они известны (файл записан
+      потоково, см. iter_record_offsets): по ним большой файл читается
+      только в нужных местах.
+    """
+
+    # Критерии get_vacancies, для которых индексы сужают поиск
+    CRITERIA = ("min_salary", "max_salary", "company")
+
+    # Поля записи, по которым строятся индексы
+    FIELDS = ("salary", "company", "hh_id", "url", "title")
+
+    def __init__(self):
+        self.count = 0
+        self.salaries: List[int] = []
+        self.positions: List[int] = []
+        self.companies: Dict[str, List[int]] = {}
+        self.keys: Dict[str, int] = {}
+        self.offsets: Optional[List[int]] = None
+
+    @classmethod
+    def build(
+        cls, records: List[Dict[str, Any]], offsets: Optional[List[int]] = None
+    ) -> "JSONIndex":
+        """
+        Построить индексы по записям.
+
+        Args:
+            records (List[Dict[str, Any]]): Записи в порядке файла
+            offsets (Optional[List[int]]): Байтовые смещения записей в файле
+
+        Returns:
+            JSONIndex: Индексы
+        """
+        index = cls()
+        index.count = len(records)
+        index.offsets = offsets
+        order = sorted(range(len(records)), key=lambda i: _salary(records[i]))
+        index.positions = order
+        index.salaries = [_salary(records[i]) for i in order]
+        for position, record in enumerate(records):
+            index.companies.setdefault(_company(record), []).append(position)
+            index.keys.setdefault(_key_name(record_key(record)), position)
+        return index
+
+    def find(self, key: Key) -> Optional[int]:
+        """Номер первой записи с ключом идентичности (None, если нет)."""
+        return self.keys.get(_key_name(key))
+
+    def append(self, record: Dict[str, Any], offset: Optional[int] = None):
+        """
+        Учесть запись, добавленную в конец файла.
+
+        Args:
+            record (Dict[str, Any]): Запись
+            offset (Optional[int]): Байтовое смещение записи (без него
+                смещения файла считаются неизвестными)
+        """
+        position = self.count
+        salary = _salary(record)
+        # Новая запись последняя, поэтому среди равных зарплат встает в конец
+        i = bisect_right(self.salaries, salary)
+        self.salaries.insert(i, salary)
+        self.positions.insert(i, position)
+        self.companies.setdefault(_company(record), []).append(position)
+        self.keys.setdefault(_key_name(record_key(record)), position)
+        if self.offsets is not None:
+            if offset is None:
+                self.offsets = None
+            else:
+                self.offsets.append(offset)
+        self.count += 1
+
+    def remove(self, position: int, record: Dict[str, Any]):
+        """
+        Учесть удаление записи с номером position (следующие сдвигаются).
+
+        Номера следующих записей уменьшаются на месте. Смещения следующих
+        записей зависят от того, как переписан файл, поэтому сбрасываются:
+        их задает тот, кто файл переписал.
+        """
+        salary = _salary(record)
+        lo = bisect_left(self.salaries, salary)
+        hi = bisect_right(self.salaries, salary)
+        i = self.positions.index(position, lo, hi)
+        del self.salaries[i]
+        del self.positions[i]
+        self.positions[:] = [p - (p > position) for p in self.positions]
+
+        company = _company(record)
+        self.companies[company].remove(position)
+        if not self.companies[company]:
+            del self.companies[company]
+        for positions in self.companies.values():
+            # Номера записей компании идут по возрастанию
+            i = bisect_right(positions, position)
+            if i < len(positions):
+                positions[i:] = [p - 1 for p in positions[i:]]
+
+        keys = self.keys
+        name = _key_name(record_key(record))
+        if keys.get(name) == position:
+            del keys[name]
+        for name, p in keys.items():
+            if p > position:
+                keys[name] = p - 1
+        self.offsets = None
+        self.count -= 1
+
+    def salary_positions(
+        self, min_salary: Optional[int] = None, max_salary: Optional[int] = None
+    ) -> List[int]:
+        """Номера записей с зарплатой в диапазоне [min_salary, max_salary]."""
+        lo = bisect_left(self.salaries, min_salary) if min_salary else 0
+        hi = bisect_right(self.salaries, max_salary) if max_salary else self.count
+        return self.positions[lo:hi]
+
+    def company_positions(self, company: str) -> List[int]:
+        """Номера записей, в названии компании которых есть подстрока company."""
+        company = company.lower()
+        return [
+            position
+            for name, positions in self.companies.items()
+            if company in name
+            for position in positions
+        ]
+
+    def candidates(self, **kwargs) -> Optional[List[int]]:
+        """
+        Номера записей, которые могут подойти под критерии get_vacancies.
+
+        Использует индексы зарплаты и компании; остальные критерии нужно
+        проверить на самих записях.
+
+        Returns:
+            Optional[List[int]]: Номера в порядке файла или None, если
+                индексы к критериям неприменимы
+        """
+        result: Optional[List[int]] = None
+        if kwargs.get("min_salary") or kwargs.get("max_salary"):
+            result = self.salary_positions(
+                kwargs.get("min_salary"), kwargs.get("max_salary")
+            )
+        if kwargs.get("company"):
+            positions = self.company_positions(kwargs["company"])
+            if result is None:
+                result = positions
+            else:
+                selected = set(positions)
+                result = [p for p in result if p in selected]
+        return None if result is None else sorted(result)
+
+    def to_json(self, signature: Tuple[int, ...]) -> Dict[str, Any]:
+        """Индексы в формате файла."""
+        return {
+            "version": INDEX_VERSION,
+            "signature": list(signature),
+            "count": self.count,
+            "salaries": self.salaries,
+            "positions": self.positions,
+            "companies": self.companies,
+            "keys": self.keys,
+            "offsets": self.offsets,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "JSONIndex":
+        """Восстановить индексы из формата файла."""
+        index = cls()
+        index.count = data["count"]
+        index.salaries = data["salaries"]
+        index.positions = data["positions"]
+        index.companies = data["companies"]
+        index.keys = data["keys"]
+        index.offsets = data["offsets"]
+        return index
+
+    def save(self, filename: str, signature: Tuple[int, ...]):
+        """
+        Атомарно сохранить индексы в файл.
+
+        Args:
+            filename (str): Имя файла индексов
+            signature (Tuple[int, ...]): Сигнатура файла данных, для которого
+                построены индексы
+        """
+        # json.dumps кодирует целиком на C, json.dump — по частям на Python
+        text = json.dumps(
+            self.to_json(signature), ensure_ascii=False, separators=(",", ":")
+        )
+        # Индексы, потерянные при сбое, строятся заново (см. load)
+        atomic_write(filename, lambda f: f.write(text), fsync=False)
+
+    @classmethod
+    def load(
+        cls, filename: str, signature: Tuple[int, ...]
+    ) -> Optional["JSONIndex"]:
+        """
+        Загрузить индексы, если они построены для файла с такой сигнатурой.
+
+        Args:
+            filename (str): Имя файла индексов
+            signature (Tuple[int, ...]): Текущая сигнатура файла данных
+
+        Returns:
+            Optional[JSONIndex]: Индексы или None, если файла нет, он
+                поврежден или устарел
+        """
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                data.get("version") != INDEX_VERSION
+                or tuple(data.get("signature", ())) != tuple(signature)
+            ):
+                return None
+            return cls.from_json(data)
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            return None
@@ -1,67 +1,389 @@
 import json
 import os
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
 from .base_storage import BaseStorage
-from models.vacancy import Vacancy
+from .json_index import JSONIndex
+from .json_stream import iter_record_offsets, iter_records, read_records
+from .records import (
+    record_filter,
+    record_to_vacancy,
+    vacancy_to_record,
+)
+from models.encoding import decode_records, encode_records, is_encoded
+from models.vacancy import Vacancy, gc_paused
+from utils.files import atomic_write
+
+# Файлы больше этого размера не держатся в памяти, а читаются и изменяются
+# потоково (около 30 тысяч вакансий в обычном формате)
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Разделитель записей при потоковой записи файла
+_SEPARATOR = b",\n  "
 
 
 class JSONSaver(BaseStorage):
     """
     Класс для сохранения вакансий в JSON-файл.
     Реализует интерфейс BaseStorage для работы с файловым хранилищем.
+
+    Прочитанные записи и созданные из них объекты Vacancy хранятся в памяти,
+    пока файл не изменится (проверяются время изменения, размер и inode),
+    поэтому повторные чтения неизмененного файла его не разбирают.
+    Файлы больше max_cache_bytes читаются потоково: записи разбираются
+    по одной и сразу фильтруются, так что память не зависит от размера файла.
+    Новые вакансии дописываются в конец такого файла, а при удалении файл
+    переписывается потоково. Исключение — хранилище со словарным
+    кодированием: словари стоят в начале файла, поэтому при записи он
+    загружается целиком.
+
+    Рядом с файлом хранятся индексы (<filename>.idx, см. JSONIndex): по ним
+    ищутся дубликаты при добавлении, удаляемая вакансия и кандидаты для
+    фильтров по зарплате и компании. Для больших файлов в обычном формате
+    индексы хранят и байтовые смещения записей, поэтому такие фильтры
+    читают из файла только кандидатов. Индексы обновляются при каждой
+    записи и строятся заново, если файла индексов нет или он
+    не соответствует файлу вакансий.
     """
 
-    def __init__(self, filename: str = "vacancies.json"):
+    def __init__(
+        self,
+        filename: str = "vacancies.json",
+        dictionary_encoding: bool = False,
+        max_cache_bytes: Optional[int] = DEFAULT_MAX_CACHE_BYTES,
+    ):
         """
         Инициализация JSON-хранилища.
 
         Args:
             filename (str): Имя файла для сохранения вакансий
+            dictionary_encoding (bool): Сохранять файл со словарным
+                кодированием повторяющихся полей (компания, опыт, требования,
+                навыки, префикс ссылки). Файлы в обоих форматах читаются
+                независимо от этого параметра
+            max_cache_bytes (Optional[int]): Файлы больше этого размера
+                не держатся в памяти, читаются и изменяются потоково
+                (None — без ограничения, 0 — не кэшировать)
         """
         self.filename = filename
+        self.dictionary_encoding = dictionary_encoding
+        self.max_cache_bytes = max_cache_bytes
+        self._snapshot_signature: Optional[Tuple[int, int, int]] = None
+        self._snapshot_records: Optional[List[Dict[str, Any]]] = None
+        self._snapshot_vacancies: Optional[List[Optional[Vacancy]]] = None
+        self._index: Optional[JSONIndex] = None
+        self._index_signature: Optional[Tuple[int, int, int]] = None
         self._ensure_file_exists()
 
+    @property
+    def index_filename(self) -> str:
+        """Имя файла индексов."""
+        return f"{self.filename}.idx"
+
     def _ensure_file_exists(self):
         """Создать файл, если он не существует."""
         if not os.path.exists(self.filename):
             with open(self.filename, "w", encoding="utf-8") as f:
                 json.dump([], f, ensure_ascii=False, indent=2)
 
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Время изменения, размер и inode файла (None, если файла нет)."""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _fits_cache(self, signature: Optional[Tuple[int, int, int]]) -> bool:
+        """Можно ли держать в памяти файл с такой сигнатурой."""
+        return signature is not None and (
+            self.max_cache_bytes is None or signature[1] <= self.max_cache_bytes
+        )
+
+    def _remember(
+        self,
+        signature: Optional[Tuple[int, int, int]],
+        records: List[Dict[str, Any]],
+    ):
+        """Запомнить содержимое файла, если оно укладывается в ограничение."""
+        if not self._fits_cache(signature):
+            self.invalidate_cache()
+            return
+        self._snapshot_signature = signature
+        self._snapshot_records = records
+        self._snapshot_vacancies = None
+
+    def invalidate_cache(self):
+        """Сбросить содержимое файла, хранящееся в памяти."""
+        self._snapshot_signature = None
+        self._snapshot_records = None
+        self._snapshot_vacancies = None
+        self._index = None
+        self._index_signature = None
+
     def _load_vacancies(self) -> List[Dict[str, Any]]:
-        """Загрузить вакансии из файла."""
+        """Загрузить вакансии из файла (или из памяти, если файл не менялся)."""
+        signature = self._file_signature()
+        if signature is not None and signature == self._snapshot_signature:
+            return list(self._snapshot_records)
+
         try:
             with open(self.filename, "r", encoding="utf-8") as f:
-                return json.load(f)
+                data = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             return []
+        records = decode_records(data) if is_encoded(data) else data
+        self._remember(signature, records)
+        return list(records)
+
+    def _get_index(
+        self,
+        signature: Optional[Tuple[int, int, int]],
+        records: List[Dict[str, Any]],
+    ) -> JSONIndex:
+        """Индексы записей: из памяти, из файла индексов или построенные заново."""
+        index = self._index
+        if signature is None:
+            index = None
+        elif signature != self._index_signature:
+            index = JSONIndex.load(self.index_filename, signature)
+        if index is None or index.count != len(records):
+            index = JSONIndex.build(records)
+            self._store_index(index, signature)
+        else:
+            self._index, self._index_signature = index, signature
+        return index
+
+    def _store_index(
+        self, index: JSONIndex, signature: Optional[Tuple[int, int, int]]
+    ):
+        """Запомнить индексы и сохранить их в файл индексов."""
+        self._index, self._index_signature = index, signature
+        if signature is None:
+            return
+        try:
+            index.save(self.index_filename, signature)
+        except OSError as e:
+            print(f"Ошибка при сохранении индексов: {e}")
 
-    def _save_vacancies(self, vacancies_data: List[Dict[str, Any]]):
-        """Сохранить вакансии в файл."""
-        with open(self.filename, "w", encoding="utf-8") as f:
-            json.dump(vacancies_data, f, ensure_ascii=False, indent=2)
-
-    def _vacancy_to_dict(self, vacancy: Vacancy) -> Dict[str, Any]:
-        """Преобразовать объект Vacancy в словарь."""
-        return {
-            "title": vacancy.title,
-            "url": vacancy.url,
-            "salary": vacancy.salary,
-            "description": vacancy.description,
-            "requirements": vacancy.requirements,
-            "company": vacancy.company,
-        }
-
-    def _dict_to_vacancy(self, vacancy_dict: Dict[str, Any]) -> Vacancy:
-        """Преобразовать словарь в объект Vacancy."""
-        return Vacancy(
-            title=vacancy_dict.get("title", ""),
-            url=vacancy_dict.get("url", ""),
-            salary=vacancy_dict.get("salary", 0),
-            description=vacancy_dict.get("description", ""),
-            requirements=vacancy_dict.get("requirements", ""),
-            company=vacancy_dict.get("company", ""),
+    def _stream_index(self, signature: Tuple[int, int, int]) -> JSONIndex:
+        """
+        Индексы файла, который не загружается в память целиком.
+
+        Для файла-массива индексы содержат смещения записей; индексы без
+        них (файл записывался целиком) строятся заново.
+        """
+        index = self._index
+        if index is None or signature != self._index_signature:
+            index = JSONIndex.load(self.index_filename, signature)
+        array = self._array_end() is not None
+        if index is None or (array and index.offsets is None):
+            # Для индексов нужны только несколько полей каждой записи
+            if array:
+                offsets, records = [], []
+                for offset, record in iter_record_offsets(self.filename):
+                    offsets.append(offset)
+                    records.append(
+                        {field: record.get(field) for field in JSONIndex.FIELDS}
+                    )
+                index = JSONIndex.build(records, offsets)
+            else:
+                index = JSONIndex.build(
+                    [
+                        {field: record.get(field) for field in JSONIndex.FIELDS}
+                        for record in iter_records(self.filename)
+                    ]
+                )
+            self._store_index(index, signature)
+        else:
+            self._index, self._index_signature = index, signature
+        return index
+
+    def _array_end(self) -> Optional[Tuple[int, bool]]:
+        """
+        Найти закрывающую скобку массива записей в конце файла.
+
+        Returns:
+            Optional[Tuple[int, bool]]: Смещение скобки и признак пустого
+                массива или None, если файл не является массивом записей
+        """
+        with open(self.filename, "rb") as f:
+            if not f.read(64).lstrip().startswith(b"["):
+                return None
+            size = f.seek(0, os.SEEK_END)
+            start = max(size - 4096, 0)
+            f.seek(start)
+            tail = f.read().rstrip()
+        before = tail[:-1].rstrip()
+        if not tail.endswith(b"]") or not before:
+            return None
+        return start + len(tail) - 1, before.endswith(b"[")
+
+    def _writes_in_place(self, signature: Optional[Tuple[int, int, int]]) -> bool:
+        """Изменять ли файл, не загружая все записи в память."""
+        return (
+            not self.dictionary_encoding
+            and signature is not None
+            and not self._fits_cache(signature)
+            and self._array_end() is not None
         )
 
+    def _append_vacancies(
+        self, vacancies: Iterable[Vacancy], signature: Tuple[int, int, int]
+    ) -> int:
+        """
+        Добавить вакансии в конец большого файла (см. add_vacancies).
+
+        Записи дописываются перед закрывающей скобкой массива, файл
+        не перезаписывается; их смещения попадают в индексы.
+        """
+        index = self._stream_index(signature)
+        end, empty = self._array_end()
+        prefix = b"\n  " if empty else _SEPARATOR
+        offset = end + len(prefix)
+        lines = []
+        for vacancy in vacancies:
+            if index.find(vacancy.key) is not None:
+                continue
+            record = vacancy_to_record(vacancy)
+            line = _dump_record(record).encode("utf-8")
+            index.append(record, offset)
+            lines.append(line)
+            offset += len(line) + len(_SEPARATOR)
+        if lines:
+            with open(self.filename, "r+b") as f:
+                f.seek(end)
+                f.write(prefix + _SEPARATOR.join(lines) + b"\n]")
+                f.truncate()
+            self._store_index(index, self._file_signature())
+        return len(lines)
+
+    def _delete_in_place(
+        self, vacancy: Vacancy, signature: Tuple[int, int, int]
+    ) -> bool:
+        """Удалить вакансию из большого файла, переписав его потоково."""
+        index = self._stream_index(signature)
+        position = index.find(vacancy.key)
+        if position is None:
+            return False
+
+        removed = None
+        offsets = []
+
+        def write(f):
+            nonlocal removed
+            separator = b"[\n  "
+            written = 0
+            for number, record in enumerate(iter_records(self.filename)):
+                if number == position:
+                    removed = record
+                    continue
+                line = _dump_record(record).encode("utf-8")
+                f.write(separator + line)
+                offsets.append(written + len(separator))
+                written += len(separator) + len(line)
+                separator = _SEPARATOR
+            f.write(b"\n]" if offsets else b"[]")
+
+        atomic_write(self.filename, write, binary=True)
+        index.remove(position, removed)
+        index.offsets = offsets
+        self._store_index(index, self._file_signature())
+        return True
+
+    def _load_indexed(self) -> Tuple[List[Dict[str, Any]], JSONIndex]:
+        """Загрузить записи файла вместе с их индексами."""
+        signature = self._file_signature()
+        records = self._load_vacancies()
+        return records, self._get_index(signature, records)
+
+    def _to_vacancy(self, index: int, record: Dict[str, Any]) -> Vacancy:
+        """
+        Получить объект Vacancy для записи с номером index.
+
+        Объекты для записей из памяти создаются один раз и переиспользуются
+        последующими запросами, пока файл не изменится.
+        """
+        records = self._snapshot_records
+        if records is None or index >= len(records) or records[index] is not record:
+            return record_to_vacancy(record)
+        if self._snapshot_vacancies is None:
+            self._snapshot_vacancies = [None] * len(records)
+        vacancy = self._snapshot_vacancies[index]
+        if vacancy is None:
+            vacancy = self._snapshot_vacancies[index] = record_to_vacancy(record)
+        return vacancy
+
+    def _matching_records(self, **kwargs) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Записи, соответствующие критериям, с их номерами в файле.
+
+        Критерии проверяются на словарях, до создания объектов Vacancy;
+        при фильтрах по зарплате и компании проверяются только кандидаты
+        из индексов. Файлы больше max_cache_bytes читаются потоково,
+        а кандидаты из них — по смещениям из индексов, если те известны.
+        """
+        matches = record_filter(**kwargs)
+        signature = self._file_signature()
+        indexed = any(kwargs.get(name) for name in JSONIndex.CRITERIA)
+        if signature is not None and not self._fits_cache(signature):
+            if indexed:
+                index = self._stream_index(signature)
+                if index.offsets is not None:
+                    positions = index.candidates(**kwargs)
+                    candidates = read_records(
+                        self.filename, [index.offsets[p] for p in positions]
+                    )
+                    return (
+                        (position, record)
+                        for position, record in zip(positions, candidates)
+                        if matches(record)
+                    )
+            records: Iterable[Dict[str, Any]] = iter_records(self.filename)
+        elif indexed:
+            records, index = self._load_indexed()
+            positions = index.candidates(**kwargs)
+            return (
+                (position, records[position])
+                for position in positions
+                if matches(records[position])
+            )
+        else:
+            records = self._load_vacancies()
+        return (
+            (index, record)
+            for index, record in enumerate(records)
+            if matches(record)
+        )
+
+    def _save_vacancies(
+        self,
+        vacancies_data: List[Dict[str, Any]],
+        index: Optional[JSONIndex] = None,
+    ):
+        """
+        Сохранить вакансии в файл.
+
+        Args:
+            vacancies_data (List[Dict[str, Any]]): Записи вакансий
+            index (Optional[JSONIndex]): Индексы этих записей (если не
+                переданы, строятся заново)
+        """
+        with open(self.filename, "w", encoding="utf-8") as f:
+            if self.dictionary_encoding:
+                json.dump(
+                    encode_records(vacancies_data),
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            else:
+                json.dump(vacancies_data, f, ensure_ascii=False, indent=2)
+        # Записанные данные уже известны, перечитывать файл не нужно
+        signature = self._file_signature()
+        self._remember(signature, list(vacancies_data))
+        self._store_index(index or JSONIndex.build(vacancies_data), signature)
+
     def add_vacancy(self, vacancy: Vacancy) -> bool:
         """
         Добавить вакансию в JSON-файл.
@@ -73,30 +395,35 @@ class JSONSaver(BaseStorage):
             bool: True если вакансия успешно добавлена
         """
         try:
-            vacancies_data = self._load_vacancies()
+            signature = self._file_signature()
+            if self._writes_in_place(signature):
+                return self._append_vacancies([vacancy], signature) == 1
+
+            vacancies_data, index = self._load_indexed()
 
             # Проверяем, не существует ли уже такая вакансия
-            vacancy_dict = self._vacancy_to_dict(vacancy)
-            for existing_vacancy in vacancies_data:
-                if (
-                    existing_vacancy.get("url") == vacancy.url
-                    and existing_vacancy.get("title") == vacancy.title
-                ):
-                    return False  # Вакансия уже существует
-
-            vacancies_data.append(vacancy_dict)
-            self._save_vacancies(vacancies_data)
+            if index.find(vacancy.key) is not None:
+                return False  # Вакансия уже существует
+
+            record = vacancy_to_record(vacancy)
+            vacancies_data.append(record)
+            index.append(record)
+            self._save_vacancies(vacancies_data, index)
             return True
 
         except Exception as e:
+            self.invalidate_cache()
             print(f"Ошибка при добавлении вакансии: {e}")
             return False
 
-    def get_vacancies(self, **kwargs) -> List[Vacancy]:
+    def get_vacancies(self, limit: Optional[int] = None, **kwargs) -> List[Vacancy]:
         """
         Получить вакансии из JSON-файла по указанным критериям.
 
+        Объекты Vacancy создаются только для записей, прошедших фильтры.
+
         Args:
+            limit (Optional[int]): Вернуть не больше limit первых вакансий
             **kwargs: Критерии для фильтрации:
                 - keyword: ключевое слово для поиска в описании
                 - min_salary: минимальная зарплата
@@ -107,36 +434,60 @@ class JSONSaver(BaseStorage):
             List[Vacancy]: Список вакансий, соответствующих критериям
         """
         try:
-            vacancies_data = self._load_vacancies()
-            vacancies = [self._dict_to_vacancy(v) for v in vacancies_data]
-
-            # Применяем фильтры
-            if kwargs.get("keyword"):
-                keyword = kwargs["keyword"].lower()
-                vacancies = [
-                    v
-                    for v in vacancies
-                    if keyword in v.description.lower() or keyword in v.title.lower()
-                ]
-
-            if kwargs.get("min_salary"):
-                min_salary = kwargs["min_salary"]
-                vacancies = [v for v in vacancies if v.salary >= min_salary]
-
-            if kwargs.get("max_salary"):
-                max_salary = kwargs["max_salary"]
-                vacancies = [v for v in vacancies if v.salary <= max_salary]
+            matches = islice(self._matching_records(**kwargs), limit)
+            with gc_paused():
+                return [self._to_vacancy(index, record) for index, record in matches]
+        except Exception as e:
+            print(f"Ошибка при получении вакансий: {e}")
+            return []
 
-            if kwargs.get("company"):
-                company = kwargs["company"].lower()
-                vacancies = [v for v in vacancies if company in v.company.lower()]
+    def get_vacancy_fields(
+        self, fields: Sequence[str], limit: Optional[int] = None, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить только указанные поля вакансий, не создавая объектов Vacancy.
 
-            return vacancies
+        Args:
+            fields (Sequence[str]): Нужные поля записи (title, url, salary,
+                company, ...)
+            limit (Optional[int]): Вернуть не больше limit первых вакансий
+            **kwargs: Критерии для фильтрации (как у get_vacancies)
 
+        Returns:
+            List[Dict[str, Any]]: Словари с указанными полями
+        """
+        try:
+            matches = islice(self._matching_records(**kwargs), limit)
+            return [
+                {field: record.get(field) for field in fields}
+                for _, record in matches
+            ]
         except Exception as e:
             print(f"Ошибка при получении вакансий: {e}")
             return []
 
+    def iter_vacancies(self, **kwargs) -> Iterator[Vacancy]:
+        """
+        Перебрать вакансии файла по одной, не загружая файл целиком.
+
+        Записи разбираются из файла (отображенного в память, где это возможно)
+        по мере перебора, записи, не подходящие под критерии, отбрасываются
+        до создания объектов Vacancy.
+
+        Args:
+            **kwargs: Критерии для фильтрации (как у get_vacancies)
+
+        Returns:
+            Iterator[Vacancy]: Вакансии, соответствующие критериям
+        """
+        matches = record_filter(**kwargs)
+        try:
+            for record in iter_records(self.filename):
+                if matches(record):
+                    yield record_to_vacancy(record)
+        except FileNotFoundError:
+            return
+
     def delete_vacancy(self, vacancy: Vacancy) -> bool:
         """
         Удалить вакансию из JSON-файла.
@@ -148,21 +499,23 @@ class JSONSaver(BaseStorage):
             bool: True если вакансия успешно удалена
         """
         try:
-            vacancies_data = self._load_vacancies()
+            signature = self._file_signature()
+            if self._writes_in_place(signature):
+                return self._delete_in_place(vacancy, signature)
+
+            vacancies_data, index = self._load_indexed()
 
             # Ищем вакансию для удаления
-            for i, existing_vacancy in enumerate(vacancies_data):
-                if (
-                    existing_vacancy.get("url") == vacancy.url
-                    and existing_vacancy.get("title") == vacancy.title
-                ):
-                    del vacancies_data[i]
-                    self._save_vacancies(vacancies_data)
-                    return True
+            position = index.find(vacancy.key)
+            if position is None:
+                return False  # Вакансия не найдена
 
-            return False  # Вакансия не найдена
+            index.remove(position, vacancies_data.pop(position))
+            self._save_vacancies(vacancies_data, index)
+            return True
 
         except Exception as e:
+            self.invalidate_cache()
             print(f"Ошибка при удалении вакансии: {e}")
             return False
 
@@ -180,18 +533,52 @@ class JSONSaver(BaseStorage):
             print(f"Ошибка при очистке файла: {e}")
             return False
 
-    def add_vacancies(self, vacancies: List[Vacancy]) -> int:
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> int:
         """
         Добавить несколько вакансий в JSON-файл.
 
+        Файл читается и записывается один раз на всю пачку (в файл больше
+        max_cache_bytes вакансии дописываются в конец), дубликаты (среди
+        сохраненных и внутри пачки) ищутся по индексу ключей идентичности
+        (JSONIndex).
+
         Args:
-            vacancies (List[Vacancy]): Список вакансий для добавления
+            vacancies (Iterable[Vacancy]): Вакансии для добавления (в том числе
+                генератор, например Vacancy.iter_from_json)
 
         Returns:
             int: Количество успешно добавленных вакансий
         """
-        added_count = 0
-        for vacancy in vacancies:
-            if self.add_vacancy(vacancy):
+        try:
+            signature = self._file_signature()
+            if self._writes_in_place(signature):
+                return self._append_vacancies(vacancies, signature)
+
+            vacancies_data, index = self._load_indexed()
+
+            added_count = 0
+            for vacancy in vacancies:
+                if index.find(vacancy.key) is not None:
+                    continue
+                record = vacancy_to_record(vacancy)
+                vacancies_data.append(record)
+                index.append(record)
                 added_count += 1
-        return added_count
+
+            if added_count:
+                self._save_vacancies(vacancies_data, index)
+            return added_count
+
+        except Exception as e:
+            self.invalidate_cache()
+            print(f"Ошибка при добавлении вакансий: {e}")
+            return 0
+
+
+def _dump_record(record: Dict[str, Any]) -> str:
+    """
+    Запись одной строкой для потоковой записи в файл.
+
+    Без отступов json.dumps кодирует запись на C, с отступами — на Python.
+    """
+    return json.dumps(record, ensure_ascii=False)
@@ -0,0 +1,307 @@
+import codecs
+import json
+import mmap
+import re
+from typing import Any, Dict, Iterable, Iterator, Tuple
+from models.encoding import (
+    ENCODED_FORMAT,
+    decode_records,
+    is_encoded,
+    record_decoder,
+)
+
+# Размер фрагмента файла, который декодируется за один раз
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def _read_chunks(filename: str, chunk_size: int) -> Iterator[str]:
+    """
+    Читать файл фрагментами текста.
+
+    Файл по возможности отображается в память (mmap), прочитанные страницы
+    сразу освобождаются; пустые файлы и файлы, которые отобразить нельзя,
+    читаются обычным образом.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(filename, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None
+        try:
+            if mapped is not None:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                released = 0
+                for offset in range(0, len(mapped), chunk_size):
+                    chunk = mapped[offset:offset + chunk_size]
+                    released = _release_pages(mapped, released, offset + len(chunk))
+                    yield decoder.decode(chunk)
+            else:
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    yield decoder.decode(chunk)
+            yield decoder.decode(b"", final=True)
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+
+def _release_pages(mapped: mmap.mmap, start: int, end: int) -> int:
+    """
+    Вернуть системе уже прочитанные страницы отображения [start, end).
+
+    Иначе прочитанный файл целиком остается в памяти процесса.
+
+    Returns:
+        int: Граница, до которой страницы освобождены
+    """
+    end -= end % mmap.PAGESIZE
+    if end > start and hasattr(mmap, "MADV_DONTNEED"):
+        mapped.madvise(mmap.MADV_DONTNEED, start, end - start)
+        return end
+    return start
+
+
+class _JSONStream:
+    """
+    Последовательный разбор JSON-текста, поступающего фрагментами.
+
+    С track_offsets=True поток считает байтовые смещения разобранного
+    текста в файле (см. offset); без него подсчет ничего не стоит.
+    """
+
+    def __init__(self, chunks: Iterator[str], track_offsets: bool = False):
+        self._chunks = chunks
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._track_offsets = track_offsets
+        # Позиция в буфере, байтовое смещение которой уже посчитано
+        self._mark = 0
+        self._mark_offset = 0
+
+    def offset(self) -> int:
+        """Байтовое смещение текущей позиции в файле (UTF-8)."""
+        text = self._buffer[self._mark:self._pos]
+        self._mark_offset += len(text) if text.isascii() else len(text.encode())
+        self._mark = self._pos
+        return self._mark_offset
+
+    def _fill(self, min_size: int = 1) -> bool:
+        """Дочитать в буфер не меньше min_size символов (False в конце файла)."""
+        if self._eof:
+            return False
+        if self._track_offsets:
+            # Прочитанная часть буфера отбрасывается: учитываем ее байты
+            self.offset()
+        self._mark = 0
+        parts = [self._buffer[self._pos:]]
+        read = 0
+        for chunk in self._chunks:
+            parts.append(chunk)
+            read += len(chunk)
+            if read >= min_size:
+                break
+        else:
+            self._eof = True
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return read > 0 or not self._eof
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """Следующий значимый символ (пустая строка в конце файла)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        """Пропустить ожидаемый символ."""
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Разобрать следующее значение целиком."""
+        self.peek()
+        need = len(self._buffer) - self._pos
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(need):
+                    raise
+            else:
+                # Число в конце буфера могло оборваться на границе фрагмента
+                if end < len(self._buffer) or not self._fill():
+                    self._pos = end
+                    return value
+            # Значение длиннее прочитанного: читаем с удвоением, чтобы
+            # не разбирать его заново на каждом фрагменте
+            need = max(need * 2, 1)
+
+    def _elements(self) -> Iterator[None]:
+        """Перебрать элементы массива; каждый элемент нужно прочитать."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def items(self) -> Iterator[Any]:
+        """Перебрать элементы массива по одному."""
+        for _ in self._elements():
+            yield self.value()
+
+    def offset_items(self) -> Iterator[Tuple[int, Any]]:
+        """Перебрать элементы массива вместе с их байтовыми смещениями."""
+        for _ in self._elements():
+            self.peek()
+            yield self.offset(), self.value()
+
+    def members(self) -> Iterator[str]:
+        """Перебрать ключи объекта; значение каждого ключа нужно прочитать."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+
+def iter_records(
+    filename: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Перебрать записи файла JSONSaver по одной, не загружая файл целиком.
+
+    Поддерживаются оба формата JSONSaver: массив записей и файл со словарным
+    кодированием (словари записываются перед записями, поэтому записи
+    декодируются по мере чтения).
+
+    Args:
+        filename (str): Имя файла
+        chunk_size (int): Размер фрагмента файла в байтах
+
+    Returns:
+        Iterator[Dict[str, Any]]: Записи в формате JSONSaver
+
+    Raises:
+        FileNotFoundError: Если файла нет
+        json.JSONDecodeError: Если файл поврежден
+    """
+    chunks = _read_chunks(filename, chunk_size)
+    try:
+        stream = _JSONStream(chunks)
+        if stream.peek() != "{":
+            yield from stream.items()
+            return
+
+        header: Dict[str, Any] = {}
+        for key in stream.members():
+            if key == "vacancies" and header.get("format") == ENCODED_FORMAT:
+                decode = record_decoder(header.get("dictionaries", {}))
+                for row in stream.items():
+                    yield decode(row)
+            else:
+                header[key] = stream.value()
+        if is_encoded(header) and "vacancies" in header:
+            # Записи оказались перед словарями: декодируем их после чтения
+            yield from decode_records(header)
+    finally:
+        chunks.close()
+
+
+def iter_record_offsets(
+    filename: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Перебрать записи файла-массива вместе с их байтовыми смещениями.
+
+    Смещения нужны, чтобы потом читать отдельные записи (см. read_records),
+    поэтому файлы со словарным кодированием не поддерживаются: их записи
+    без словарей не декодировать.
+
+    Args:
+        filename (str): Имя файла
+        chunk_size (int): Размер фрагмента файла в байтах
+
+    Returns:
+        Iterator[Tuple[int, Dict[str, Any]]]: Смещение начала записи и запись
+
+    Raises:
+        FileNotFoundError: Если файла нет
+        json.JSONDecodeError: Если файл поврежден или не является массивом
+    """
+    chunks = _read_chunks(filename, chunk_size)
+    try:
+        yield from _JSONStream(chunks, track_offsets=True).offset_items()
+    finally:
+        chunks.close()
+
+
+def read_records(
+    filename: str, offsets: Iterable[int], chunk_size: int = 4096
+) -> Iterator[Dict[str, Any]]:
+    """
+    Прочитать записи, начинающиеся с указанных байтовых смещений.
+
+    Читаются только сами записи, а не весь файл: по индексу со смещениями
+    (см. iter_record_offsets) запрос к большому файлу читает лишь кандидатов.
+
+    Args:
+        filename (str): Имя файла
+        offsets (Iterable[int]): Смещения записей (по возрастанию читается
+            быстрее всего)
+        chunk_size (int): Сколько байтов читать за раз
+
+    Returns:
+        Iterator[Dict[str, Any]]: Записи в порядке смещений
+
+    Raises:
+        json.JSONDecodeError: Если по смещению нет записи
+    """
+    with open(filename, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            text = ""
+            size = chunk_size
+            while True:
+                chunk = f.read(size)
+                text += decoder.decode(chunk, final=not chunk)
+                try:
+                    record, _ = _DECODER.raw_decode(text)
+                except json.JSONDecodeError:
+                    if not chunk:
+                        raise
+                    # Запись длиннее прочитанного: читаем с удвоением
+                    size *= 2
+                    continue
+                yield record
+                break
@@ -0,0 +1,258 @@
+import json
+import threading
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from .base_storage import BaseStorage
+from .records import (
+    record_filter,
+    record_key,
+    record_to_vacancy,
+    vacancy_to_record,
+)
+from models.vacancy import Vacancy, gc_paused, identity_key
+from utils.files import atomic_write, read_json_lines
+
+
+class JSONLinesSaver(BaseStorage):
+    """
+    Хранилище вакансий в журнале JSON Lines.
+    Каждое изменение дописывается в конец файла одной строкой: добавление
+    вакансии, отметка об удалении (tombstone) или отметка об очистке, поэтому
+    стоимость записи не зависит от объема данных. Когда отметок и удаленных
+    записей становится слишком много, журнал переписывается (компактируется)
+    во временный файл, который атомарно заменяет исходный.
+
+    Текущее состояние хранится в памяти; писать в файл должен один процесс.
+    """
+
+    def __init__(
+        self,
+        filename: str = "vacancies.jsonl",
+        compact_min_lines: int = 1000,
+        compact_ratio: float = 0.5,
+        background_compaction: bool = True,
+    ):
+        """
+        Инициализация хранилища.
+
+        Args:
+            filename (str): Имя файла журнала
+            compact_min_lines (int): Минимальное число лишних строк журнала,
+                после которого выполняется компактирование
+            compact_ratio (float): Доля лишних строк журнала, после которой
+                выполняется компактирование
+            background_compaction (bool): Компактировать в фоновом потоке
+        """
+        self.filename = filename
+        self.compact_min_lines = compact_min_lines
+        self.compact_ratio = compact_ratio
+        self.background_compaction = background_compaction
+
+        self._lock = threading.RLock()
+        # Ключ идентичности (Vacancy.key) → запись
+        self._records: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._line_count = 0
+        self._pending: Optional[List[str]] = None
+        self._compaction: Optional[threading.Thread] = None
+        self._load()
+
+    def _load(self):
+        """Восстановить состояние, последовательно применив строки журнала."""
+        for entry in read_json_lines(self.filename):
+            self._line_count += 1
+            self._apply(entry)
+
+    def _apply(self, entry: Dict[str, Any]):
+        """Применить строку журнала к состоянию в памяти."""
+        op = entry.get("op")
+        if op == "put":
+            record = entry["vacancy"]
+            self._records[record_key(record)] = record
+        elif op == "delete":
+            for key in entry["keys"]:
+                # Журналы прежних версий записывали и ключ по ссылке
+                if key[0] == "url":
+                    key = identity_key(None, key[1], key[2])
+                self._records.pop(tuple(key), None)
+        elif op == "clear":
+            self._records.clear()
+
+    def _append(self, entries: List[Dict[str, Any]]):
+        """
+        Записать строки в журнал и применить их к состоянию в памяти.
+
+        Строки применяются только после успешной записи, поэтому при ошибке
+        записи состояние в памяти не расходится с файлом.
+        """
+        lines = [json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries]
+        with open(self.filename, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+        self._line_count += len(lines)
+        if self._pending is not None:
+            self._pending.extend(lines)
+        for entry in entries:
+            self._apply(entry)
+        if self._needs_compaction():
+            self._start_compaction()
+
+    def _needs_compaction(self) -> bool:
+        """Слишком ли много в журнале лишних строк."""
+        garbage = self._line_count - len(self._records)
+        return (
+            garbage >= self.compact_min_lines
+            and garbage >= self.compact_ratio * self._line_count
+        )
+
+    def _start_compaction(self):
+        """Запустить компактирование (в фоне или сразу)."""
+        if self._pending is not None:
+            return
+        if not self.background_compaction:
+            self.compact()
+            return
+        self._compaction = threading.Thread(target=self.compact, daemon=True)
+        self._compaction.start()
+
+    def compact(self) -> bool:
+        """
+        Переписать журнал, оставив по одной строке на сохраненную вакансию.
+
+        Снимок состояния записывается во временный файл без блокировки
+        хранилища; строки, дописанные за это время, переносятся в него перед
+        атомарной заменой исходного файла.
+
+        Returns:
+            bool: True, если журнал переписан
+        """
+        with self._lock:
+            if self._pending is not None:
+                return False
+            self._pending = []
+            snapshot = list(self._records.values())
+
+        locked = False
+
+        def write(f):
+            nonlocal locked
+            for record in snapshot:
+                f.write(
+                    json.dumps({"op": "put", "vacancy": record}, ensure_ascii=False)
+                    + "\n"
+                )
+            # Строки, дописанные после снимка, переносятся, и файл заменяется
+            # под блокировкой: она снимается после atomic_write
+            self._lock.acquire()
+            locked = True
+            f.writelines(self._pending)
+
+        try:
+            atomic_write(self.filename, write)
+            self._line_count = len(snapshot) + len(self._pending)
+            return True
+        except Exception as e:
+            print(f"Ошибка при компактировании журнала: {e}")
+            return False
+        finally:
+            with self._lock:
+                self._pending = None
+            if locked:
+                self._lock.release()
+
+    def close(self):
+        """Дождаться завершения фонового компактирования."""
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        """
+        Добавить вакансию в журнал.
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для добавления
+
+        Returns:
+            bool: True если вакансия успешно добавлена
+        """
+        return self.add_vacancies([vacancy]) == 1
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> int:
+        """
+        Добавить несколько вакансий одной записью в журнал.
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для добавления
+
+        Returns:
+            int: Количество успешно добавленных вакансий
+        """
+        try:
+            with self._lock:
+                entries = []
+                batch_keys = set()
+                for vacancy in vacancies:
+                    key = vacancy.key
+                    if key in self._records or key in batch_keys:
+                        continue
+                    batch_keys.add(key)
+                    entries.append({"op": "put", "vacancy": vacancy_to_record(vacancy)})
+                if entries:
+                    self._append(entries)
+                return len(entries)
+        except Exception as e:
+            print(f"Ошибка при добавлении вакансий: {e}")
+            return 0
+
+    def get_vacancies(self, **kwargs) -> List[Vacancy]:
+        """
+        Получить вакансии по указанным критериям.
+
+        Критерии проверяются на записях, объекты Vacancy создаются только
+        для подходящих.
+
+        Args:
+            **kwargs: Критерии для фильтрации (как у JSONSaver.get_vacancies)
+
+        Returns:
+            List[Vacancy]: Список вакансий, соответствующих критериям
+        """
+        matches = record_filter(**kwargs)
+        with self._lock:
+            records = list(self._records.values())
+        with gc_paused():
+            return [record_to_vacancy(record) for record in records if matches(record)]
+
+    def delete_vacancy(self, vacancy: Vacancy) -> bool:
+        """
+        Удалить вакансию (дописать в журнал отметку об удалении).
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для удаления
+
+        Returns:
+            bool: True если вакансия успешно удалена
+        """
+        try:
+            with self._lock:
+                key = vacancy.key
+                if key not in self._records:
+                    return False
+                self._append([{"op": "delete", "keys": [list(key)]}])
+                return True
+        except Exception as e:
+            print(f"Ошибка при удалении вакансии: {e}")
+            return False
+
+    def clear_all(self) -> bool:
+        """
+        Очистить хранилище (дописать в журнал отметку об очистке).
+
+        Returns:
+            bool: True если хранилище успешно очищено
+        """
+        try:
+            with self._lock:
+                self._append([{"op": "clear"}])
+            return True
+        except Exception as e:
+            print(f"Ошибка при очистке хранилища: {e}")
+            return False
@@ -0,0 +1,95 @@
+from typing import List, Dict, Any, Callable, Tuple
+from models.encoding import intern_all, intern_value
+from models.salary import Salary
+from models.vacancy import Vacancy, identity_key
+
+
+def vacancy_to_record(vacancy: Vacancy) -> Dict[str, Any]:
+    """Преобразовать объект Vacancy в словарь для файловых хранилищ."""
+    return {
+        "title": vacancy.title,
+        "url": vacancy.url,
+        "salary": vacancy.salary,
+        "description": vacancy.description,
+        "requirements": vacancy.requirements,
+        "company": vacancy.company,
+        "key_skills": list(vacancy.key_skills),
+        "experience": vacancy.experience,
+        "salary_range": (
+            vacancy.salary_range.to_json() if vacancy.salary_range else None
+        ),
+        "hh_id": vacancy.hh_id,
+        "employer_id": vacancy.employer_id,
+    }
+
+
+def record_to_vacancy(record: Dict[str, Any]) -> Vacancy:
+    """
+    Преобразовать словарь в объект Vacancy.
+
+    Записи получены из уже проверенных объектов Vacancy, поэтому повторная
+    валидация не выполняется. Повторяющиеся значения интернируются, чтобы
+    вакансии одной компании разделяли строки.
+    """
+    return Vacancy.from_trusted(
+        title=record.get("title", ""),
+        url=record.get("url", ""),
+        salary=record.get("salary") or 0,
+        description=record.get("description", ""),
+        requirements=intern_value(record.get("requirements", "")),
+        company=intern_value(record.get("company", "")),
+        key_skills=intern_all(record.get("key_skills") or ()),
+        experience=intern_value(record.get("experience", "")),
+        salary_range=Salary.from_json(record.get("salary_range")),
+        hh_id=record.get("hh_id"),
+        employer_id=intern_value(record.get("employer_id")),
+    )
+
+
+def record_key(record: Dict[str, Any]) -> Tuple[str, ...]:
+    """Ключ идентичности сохраненной записи (тот же, что Vacancy.key)."""
+    return identity_key(record.get("hh_id"), record.get("url"), record.get("title"))
+
+
+def record_filter(**kwargs) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Условие отбора сохраненных записей по критериям get_vacancies.
+
+    Проверяет словари до создания объектов Vacancy. Проверки упорядочены
+    от дешевых к дорогим: сравнения зарплаты, затем поиск по компании,
+    затем по названию и описанию.
+
+    Args:
+        **kwargs: Критерии для фильтрации:
+            - keyword: ключевое слово для поиска в названии и описании
+            - min_salary: минимальная зарплата
+            - max_salary: максимальная зарплата
+            - company: название компании
+
+    Returns:
+        Callable[[Dict[str, Any]], bool]: Проверка одной записи
+    """
+    checks: List[Callable[[Dict[str, Any]], bool]] = []
+
+    if kwargs.get("min_salary"):
+        min_salary = kwargs["min_salary"]
+        checks.append(lambda r: (r.get("salary") or 0) >= min_salary)
+
+    if kwargs.get("max_salary"):
+        max_salary = kwargs["max_salary"]
+        checks.append(lambda r: (r.get("salary") or 0) <= max_salary)
+
+    if kwargs.get("company"):
+        company = kwargs["company"].lower()
+        checks.append(lambda r: company in (r.get("company") or "").lower())
+
+    if kwargs.get("keyword"):
+        keyword = kwargs["keyword"].lower()
+        checks.append(
+            lambda r: keyword in (r.get("title") or "").lower()
+            or keyword in (r.get("description") or "").lower()
+        )
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda r: all(check(r) for check in checks)
@@ -0,0 +1,396 @@
+import json
+import sqlite3
+import threading
+from typing import List, Any, Iterable, Optional, Tuple
+from .base_storage import BaseStorage
+from models.encoding import intern_all, intern_value
+from models.salary import Salary
+from models.vacancy import Vacancy, gc_paused, identity_key
+
+# Триграммный токенизатор FTS5 ищет по подстроке (без учета регистра),
+# как и фильтры JSONSaver, но только для строк от трех символов
+_MIN_FTS_TERM = 3
+
+_COLUMNS = (
+    "title, url, salary, description, requirements, company, key_skills, "
+    "experience, salary_range, hh_id, employer_id"
+)
+
+# Вакансия определяется ключом Vacancy.key: идентификатором hh.ru, а без
+# него — ссылкой с названием, поэтому они уникальны только у строк без hh_id
+_TABLE = """
+    CREATE TABLE IF NOT EXISTS vacancies (
+        id INTEGER PRIMARY KEY,
+        hh_id TEXT UNIQUE,
+        title TEXT NOT NULL,
+        url TEXT NOT NULL,
+        salary INTEGER NOT NULL DEFAULT 0,
+        description TEXT NOT NULL DEFAULT '',
+        requirements TEXT,
+        company TEXT NOT NULL DEFAULT '',
+        key_skills TEXT,
+        experience TEXT,
+        salary_range TEXT,
+        employer_id TEXT
+    );
+"""
+
+_INDEXES = """
+    CREATE UNIQUE INDEX IF NOT EXISTS vacancies_url_title_idx
+        ON vacancies (url, title) WHERE hh_id IS NULL;
+    CREATE INDEX IF NOT EXISTS vacancies_salary_idx ON vacancies (salary);
+    CREATE INDEX IF NOT EXISTS vacancies_company_idx ON vacancies (company);
+    CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+        title, description, company,
+        content='vacancies', content_rowid='id', tokenize='trigram'
+    );
+"""
+
+
+class SQLiteSaver(BaseStorage):
+    """
+    Хранилище вакансий во встроенной базе SQLite.
+    Зарплата и компания проиндексированы, вакансии уникальны по ключу
+    Vacancy.key (идентификатор hh.ru или ссылка с названием), поиск
+    по ключевому слову и компании выполняется через полнотекстовый
+    индекс FTS5. Критерии get_vacancies переводятся в SQL,
+    поэтому в Python попадают только подходящие вакансии.
+    """
+
+    def __init__(self, filename: str = "vacancies.db"):
+        """
+        Инициализация хранилища.
+
+        Args:
+            filename (str): Имя файла базы данных
+        """
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.create_function("py_lower", 1, _lower, deterministic=True)
+        self._create_tables()
+
+    def _create_tables(self):
+        """Создать таблицы и индексы, если их еще нет, и обновить старую базу."""
+        with self._conn:
+            self._conn.executescript(_TABLE)
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(vacancies)")
+            }
+            if "employer_id" not in columns:
+                # База создана до появления столбца
+                self._conn.execute("ALTER TABLE vacancies ADD COLUMN employer_id TEXT")
+        (table_sql,) = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'vacancies'"
+        ).fetchone()
+        if "UNIQUE (url, title)" in table_sql:
+            self._rebuild_table()
+        self._conn.executescript(_INDEXES)
+        self._backfill_hh_ids()
+
+    def _rebuild_table(self):
+        """
+        Пересоздать таблицу базы, в которой ссылка с названием уникальна
+        для всех строк, а не только для строк без hh_id.
+        """
+        self._conn.executescript(
+            f"""
+            BEGIN;
+            ALTER TABLE vacancies RENAME TO vacancies_old;
+            {_TABLE}
+            INSERT INTO vacancies (id, {_COLUMNS})
+                SELECT id, {_COLUMNS} FROM vacancies_old;
+            DROP TABLE vacancies_old;
+            COMMIT;
+            """
+        )
+        self._conn.executescript(_INDEXES)
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO vacancies_fts (vacancies_fts) VALUES ('rebuild')"
+            )
+
+    def _backfill_hh_ids(self):
+        """
+        Заполнить hh_id строк, сохраненных без него, по ссылке на hh.ru
+        (см. identity_key). Копии уже сохраненной вакансии удаляются.
+        """
+        rows = self._conn.execute(
+            "SELECT id, url, title FROM vacancies WHERE hh_id IS NULL"
+        ).fetchall()
+        updates = []
+        for row_id, url, title in rows:
+            key = identity_key(None, url, title)
+            if key[0] == "hh":
+                updates.append((key[1], row_id))
+        if not updates:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE OR IGNORE vacancies SET hh_id = ? WHERE id = ?", updates
+            )
+            # Строки, чей идентификатор уже занят, — копии той же вакансии
+            self._conn.executemany(
+                "DELETE FROM vacancies WHERE id = ? AND hh_id IS NULL",
+                [(row_id,) for _, row_id in updates],
+            )
+            self._conn.execute(
+                "INSERT INTO vacancies_fts (vacancies_fts) VALUES ('rebuild')"
+            )
+
+    def close(self):
+        """Закрыть соединение с базой."""
+        self._conn.close()
+
+    @staticmethod
+    def _to_row(vacancy: Vacancy) -> Tuple[Any, ...]:
+        """Преобразовать вакансию в строку таблицы."""
+        key = vacancy.key
+        return (
+            vacancy.title,
+            vacancy.url,
+            vacancy.salary,
+            vacancy.description,
+            vacancy.requirements,
+            vacancy.company,
+            json.dumps(list(vacancy.key_skills), ensure_ascii=False),
+            vacancy.experience,
+            (
+                json.dumps(vacancy.salary_range.to_json(), ensure_ascii=False)
+                if vacancy.salary_range
+                else None
+            ),
+            key[1] if key[0] == "hh" else None,
+            vacancy.employer_id,
+        )
+
+    @staticmethod
+    def _from_row(row: Tuple[Any, ...]) -> Vacancy:
+        """Преобразовать строку таблицы в вакансию без повторной валидации."""
+        (
+            title,
+            url,
+            salary,
+            description,
+            requirements,
+            company,
+            key_skills,
+            experience,
+            salary_range,
+            hh_id,
+            employer_id,
+        ) = row
+        return Vacancy.from_trusted(
+            title=title,
+            url=url,
+            salary=salary,
+            description=description,
+            requirements=intern_value(requirements),
+            company=intern_value(company),
+            key_skills=intern_all(json.loads(key_skills)) if key_skills else None,
+            experience=intern_value(experience),
+            salary_range=Salary.from_json(json.loads(salary_range or "null")),
+            hh_id=hh_id,
+            employer_id=intern_value(employer_id),
+        )
+
+    def _index_new_rows(self, after_id: int):
+        """Добавить в полнотекстовый индекс строки с id больше after_id."""
+        self._conn.execute(
+            "INSERT INTO vacancies_fts (rowid, title, description, company) "
+            "SELECT id, title, description, company FROM vacancies WHERE id > ?",
+            (after_id,),
+        )
+
+    def _max_id(self) -> int:
+        """Наибольший id сохраненной вакансии (0, если их нет)."""
+        row = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM vacancies")
+        return row.fetchone()[0]
+
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        """
+        Добавить вакансию в базу.
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для добавления
+
+        Returns:
+            bool: True если вакансия успешно добавлена
+        """
+        return self.add_vacancies([vacancy]) == 1
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> int:
+        """
+        Добавить несколько вакансий одной транзакцией.
+
+        Вакансии с уже сохраненными идентификатором hh.ru или ссылкой
+        с названием пропускаются.
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для добавления
+
+        Returns:
+            int: Количество успешно добавленных вакансий
+        """
+        try:
+            with self._lock, self._conn:
+                last_id = self._max_id()
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    f"INSERT OR IGNORE INTO vacancies ({_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    map(self._to_row, vacancies),
+                )
+                added = self._conn.total_changes - before
+                if added:
+                    self._index_new_rows(last_id)
+                return added
+        except sqlite3.Error as e:
+            print(f"Ошибка при добавлении вакансий: {e}")
+            return 0
+
+    def _build_query(self, **kwargs) -> Tuple[str, List[Any]]:
+        """Перевести критерии get_vacancies в условие WHERE."""
+        conditions = []
+        params: List[Any] = []
+        fts_queries = []
+
+        if kwargs.get("keyword"):
+            keyword = kwargs["keyword"].lower()
+            if len(keyword) >= _MIN_FTS_TERM:
+                fts_queries.append("{title description} : " + _phrase(keyword))
+            else:
+                conditions.append(
+                    "(instr(py_lower(description), ?) OR instr(py_lower(title), ?))"
+                )
+                params.extend([keyword, keyword])
+
+        if kwargs.get("min_salary"):
+            conditions.append("salary >= ?")
+            params.append(kwargs["min_salary"])
+
+        if kwargs.get("max_salary"):
+            conditions.append("salary <= ?")
+            params.append(kwargs["max_salary"])
+
+        if kwargs.get("company"):
+            company = kwargs["company"].lower()
+            if len(company) >= _MIN_FTS_TERM:
+                fts_queries.append("company : " + _phrase(company))
+            else:
+                conditions.append("instr(py_lower(company), ?)")
+                params.append(company)
+
+        if fts_queries:
+            conditions.insert(
+                0,
+                "id IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)",
+            )
+            params.insert(0, " AND ".join(fts_queries))
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def get_vacancies(self, **kwargs) -> List[Vacancy]:
+        """
+        Получить вакансии из базы по указанным критериям.
+
+        Args:
+            **kwargs: Критерии для фильтрации (как у JSONSaver.get_vacancies):
+                - keyword: ключевое слово для поиска в описании и названии
+                - min_salary: минимальная зарплата
+                - max_salary: максимальная зарплата
+                - company: название компании
+
+        Returns:
+            List[Vacancy]: Список вакансий в порядке добавления
+        """
+        where, params = self._build_query(**kwargs)
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM vacancies{where} ORDER BY id", params
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Ошибка при получении вакансий: {e}")
+            return []
+        with gc_paused():
+            return [self._from_row(row) for row in rows]
+
+    def _find_id(self, vacancy: Vacancy) -> Optional[int]:
+        """Найти сохраненную вакансию по ключу идентичности (Vacancy.key)."""
+        key = vacancy.key
+        if key[0] == "hh":
+            row = self._conn.execute(
+                "SELECT id FROM vacancies WHERE hh_id = ?", (key[1],)
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                "SELECT id FROM vacancies "
+                "WHERE hh_id IS NULL AND url = ? AND title = ?",
+                (key[1], key[2]),
+            ).fetchone()
+        return row[0] if row else None
+
+    def delete_vacancy(self, vacancy: Vacancy) -> bool:
+        """
+        Удалить вакансию из базы.
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для удаления
+
+        Returns:
+            bool: True если вакансия успешно удалена
+        """
+        try:
+            with self._lock, self._conn:
+                vacancy_id = self._find_id(vacancy)
+                if vacancy_id is None:
+                    return False
+                self._conn.execute(
+                    "INSERT INTO vacancies_fts "
+                    "(vacancies_fts, rowid, title, description, company) "
+                    "SELECT 'delete', id, title, description, company "
+                    "FROM vacancies WHERE id = ?",
+                    (vacancy_id,),
+                )
+                self._conn.execute("DELETE FROM vacancies WHERE id = ?", (vacancy_id,))
+                return True
+        except sqlite3.Error as e:
+            print(f"Ошибка при удалении вакансии: {e}")
+            return False
+
+    def clear_all(self) -> bool:
+        """
+        Очистить все вакансии из базы.
+
+        Returns:
+            bool: True если база успешно очищена
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM vacancies")
+                self._conn.execute(
+                    "INSERT INTO vacancies_fts (vacancies_fts) VALUES ('delete-all')"
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"Ошибка при очистке базы: {e}")
+            return False
+
+    def count(self) -> int:
+        """Количество сохраненных вакансий."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0]
+
+
+def _lower(value: Optional[str]) -> str:
+    """Нижний регистр с учетом кириллицы (lower() в SQLite — только ASCII)."""
+    return value.lower() if value else ""
+
+
+def _phrase(term: str) -> str:
+    """Экранировать строку как фразу запроса FTS5."""
+    return '"' + term.replace('"', '""') + '"'
@@ -0,0 +1,88 @@
+import json
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from utils.files import atomic_write
+
+
+class SyncState:
+    """
+    Хранилище отметок синхронизации (high-water mark).
+    Для каждого ключа (поисковый запрос или компания) хранит дату
+    публикации самой свежей уже загруженной вакансии (за вычетом запаса,
+    см. update).
+    """
+
+    def __init__(self, filename: str = "sync_state.json"):
+        """
+        Инициализация хранилища отметок.
+
+        Args:
+            filename (str): Имя файла с отметками синхронизации
+        """
+        self.filename = filename
+        self._marks: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        """Загрузить отметки из файла."""
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self):
+        """Атомарно сохранить отметки в файл."""
+        atomic_write(
+            self.filename,
+            lambda f: json.dump(self._marks, f, ensure_ascii=False, indent=2),
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Получить отметку синхронизации.
+
+        Args:
+            key (str): Ключ запроса или компании
+
+        Returns:
+            Optional[str]: Дата в формате ISO 8601 или None, если синхронизации
+                еще не было
+        """
+        return self._marks.get(key)
+
+    def update(self, key: str, published_at: str, overlap: timedelta = timedelta(0)):
+        """
+        Сдвинуть отметку вперед, если новая дата позже сохраненной.
+
+        hh.ru может проиндексировать вакансию позже, чем она опубликована,
+        поэтому отметка ставится на overlap раньше самой свежей вакансии:
+        следующая синхронизация запросит этот интервал повторно.
+
+        Args:
+            key (str): Ключ запроса или компании
+            published_at (str): Дата публикации в формате ISO 8601
+            overlap (timedelta): Запас, на который отметка отстает от даты
+        """
+        mark = parse_hh_date(published_at) - overlap
+        current = self._marks.get(key)
+        if current is None or mark > parse_hh_date(current):
+            self._marks[key] = format_hh_date(mark)
+            self._save()
+
+    def reset(self, key: Optional[str] = None):
+        """Сбросить отметку для ключа или все отметки."""
+        if key is None:
+            self._marks.clear()
+        else:
+            self._marks.pop(key, None)
+        self._save()
+
+
+def parse_hh_date(value: str) -> datetime:
+    """Разобрать дату hh.ru (например, 2024-05-13T10:12:30+0300)."""
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+
+
+def format_hh_date(value: datetime) -> str:
+    """Записать дату в формате hh.ru (например, 2024-05-13T10:12:30+0300)."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S%z")
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+from api.async_hh_api import AsyncHeadHunterAPI
+from api.base_api import BaseAPI
+from api.hh_api import HeadHunterAPI
+from api.rate_limiter import RequestScheduler
+from benchmarks.mock_hh_server import MockHHConfig, MockHHServer
+
+
+def make_async_api(server: MockHHServer, **kwargs) -> AsyncHeadHunterAPI:
+    """Создать асинхронный клиент, направленный на заглушку hh.ru."""
+    max_concurrency = kwargs.pop("max_concurrency", None)
+    kwargs.setdefault("backoff_factor", 0.01)
+    api = HeadHunterAPI(
+        api_url=server.url,
+        scheduler=RequestScheduler(rate=1000, initial_concurrency=16),
+        **kwargs,
+    )
+    return AsyncHeadHunterAPI(api, max_concurrency=max_concurrency)
+
+
+async def collect(iterator):
+    """Собрать элементы асинхронного итератора в список."""
+    return [item async for item in iterator]
+
+
+class TestAsyncHeadHunterAPI:
+    """Тесты асинхронного клиента hh.ru на локальной заглушке."""
+
+    def test_get_vacancies_keeps_page_order(self):
+        """Тест: страницы с разной задержкой объединяются в порядке страниц."""
+        config = MockHHConfig(found=950, latency="uniform", latency_ms=10)
+        with MockHHServer(config) as server:
+            api = make_async_api(server)
+            try:
+                vacancies = asyncio.run(api.get_vacancies("Python"))
+            finally:
+                api.close()
+
+        assert [v["id"] for v in vacancies] == [str(i) for i in range(1, 951)]
+
+    def test_concurrency_limit(self):
+        """Тест: одновременно выполняется не больше max_concurrency запросов."""
+        with MockHHServer(MockHHConfig(found=1000, latency_ms=20)) as server:
+            api = make_async_api(server, max_concurrency=3)
+            lock = threading.Lock()
+            state = {"active": 0, "peak": 0}
+            fetch_page = api.api._fetch_page
+
+            def counting_fetch(*args, **kwargs):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                try:
+                    return fetch_page(*args, **kwargs)
+                finally:
+                    with lock:
+                        state["active"] -= 1
+
+            api.api._fetch_page = counting_fetch
+            try:
+                queries = ["Python", "Java", "Go"]
+                results = asyncio.run(api.get_vacancies_many(queries))
+            finally:
+                api.close()
+
+        assert api._executor._max_workers == 3
+        assert state["peak"] == 3
+        assert all(len(results[query]) == 1000 for query in queries)
+
+    def test_default_concurrency_follows_pool_size(self):
+        """Тест: без max_concurrency пул потоков равен пулу соединений."""
+        api = AsyncHeadHunterAPI(HeadHunterAPI(pool_size=5))
+        try:
+            assert api.max_concurrency == 5
+            assert api._executor._max_workers == 5
+        finally:
+            api.close()
+            api.api.close()
+
+    def test_failed_page_is_skipped(self):
+        """Тест: страница, не загруженная после повторов, пропускается."""
+        with MockHHServer(MockHHConfig(found=400, fail_pages=[2])) as server:
+            api = make_async_api(server, max_retries=1)
+            try:
+                vacancies = asyncio.run(api.get_vacancies("Python"))
+            finally:
+                api.close()
+
+            assert server.status_counts[503] == 2
+
+        expected = [str(i) for i in range(1, 201)] + [
+            str(i) for i in range(301, 401)
+        ]
+        assert [v["id"] for v in vacancies] == expected
+
+    def test_iter_vacancies(self):
+        """Тест потокового получения вакансий асинхронным генератором."""
+        with MockHHServer(MockHHConfig(found=450, latency_ms=5)) as server:
+            api = make_async_api(server)
+            try:
+                vacancies = asyncio.run(collect(api.iter_vacancies("Python")))
+            finally:
+                api.close()
+
+        assert [v["id"] for v in vacancies] == [str(i) for i in range(1, 451)]
+
+    def test_iter_vacancies_stops_early(self):
+        """Тест: прерванный обход не загружает оставшиеся страницы."""
+
+        async def first_items(api, count):
+            items = []
+            async for vacancy in api.iter_vacancies("Python"):
+                items.append(vacancy)
+                if len(items) == count:
+                    break
+            return items
+
+        with MockHHServer(MockHHConfig(found=1000)) as server:
+            api = make_async_api(server, prefetch_pages=1)
+            try:
+                vacancies = asyncio.run(first_items(api, 10))
+            finally:
+                api.close()
+
+            assert len(vacancies) == 10
+            assert server.request_count <= 2
+
+    def test_fetch_vacancies_by_employers(self):
+        """Тест: неполные выдачи работодателей возвращаются отдельно."""
+        config = MockHHConfig(found=1200, max_depth=300, employer_ids=[1740, 80, 3529])
+        with MockHHServer(config) as server:
+            api = make_async_api(server)
+            try:
+                grouped, incomplete = asyncio.run(
+                    api.fetch_vacancies_by_employers([1740, 80])
+                )
+            finally:
+                api.close()
+
+            assert server.request_count == 3
+        assert incomplete == [1740, 80]
+        assert all(len(grouped[employer_id]) == 100 for employer_id in incomplete)
+
+        config = MockHHConfig(found=450, employer_ids=[1740, 80, 3529])
+        with MockHHServer(config) as server:
+            api = make_async_api(server)
+            try:
+                grouped = asyncio.run(api.get_vacancies_by_employers([1740, 80]))
+            finally:
+                api.close()
+        assert len(grouped[1740]) == len(grouped[80]) == 150
+
+    def test_is_not_a_sync_client(self):
+        """Тест: асинхронный клиент не выдает себя за синхронный BaseAPI."""
+        api = AsyncHeadHunterAPI(HeadHunterAPI())
+        try:
+            assert not isinstance(api, BaseAPI)
+        finally:
+            api.close()
+            api.api.close()
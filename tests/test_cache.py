@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import time
+from api.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Тесты для дискового кэша ответов API."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ResponseCache(self.cache_dir, default_ttl=60, max_entries=3)
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_make_key_ignores_param_order(self):
+        """Тест независимости ключа от порядка параметров."""
+        key1 = ResponseCache.make_key("https://api.hh.ru/vacancies", {"a": 1, "b": 2})
+        key2 = ResponseCache.make_key("https://api.hh.ru/vacancies", {"b": 2, "a": 1})
+        key3 = ResponseCache.make_key("https://api.hh.ru/vacancies", {"a": 2})
+
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_set_and_get(self):
+        """Тест сохранения и получения записи."""
+        self.cache.set("key", {"items": [1, 2]}, etag='"abc"')
+        entry = self.cache.get("key")
+
+        assert entry is not None
+        assert entry.data == {"items": [1, 2]}
+        assert entry.is_fresh()
+        assert entry.validation_headers() == {"If-None-Match": '"abc"'}
+
+    def test_expired_entry_is_kept_for_revalidation(self):
+        """Тест устаревшей записи: она доступна для условного запроса."""
+        self.cache.set("key", {"items": []}, ttl=0, last_modified="Mon")
+        entry = self.cache.get("key")
+
+        assert entry is not None
+        assert not entry.is_fresh()
+        assert entry.validation_headers() == {"If-Modified-Since": "Mon"}
+
+        self.cache.refresh("key", entry, ttl=60)
+        assert self.cache.get("key").is_fresh()
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно неиспользуемой записи."""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.set("c", 3)
+        self.cache.get("a")
+        self.cache.set("d", 4)
+
+        assert len(self.cache) == 3
+        assert self.cache.get("b") is None
+        assert self.cache.get("a").data == 1
+        assert not os.path.exists(os.path.join(self.cache_dir, "b.json"))
+
+    def test_index_restored_from_disk(self):
+        """Тест восстановления кэша при повторном создании."""
+        self.cache.set("a", 1)
+        time.sleep(0.01)
+        self.cache.set("b", 2)
+
+        cache = ResponseCache(self.cache_dir, max_entries=3)
+        assert len(cache) == 2
+        assert cache.get("b").data == 2
@@ -0,0 +1,51 @@
+from models.encoding import decode_records, encode_records, intern_value, is_encoded
+
+
+class TestEncoding:
+    """Тесты для словарного кодирования записей вакансий."""
+
+    def test_encode_decode_roundtrip(self):
+        """Тест восстановления записей после кодирования."""
+        records = [
+            {
+                "title": "Python Developer",
+                "url": "https://hh.ru/vacancy/1",
+                "company": "TechCorp",
+                "experience": "Нет опыта",
+                "key_skills": ["Python", "SQL"],
+            },
+            {
+                "title": "Java Developer",
+                "url": "https://hh.ru/vacancy/2",
+                "company": "TechCorp",
+                "experience": "Нет опыта",
+                "key_skills": [],
+            },
+            {"title": "Без ссылки", "company": "Other"},
+        ]
+
+        encoded = encode_records([dict(r) for r in records])
+
+        assert is_encoded(encoded)
+        assert not is_encoded(records)
+        assert encoded["dictionaries"]["company"] == ["TechCorp", "Other"]
+        assert encoded["vacancies"][1]["company"] == 0
+        assert encoded["vacancies"][1]["url"] == [0, "2"]
+        assert decode_records(encoded) == records
+
+    def test_decoded_values_are_shared(self):
+        """Тест: одинаковые значения после декодирования — один объект."""
+        records = [{"company": "TechCorp"}, {"company": "TechCorp"}]
+
+        decoded = decode_records(encode_records(records))
+
+        assert decoded[0]["company"] is decoded[1]["company"]
+
+    def test_intern_value(self):
+        """Тест интернирования строк."""
+        first = "".join(["Tech", "Corp"])
+        second = "".join(["Tech", "Corp"])
+
+        assert first is not second
+        assert intern_value(first) is intern_value(second)
+        assert intern_value(None) is None
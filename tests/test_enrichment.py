@@ -0,0 +1,76 @@
+import os
+import tempfile
+from api.enrichment import DetailStore, VacancyEnricher, html_to_text
+
+
+class FakeAPI:
+    """Клиент hh.ru, отдающий подробности вакансий из памяти."""
+
+    def __init__(self):
+        self.requested = []
+
+    def get_vacancy(self, vacancy_id):
+        self.requested.append(vacancy_id)
+        if vacancy_id == "404":
+            return None
+        return {
+            "id": vacancy_id,
+            "description": "<p>Пишем <b>сервисы</b></p><ul><li>Python</li></ul>",
+            "key_skills": [{"name": "Python"}, {"name": "SQL"}],
+            "experience": {"id": "between1And3", "name": "От 1 года до 3 лет"},
+        }
+
+
+class TestVacancyEnricher:
+    """Тесты для дополнения вакансий подробностями."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        fd, self.temp_filename = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        self.api = FakeAPI()
+        self.enricher = VacancyEnricher(self.api, DetailStore(self.temp_filename))
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        if os.path.exists(self.temp_filename):
+            os.unlink(self.temp_filename)
+
+    def test_html_to_text(self):
+        """Тест извлечения текста из HTML-описания."""
+        assert html_to_text("<p>Пишем <b>сервисы</b></p><ul><li>Python</li></ul>") == (
+            "Пишем сервисы\nPython"
+        )
+
+    def test_enrich(self):
+        """Тест дополнения вакансий из выдачи."""
+        vacancies = [{"id": "1", "name": "Python Developer"}, {"id": "404"}]
+
+        enriched = list(self.enricher.enrich(vacancies))
+
+        assert enriched[0]["name"] == "Python Developer"
+        assert enriched[0]["description"] == "Пишем сервисы\nPython"
+        assert enriched[0]["key_skills"] == ["Python", "SQL"]
+        assert enriched[0]["experience"] == "От 1 года до 3 лет"
+        assert enriched[1] == {"id": "404"}
+
+    def test_fetch_details_skips_known_and_duplicate_ids(self):
+        """Тест: уже загруженные и повторяющиеся вакансии не запрашиваются."""
+        assert self.enricher.fetch_details(["1", "1", 2]) == 2
+        assert self.enricher.fetch_details(["1", "2", "3"]) == 1
+        assert sorted(self.api.requested) == ["1", "2", "3"]
+
+    def test_store_is_resumable(self):
+        """Тест продолжения прохода после перезапуска."""
+        self.enricher.fetch_details(["1"])
+        with open(self.temp_filename, "a", encoding="utf-8") as f:
+            f.write('{"id": "2", "descr')  # оборванная запись
+
+        store = DetailStore(self.temp_filename)
+
+        assert "1" in store
+        assert "2" not in store
+        assert store.get("1")["key_skills"] == ["Python", "SQL"]
+
+        VacancyEnricher(self.api, store).fetch_details(["2"])
+        assert "2" in DetailStore(self.temp_filename)
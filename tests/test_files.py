@@ -0,0 +1,52 @@
+import os
+import tempfile
+import pytest
+from utils.files import atomic_write, read_json_lines
+
+
+class TestFiles:
+    """Тесты для атомарной записи и чтения JSON Lines."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "data.json")
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        self.temp_dir.cleanup()
+
+    def test_write_text_and_binary(self):
+        """Тест записи в текстовом и двоичном режиме."""
+        atomic_write(self.filename, lambda f: f.write("Вакансии"))
+        with open(self.filename, "r", encoding="utf-8") as f:
+            assert f.read() == "Вакансии"
+
+        atomic_write(self.filename, lambda f: f.write(b"[]"), binary=True, fsync=False)
+        with open(self.filename, "rb") as f:
+            assert f.read() == b"[]"
+        assert os.listdir(self.temp_dir.name) == ["data.json"]
+
+    def test_error_keeps_original(self):
+        """Тест: при ошибке исходный файл не меняется, временный удаляется."""
+        atomic_write(self.filename, lambda f: f.write("старое"))
+
+        def fail(f):
+            f.write("новое")
+            raise ValueError("ошибка записи")
+
+        with pytest.raises(ValueError):
+            atomic_write(self.filename, fail)
+        with open(self.filename, "r", encoding="utf-8") as f:
+            assert f.read() == "старое"
+        assert os.listdir(self.temp_dir.name) == ["data.json"]
+
+    def test_read_json_lines(self):
+        """Тест: оборванная строка отрезается, поврежденные пропускаются."""
+        assert list(read_json_lines(self.filename)) == []
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write('{"id": 1}\nне JSON\n{"id": 2}\n{"id": 3, "na')
+
+        assert list(read_json_lines(self.filename)) == [{"id": 1}, {"id": 2}]
+        with open(self.filename, "r", encoding="utf-8") as f:
+            assert f.read() == '{"id": 1}\nне JSON\n{"id": 2}\n'
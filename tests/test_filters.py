@@ -150,6 +150,20 @@ class TestFilters:
 
         assert len(top_vacancies) == 0
 
+    def test_get_top_vacancies_matches_sort(self):
+        """Тест: топ N совпадает с началом отсортированного списка, включая равные."""
+        vacancies = [
+            Vacancy(f"Vacancy {i}", f"https://hh.ru/vacancy/{i}", salary, "")
+            for i, salary in enumerate([50000, 90000, 0, 90000, 120000, 50000, 90000])
+        ]
+
+        for top_n in range(len(vacancies) + 1):
+            expected = sort_vacancies(vacancies)[:top_n]
+            assert get_top_vacancies(vacancies, top_n) == expected
+            assert [v.url for v in get_top_vacancies(vacancies, top_n)] == [
+                v.url for v in expected
+            ]
+
     def test_get_vacancies_statistics(self):
         """Тест получения статистики по вакансиям."""
         stats = get_vacancies_statistics(self.vacancies)
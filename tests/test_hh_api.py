@@ -0,0 +1,242 @@
+import shutil
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+import requests
+from api.cache import ResponseCache
+from api.hh_api import HeadHunterAPI, group_by_employer, is_truncated
+from api.metrics import MetricsRegistry
+from api.rate_limiter import RequestScheduler
+from benchmarks.mock_hh_server import MockHHConfig, MockHHServer
+
+
+def make_api(server: MockHHServer, **kwargs) -> HeadHunterAPI:
+    """Создать клиент, направленный на заглушку hh.ru."""
+    kwargs.setdefault("backoff_factor", 0.01)
+    return HeadHunterAPI(
+        api_url=server.url,
+        scheduler=RequestScheduler(rate=1000, initial_concurrency=16),
+        **kwargs,
+    )
+
+
+class TestHeadHunterHelpers:
+    """Тесты для вспомогательных функций клиента hh.ru."""
+
+    def test_group_by_employer(self):
+        """Тест раскладки вакансий по работодателям."""
+        vacancies = [
+            {"id": "1", "employer": {"id": "1740"}},
+            {"id": "2", "employer": {"id": "3529"}},
+            {"id": "3", "employer": {"id": "1740"}},
+            {"id": "4", "employer": {"id": "999"}},
+            {"id": "5"},
+        ]
+
+        grouped = group_by_employer(vacancies, [1740, 3529, 80])
+
+        assert [v["id"] for v in grouped[1740]] == ["1", "3"]
+        assert [v["id"] for v in grouped[3529]] == ["2"]
+        assert grouped[80] == []
+
+    def test_is_truncated(self):
+        """Тест определения усеченной выдачи."""
+        assert is_truncated({"found": 5000, "pages": 20, "per_page": 100})
+        assert not is_truncated({"found": 2000, "pages": 20, "per_page": 100})
+        assert not is_truncated({"found": 10, "pages": 1, "per_page": 100})
+
+
+class TestHeadHunterAPI:
+    """Тесты клиента hh.ru на локальной заглушке."""
+
+    def test_get_vacancies_fetches_all_pages_in_order(self):
+        """Тест загрузки всех страниц с сохранением порядка."""
+        with MockHHServer(MockHHConfig(found=450, latency_ms=5)) as server:
+            vacancies = make_api(server).get_vacancies("Python")
+
+        assert [v["id"] for v in vacancies] == [str(i) for i in range(1, 451)]
+
+    def test_pages_are_fetched_concurrently(self):
+        """Тест: страницы загружаются параллельно, не больше max_workers сразу."""
+        config = MockHHConfig(found=1000, latency="uniform", latency_ms=20)
+        with MockHHServer(config) as server:
+            api = make_api(server, max_workers=4)
+            lock = threading.Lock()
+            state = {"active": 0, "peak": 0}
+            fetch_page = api._fetch_page
+
+            def counting_fetch(*args, **kwargs):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                try:
+                    return fetch_page(*args, **kwargs)
+                finally:
+                    with lock:
+                        state["active"] -= 1
+
+            api._fetch_page = counting_fetch
+            vacancies = api.get_vacancies("Python")
+
+        # Страницы с разной задержкой объединяются в порядке страниц
+        assert [v["id"] for v in vacancies] == [str(i) for i in range(1, 1001)]
+        assert state["peak"] == 4
+
+    def test_get_vacancies_stops_at_depth_cap(self):
+        """Тест: запросы за пределами глубины поиска не выполняются."""
+        with MockHHServer(MockHHConfig(found=5000, max_depth=300)) as server:
+            vacancies = make_api(server).get_vacancies("Python")
+
+            assert len(vacancies) == 300
+            assert 400 not in server.status_counts
+
+    def test_iter_vacancies(self):
+        """Тест потокового получения вакансий."""
+        with MockHHServer(MockHHConfig(found=250)) as server:
+            ids = [v["id"] for v in make_api(server).iter_vacancies("Python")]
+
+        assert ids == [str(i) for i in range(1, 251)]
+
+    def test_retry_on_server_errors(self):
+        """Тест повтора запроса после ответов 503."""
+        with MockHHServer(MockHHConfig(found=10, fail_first=2)) as server:
+            vacancies = make_api(server).get_vacancies("Python")
+
+            assert len(vacancies) == 10
+            assert server.status_counts == {503: 2, 200: 1}
+
+    def test_gives_up_after_max_retries(self):
+        """Тест отказа после исчерпания повторов."""
+        with MockHHServer(MockHHConfig(found=10, fail_first=10)) as server:
+            vacancies = make_api(server, max_retries=2).get_vacancies("Python")
+
+            assert vacancies == []
+            assert server.request_count == 3
+
+    def test_retry_after_is_respected(self):
+        """Тест: перед повтором выдерживается пауза из заголовка Retry-After."""
+        config = MockHHConfig(found=10, throttle_rate=1.0, retry_after=0.3)
+        with MockHHServer(config) as server:
+            api = make_api(server, max_retries=1)
+            started = time.perf_counter()
+            assert api.get_vacancies("Python") == []
+            elapsed = time.perf_counter() - started
+
+            assert server.status_counts == {429: 2}
+        assert elapsed >= 0.3
+
+    def test_retry_delay(self, monkeypatch):
+        """Тест задержки перед повтором: Retry-After, ограничение и джиттер."""
+        api = HeadHunterAPI(backoff_factor=0.5, backoff_max=10.0)
+        try:
+            response = requests.Response()
+            response.headers["Retry-After"] = "3"
+            assert api._retry_delay(0, response) == 3.0
+            response.headers["Retry-After"] = "120"
+            assert api._retry_delay(0, response) == 10.0
+            response.headers["Retry-After"] = formatdate(time.time() + 5, usegmt=True)
+            assert 3.0 <= api._retry_delay(0, response) <= 5.0
+
+            # Без заголовка — экспоненциальный откат с полным джиттером
+            monkeypatch.setattr("api.hh_api.random.uniform", lambda low, high: high)
+            assert [api._retry_delay(n, None) for n in range(6)] == [
+                0.5, 1.0, 2.0, 4.0, 8.0, 10.0
+            ]
+        finally:
+            api.close()
+
+    def test_session_is_reused_with_timeouts(self):
+        """Тест: все страницы идут через одну сессию с заданными таймаутами."""
+        with MockHHServer(MockHHConfig(found=350)) as server:
+            api = make_api(server, timeout=(1.5, 7.0))
+            session_get = api.session.get
+            timeouts = []
+
+            def recording_get(*args, **kwargs):
+                timeouts.append(kwargs["timeout"])
+                return session_get(*args, **kwargs)
+
+            api.session.get = recording_get
+            api.get_vacancies("Python")
+
+        assert timeouts == [(1.5, 7.0)] * 4
+
+    def test_fetch_vacancies_reports_completeness(self):
+        """Тест: выдача неполная при потерянной странице или усечении."""
+        with MockHHServer(MockHHConfig(found=250)) as server:
+            vacancies, complete = make_api(server).fetch_vacancies("Python")
+        assert len(vacancies) == 250
+        assert complete is True
+
+        with MockHHServer(MockHHConfig(found=250, fail_pages=[1])) as server:
+            api = make_api(server, max_retries=1)
+            vacancies, complete = api.fetch_vacancies("Python")
+        assert len(vacancies) == 150
+        assert complete is False
+
+        with MockHHServer(MockHHConfig(found=5000, max_depth=300)) as server:
+            vacancies, complete = make_api(server).fetch_vacancies("Python")
+        assert len(vacancies) == 300
+        assert complete is False
+
+    def test_get_vacancies_by_employers(self):
+        """Тест загрузки вакансий по идентификаторам работодателей."""
+        config = MockHHConfig(found=90, employer_ids=[1740, 3529, 80])
+        with MockHHServer(config) as server:
+            grouped = make_api(server).get_vacancies_by_employers([1740, 80])
+
+        assert len(grouped[1740]) == 30
+        assert len(grouped[80]) == 30
+        assert all(v["employer"]["id"] == "80" for v in grouped[80])
+
+    def test_truncated_employer_is_not_downloaded(self):
+        """Тест: выдача работодателя больше глубины поиска не загружается целиком."""
+        config = MockHHConfig(found=1200, max_depth=300, employer_ids=[1740, 80, 3529])
+        with MockHHServer(config) as server:
+            grouped, incomplete = make_api(server).fetch_vacancies_by_employers(
+                [1740, 80]
+            )
+
+            # Первая страница группы, затем по первой странице каждого
+            assert server.request_count == 3
+        assert incomplete == [1740, 80]
+        assert len(grouped[1740]) == 100
+
+        config = MockHHConfig(found=90, employer_ids=[1740, 3529, 80])
+        with MockHHServer(config) as server:
+            grouped, incomplete = make_api(server).fetch_vacancies_by_employers([80])
+        assert incomplete == []
+        assert len(grouped[80]) == 30
+
+    def test_cache_revalidation(self):
+        """Тест кэша: свежий ответ без запроса, устаревший — через 304."""
+        cache_dir = tempfile.mkdtemp()
+        try:
+            with MockHHServer(MockHHConfig(found=10)) as server:
+                api = make_api(server, cache=ResponseCache(cache_dir, default_ttl=60))
+                first = api.get_vacancies("Python")
+                assert api.get_vacancies("Python") == first
+                assert server.request_count == 1
+
+                api.cache.default_ttl = 0
+                api.cache.clear()
+                api.get_vacancies("Python")
+                assert api.get_vacancies("Python") == first
+                assert server.status_counts == {200: 2, 304: 1}
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def test_request_metrics(self):
+        """Тест сбора метрик запросов."""
+        registry = MetricsRegistry()
+        with MockHHServer(MockHHConfig(found=150, fail_first=1)) as server:
+            make_api(server, metrics=registry).get_vacancies("Python")
+
+        requests_total = registry.counter("hh_requests_total")
+        duration = registry.histogram("hh_request_phase_seconds")
+        assert requests_total.value(endpoint="vacancies", status=503) == 1
+        assert requests_total.value(endpoint="vacancies", status=200) == 2
+        assert registry.counter("hh_retries_total").value(endpoint="vacancies") == 1
+        assert duration.count(endpoint="vacancies", phase="decode") == 2
+        assert duration.count(endpoint="vacancies", phase="connect") == 3
@@ -0,0 +1,87 @@
+import os
+import tempfile
+from storage.json_index import JSONIndex
+from storage.records import record_filter
+
+
+def make_records():
+    """Создать тестовые записи."""
+    return [
+        {"title": "A", "url": "u1", "salary": 150000, "company": "Яндекс"},
+        {"title": "B", "url": "u2", "salary": 90000, "company": "ТехКорп"},
+        {"title": "C", "url": "u3", "salary": 150000, "company": "Яндекс Маркет"},
+        {"title": "D", "url": "u4", "salary": 0, "company": "", "hh_id": "4"},
+        {"title": "E", "url": "u5", "salary": 200000, "company": "ТехКорп"},
+    ]
+
+
+def scan(records, **kwargs):
+    """Номера подходящих записей полным перебором."""
+    matches = record_filter(**kwargs)
+    return [i for i, record in enumerate(records) if matches(record)]
+
+
+QUERIES = [
+    {"min_salary": 100000},
+    {"max_salary": 150000},
+    {"min_salary": 90000, "max_salary": 150000},
+    {"company": "яндекс"},
+    {"company": "техкорп", "min_salary": 100000},
+]
+
+
+class TestJSONIndex:
+    """Тесты для индексов JSONIndex."""
+
+    def test_candidates_match_full_scan(self):
+        """Тест: кандидаты из индексов совпадают с полным перебором."""
+        records = make_records()
+        index = JSONIndex.build(records)
+
+        for query in QUERIES:
+            assert index.candidates(**query) == scan(records, **query), query
+        assert index.candidates(keyword="python") is None
+
+    def test_incremental_updates_match_rebuild(self):
+        """Тест: индексы после добавления и удаления совпадают с построенными."""
+        records = make_records()
+        index = JSONIndex.build(records[:2])
+        for record in records[2:]:
+            index.append(record)
+
+        index.remove(1, records.pop(1))
+        index.remove(0, records.pop(0))
+
+        rebuilt = JSONIndex.build(records)
+        assert index.to_json((1,)) == rebuilt.to_json((1,))
+        assert index.find(("hh", "4")) == 1
+        assert index.find(("url", "u2", "B")) is None
+
+    def test_offsets(self):
+        """Тест: смещения дописываются, а после удаления записи сбрасываются."""
+        records = make_records()
+        index = JSONIndex.build(records[:2], [1, 10])
+        index.append(records[2], 20)
+        assert index.offsets == [1, 10, 20]
+
+        index.append(records[3])
+        assert index.offsets is None
+
+        index = JSONIndex.build(records, [1, 10, 20, 30, 40])
+        index.remove(0, records[0])
+        assert index.offsets is None
+
+    def test_save_and_load(self):
+        """Тест: индексы загружаются только для той же сигнатуры файла."""
+        index = JSONIndex.build(make_records())
+        fd, filename = tempfile.mkstemp(suffix=".idx")
+        os.close(fd)
+        try:
+            index.save(filename, (1, 2, 3))
+
+            loaded = JSONIndex.load(filename, (1, 2, 3))
+            assert loaded.to_json((1,)) == index.to_json((1,))
+            assert loaded.find(("url", "u3", "C")) == 2
+            assert JSONIndex.load(filename, (1, 2, 4)) is None
+        finally:
+            os.unlink(filename)
@@ -2,6 +2,7 @@ import json
 import os
 import tempfile
 from models.vacancy import Vacancy
+import storage.json_saver as json_saver_module
 from storage.json_saver import JSONSaver
 
 
@@ -22,9 +23,10 @@ class TestJSONSaver:
 
     def teardown_method(self):
         """Очистка после каждого теста."""
-        # Удаляем временный файл
-        if os.path.exists(self.temp_filename):
-            os.unlink(self.temp_filename)
+        # Удаляем временный файл и файл индексов
+        for filename in (self.temp_filename, self.json_saver.index_filename):
+            if os.path.exists(filename):
+                os.unlink(filename)
 
     def test_init_creates_file(self):
         """Тест создания файла при инициализации."""
@@ -242,3 +244,303 @@ class TestJSONSaver:
         # Проверяем, что вакансии сохранены
         saved_vacancies = self.json_saver.get_vacancies()
         assert len(saved_vacancies) == 2
+
+    def test_dictionary_encoding(self):
+        """Тест сохранения со словарным кодированием повторяющихся полей."""
+        saver = JSONSaver(self.temp_filename, dictionary_encoding=True)
+        vacancies = [
+            Vacancy(
+                title=f"Python Developer {i}",
+                url=f"https://hh.ru/vacancy/{i}",
+                salary={"from": 100000 + i},
+                description="Python разработка",
+                requirements="Опыт работы от 3 лет",
+                company="TechCorp",
+                key_skills=["Python", "SQL"],
+                employer_id="1740",
+            )
+            for i in range(3)
+        ]
+        saver.add_vacancies(vacancies)
+
+        with open(self.temp_filename, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["dictionaries"]["company"] == ["TechCorp"]
+        assert data["dictionaries"]["url_prefix"] == ["https://hh.ru/vacancy/"]
+
+        # Файл читается хранилищем с любыми настройками
+        loaded = JSONSaver(self.temp_filename).get_vacancies()
+        assert [v.url for v in loaded] == [v.url for v in vacancies]
+        assert [v.salary for v in loaded] == [100000, 100001, 100002]
+        assert loaded[0].key_skills == ("Python", "SQL")
+        assert loaded[0].company is loaded[2].company
+        assert data["dictionaries"]["employer_id"] == ["1740"]
+        assert loaded[0].employer_id is loaded[2].employer_id == "1740"
+
+    def test_duplicate_detected_by_hh_id(self):
+        """Тест поиска дубликатов и удаления по идентификатору hh.ru."""
+        vacancy = Vacancy(
+            title="Python Developer",
+            url="https://hh.ru/vacancy/1",
+            salary=100000,
+            description="Python разработка",
+            hh_id="1",
+        )
+        renamed = Vacancy(
+            title="Senior Python Developer",
+            url="https://hh.ru/vacancy/1?from=search",
+            salary=150000,
+            description="Python разработка",
+            hh_id="1",
+        )
+
+        assert self.json_saver.add_vacancy(vacancy) is True
+        assert self.json_saver.add_vacancy(renamed) is False
+        assert self.json_saver.get_vacancies()[0].hh_id == "1"
+
+        assert self.json_saver.delete_vacancy(renamed) is True
+        assert self.json_saver.get_vacancies() == []
+
+    def test_duplicate_without_hh_id(self):
+        """Тест: запись без hh_id и вакансия с ним совпадают по ссылке hh.ru."""
+        legacy = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, "")
+        with_id = Vacancy(
+            "Python Developer", "https://hh.ru/vacancy/1", 100000, "", hh_id="1"
+        )
+
+        assert self.json_saver.add_vacancy(legacy) is True
+        assert self.json_saver.add_vacancy(with_id) is False
+        assert self.json_saver.delete_vacancy(with_id) is True
+        assert self.json_saver.get_vacancies() == []
+
+    def test_add_vacancies_single_write(self):
+        """Тест пакетного добавления: одна запись файла, дубликаты отброшены."""
+        self.json_saver.add_vacancy(
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, "")
+        )
+        vacancies = [
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, ""),
+            Vacancy("Java Developer", "https://hh.ru/vacancy/2", 90000, "", hh_id="2"),
+            Vacancy("Java Developer", "https://hh.ru/vacancy/2", 90000, "", hh_id="2"),
+            Vacancy("Go Developer", "https://hh.ru/vacancy/3", 120000, ""),
+        ]
+        saves = []
+        original_save = self.json_saver._save_vacancies
+
+        def counting_save(data, index=None):
+            saves.append(len(data))
+            original_save(data, index)
+
+        self.json_saver._save_vacancies = counting_save
+
+        assert self.json_saver.add_vacancies(iter(vacancies)) == 2
+        assert saves == [3]
+        assert self.json_saver.add_vacancies(vacancies) == 0
+        assert saves == [3]
+
+    def test_reads_are_cached_until_file_changes(self, monkeypatch):
+        """Тест кэша чтения: файл разбирается заново только после изменения."""
+        self.json_saver.add_vacancy(
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, "")
+        )
+        loads = []
+        original_load = json.load
+
+        def counting_load(f):
+            loads.append(f.name)
+            return original_load(f)
+
+        monkeypatch.setattr(json, "load", counting_load)
+
+        first = self.json_saver.get_vacancies()
+        second = self.json_saver.get_vacancies(min_salary=50000)
+        assert loads == []
+        assert first[0] is second[0]
+
+        # Изменение файла другим процессом
+        other = JSONSaver(self.temp_filename)
+        other.add_vacancy(
+            Vacancy("Java Developer", "https://hh.ru/vacancy/2", 90000, "")
+        )
+        assert len(self.json_saver.get_vacancies()) == 2
+        assert loads.count(self.temp_filename) == 2
+
+    def test_cache_size_limit(self, monkeypatch):
+        """Тест: файл больше ограничения в памяти не хранится."""
+        saver = JSONSaver(self.temp_filename, max_cache_bytes=0)
+        saver.add_vacancy(
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, "")
+        )
+        loads = []
+        original_load = json.load
+        monkeypatch.setattr(
+            json, "load", lambda f: loads.append(f.name) or original_load(f)
+        )
+        original_iter = json_saver_module.iter_records
+        monkeypatch.setattr(
+            json_saver_module,
+            "iter_records",
+            lambda name: loads.append(name) or original_iter(name),
+        )
+
+        saver.get_vacancies()
+        saver.get_vacancies()
+
+        assert len(loads) == 2
+
+    def test_large_file_is_streamed(self, monkeypatch):
+        """Тест: файл больше ограничения фильтруется потоково, без json.load."""
+        saver = JSONSaver(
+            self.temp_filename, dictionary_encoding=True, max_cache_bytes=0
+        )
+        saver.add_vacancies(
+            [
+                Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, ""),
+                Vacancy("Java Developer", "https://hh.ru/vacancy/2", 150000, ""),
+                Vacancy("Python Lead", "https://hh.ru/vacancy/3", 250000, ""),
+            ]
+        )
+        monkeypatch.setattr(json, "load", None)
+
+        stream = saver.iter_vacancies(keyword="python")
+        assert next(stream).url == "https://hh.ru/vacancy/1"
+        stream.close()
+
+        result = saver.get_vacancies(keyword="python", min_salary=120000)
+        assert [v.url for v in result] == ["https://hh.ru/vacancy/3"]
+
+    def test_large_file_is_changed_in_place(self, monkeypatch):
+        """Тест: в большой файл вакансии дописываются, удаление — потоково."""
+        saver = JSONSaver(self.temp_filename, max_cache_bytes=1)
+        saver.clear_all()
+        monkeypatch.setattr(json, "load", None)
+
+        vacancies = [
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, ""),
+            Vacancy("Java Developer", "https://hh.ru/vacancy/2", 150000, ""),
+        ]
+        assert saver.add_vacancies(vacancies) == 2
+        assert saver.add_vacancy(
+            Vacancy("Go Developer", "https://hh.ru/vacancy/3", 250000, "", hh_id="3")
+        )
+        assert saver.add_vacancies(vacancies) == 0
+        assert saver.delete_vacancy(vacancies[0])
+        assert not saver.delete_vacancy(vacancies[0])
+        monkeypatch.undo()
+
+        with open(self.temp_filename, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert [record["url"] for record in data] == [
+            "https://hh.ru/vacancy/2",
+            "https://hh.ru/vacancy/3",
+        ]
+        reopened = JSONSaver(self.temp_filename)
+        assert [v.url for v in reopened.get_vacancies(min_salary=200000)] == [
+            "https://hh.ru/vacancy/3"
+        ]
+        assert not reopened.add_vacancy(
+            Vacancy("Go", "https://hh.ru/vacancy/30", 0, "", hh_id="3")
+        )
+
+    def test_large_file_reads_candidates_by_offset(self, monkeypatch):
+        """Тест: фильтры по индексам читают из большого файла только кандидатов."""
+        saver = JSONSaver(self.temp_filename, max_cache_bytes=1)
+        saver.clear_all()
+        saver.add_vacancies(
+            [
+                Vacancy("Python", "https://hh.ru/vacancy/1", 100000, "", "", "Яндекс"),
+                Vacancy("Java", "https://hh.ru/vacancy/2", 150000, "", "", "ТехКорп"),
+                Vacancy("Go", "https://hh.ru/vacancy/3", 250000, "", "", "Яндекс"),
+            ]
+        )
+        saver.delete_vacancy(Vacancy("Python", "https://hh.ru/vacancy/1", 0, ""))
+        saver.add_vacancy(
+            Vacancy("Rust", "https://hh.ru/vacancy/4", 300000, "", "", "Яндекс")
+        )
+        monkeypatch.setattr(json_saver_module, "iter_records", None)
+
+        reopened = JSONSaver(self.temp_filename, max_cache_bytes=1)
+        result = reopened.get_vacancies(min_salary=200000, company="яндекс")
+        assert [v.url for v in result] == [
+            "https://hh.ru/vacancy/3",
+            "https://hh.ru/vacancy/4",
+        ]
+        result = reopened.get_vacancies(max_salary=200000)
+        assert [v.company for v in result] == ["ТехКорп"]
+
+    def test_filters_run_before_vacancy_construction(self, monkeypatch):
+        """Тест: объекты Vacancy создаются только для подходящих записей."""
+        self.json_saver.add_vacancies(
+            [
+                Vacancy(f"Developer {i}", f"https://hh.ru/vacancy/{i}", i * 1000, "")
+                for i in range(1, 101)
+            ]
+        )
+        self.json_saver.invalidate_cache()
+        built = []
+        original = json_saver_module.record_to_vacancy
+        monkeypatch.setattr(
+            json_saver_module,
+            "record_to_vacancy",
+            lambda record: built.append(record["url"]) or original(record),
+        )
+
+        result = self.json_saver.get_vacancies(min_salary=96000)
+        assert [v.salary for v in result] == [96000, 97000, 98000, 99000, 100000]
+        assert len(built) == 5
+
+        again = self.json_saver.get_vacancies(min_salary=99000)
+        assert again[0] is result[3]
+        assert len(built) == 5
+
+        limited = self.json_saver.get_vacancies(limit=2, keyword="developer")
+        assert [v.salary for v in limited] == [1000, 2000]
+        assert len(built) == 7
+
+    def test_get_vacancy_fields(self):
+        """Тест получения отдельных полей вакансий с фильтрами и ограничением."""
+        self.json_saver.add_vacancies(
+            [
+                Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, ""),
+                Vacancy("Java Developer", "https://hh.ru/vacancy/2", 150000, ""),
+                Vacancy("Python Lead", "https://hh.ru/vacancy/3", 250000, ""),
+            ]
+        )
+
+        fields = self.json_saver.get_vacancy_fields(
+            ["url", "salary"], limit=1, keyword="python", min_salary=120000
+        )
+        assert fields == [{"url": "https://hh.ru/vacancy/3", "salary": 250000}]
+
+    def test_sidecar_indexes(self):
+        """Тест: индексы хранятся рядом с файлом и перестраиваются при изменении."""
+        self.json_saver.add_vacancies(
+            [
+                Vacancy("Python", "https://hh.ru/vacancy/1", 100000, "", "", "A"),
+                Vacancy("Java", "https://hh.ru/vacancy/2", 150000, "", "", "B"),
+                Vacancy("Go", "https://hh.ru/vacancy/3", 250000, "", "", "A"),
+            ]
+        )
+        assert os.path.exists(self.json_saver.index_filename)
+        self.json_saver.delete_vacancy(
+            Vacancy("Python", "https://hh.ru/vacancy/1", 0, "")
+        )
+
+        reopened = JSONSaver(self.temp_filename)
+        result = reopened.get_vacancies(min_salary=120000, company="a")
+        assert [v.url for v in result] == ["https://hh.ru/vacancy/3"]
+
+        # Файл изменен без обновления индексов: они строятся заново
+        record = {
+            "title": "Rust",
+            "url": "https://hh.ru/vacancy/4",
+            "salary": 300000,
+            "company": "Яндекс",
+        }
+        with open(self.temp_filename, "w", encoding="utf-8") as f:
+            json.dump([record], f)
+        result = reopened.get_vacancies(min_salary=120000, company="яндекс")
+        assert [v.url for v in result] == ["https://hh.ru/vacancy/4"]
+        assert not reopened.add_vacancy(
+            Vacancy("Rust", "https://hh.ru/vacancy/4", 300000, "")
+        )
@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+import pytest
+from models.encoding import encode_records
+from storage.json_stream import iter_record_offsets, iter_records, read_records
+
+
+def make_records(count: int):
+    """Создать тестовые записи."""
+    return [
+        {
+            "title": f"Разработчик {i}",
+            "url": f"https://hh.ru/vacancy/{i}",
+            "salary": 100000 + i * 1000,
+            "company": "ТехКорп" if i % 2 else "Яндекс",
+            "key_skills": ["Python"],
+            "description": 'Описание "в кавычках" [и скобках], {}',
+        }
+        for i in range(count)
+    ]
+
+
+class TestIterRecords:
+    """Тесты для потокового чтения файла JSONSaver."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        fd, self.temp_filename = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        if os.path.exists(self.temp_filename):
+            os.unlink(self.temp_filename)
+
+    def write(self, data, **kwargs):
+        with open(self.temp_filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, **kwargs)
+
+    def test_small_chunks(self):
+        """Тест: элементы на границах фрагментов разбираются целиком."""
+        records = make_records(20)
+        self.write(records, indent=2)
+
+        for chunk_size in (1, 7, 64, 1 << 20):
+            assert list(iter_records(self.temp_filename, chunk_size)) == records
+
+    def test_dictionary_encoded_file(self):
+        """Тест чтения файла со словарным кодированием."""
+        records = make_records(10)
+        self.write(encode_records(records), separators=(",", ":"))
+
+        assert list(iter_records(self.temp_filename, chunk_size=16)) == records
+
+    def test_numbers_and_empty_array(self):
+        """Тест: число на границе фрагмента не обрезается, пустой массив пуст."""
+        with open(self.temp_filename, "w", encoding="utf-8") as f:
+            f.write("[12345, 678]")
+        assert list(iter_records(self.temp_filename, chunk_size=3)) == [12345, 678]
+
+        self.write([])
+        assert list(iter_records(self.temp_filename)) == []
+
+    def test_corrupted_file(self):
+        """Тест: поврежденный файл вызывает JSONDecodeError."""
+        with open(self.temp_filename, "w", encoding="utf-8") as f:
+            f.write('[{"title": "a"} {"title": "b"}]')
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_records(self.temp_filename))
+
+    def test_record_offsets(self):
+        """Тест: смещения указывают на начало записей, и по ним читаются записи."""
+        records = make_records(20)
+        self.write(records, indent=2)
+        with open(self.temp_filename, "rb") as f:
+            data = f.read()
+
+        for chunk_size in (1, 7, 1 << 20):
+            pairs = list(iter_record_offsets(self.temp_filename, chunk_size))
+            assert [record for _, record in pairs] == records
+            offsets = [offset for offset, _ in pairs]
+            assert all(data[offset:offset + 1] == b"{" for offset in offsets)
+
+        selected = offsets[3:20:4]
+        expected = records[3:20:4]
+        assert list(read_records(self.temp_filename, selected, 8)) == expected
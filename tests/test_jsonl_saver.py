@@ -0,0 +1,142 @@
+import os
+import tempfile
+from models.vacancy import Vacancy
+import storage.jsonl_saver as jsonl_saver_module
+from storage.jsonl_saver import JSONLinesSaver
+
+
+def make_vacancy(index: int, **kwargs) -> Vacancy:
+    """Создать тестовую вакансию."""
+    return Vacancy(
+        title=f"Python Developer {index}",
+        url=f"https://hh.ru/vacancy/{index}",
+        salary=100000 + index,
+        description="Python разработка",
+        company="TechCorp",
+        **kwargs,
+    )
+
+
+class TestJSONLinesSaver:
+    """Тесты для журнального хранилища JSONLinesSaver."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        fd, self.temp_filename = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        self.saver = JSONLinesSaver(self.temp_filename, background_compaction=False)
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        if os.path.exists(self.temp_filename):
+            os.unlink(self.temp_filename)
+
+    def count_lines(self) -> int:
+        with open(self.temp_filename, "r", encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def test_add_and_reload(self):
+        """Тест добавления вакансий и восстановления состояния из журнала."""
+        assert self.saver.add_vacancy(make_vacancy(1, hh_id="1")) is True
+        assert self.saver.add_vacancy(make_vacancy(1, hh_id="1")) is False
+        assert self.saver.add_vacancies([make_vacancy(2), make_vacancy(3)]) == 2
+        assert self.count_lines() == 3
+
+        reloaded = JSONLinesSaver(self.temp_filename).get_vacancies(min_salary=100002)
+        assert [v.url for v in reloaded] == [
+            "https://hh.ru/vacancy/2",
+            "https://hh.ru/vacancy/3",
+        ]
+
+    def test_duplicate_without_hh_id(self):
+        """Тест: запись без hh_id и вакансия с ним совпадают по ссылке hh.ru."""
+        assert self.saver.add_vacancy(make_vacancy(1)) is True
+        assert self.saver.add_vacancy(make_vacancy(1, hh_id="1")) is False
+        assert self.saver.delete_vacancy(make_vacancy(1, hh_id="1")) is True
+        assert JSONLinesSaver(self.temp_filename).get_vacancies() == []
+
+    def test_filters_run_before_vacancy_construction(self, monkeypatch):
+        """Тест: объекты Vacancy создаются только для подходящих записей."""
+        self.saver.add_vacancies([make_vacancy(i) for i in range(100)])
+        built = []
+        original = jsonl_saver_module.record_to_vacancy
+        monkeypatch.setattr(
+            jsonl_saver_module,
+            "record_to_vacancy",
+            lambda record: built.append(record["url"]) or original(record),
+        )
+
+        result = self.saver.get_vacancies(min_salary=100097, company="techcorp")
+        assert [v.salary for v in result] == [100097, 100098, 100099]
+        assert len(built) == 3
+
+    def test_delete_and_clear_are_appended(self):
+        """Тест: удаление и очистка дописывают отметки, а не переписывают файл."""
+        self.saver.add_vacancies([make_vacancy(i) for i in range(3)])
+
+        assert self.saver.delete_vacancy(make_vacancy(1)) is True
+        assert self.saver.delete_vacancy(make_vacancy(1)) is False
+        assert self.count_lines() == 4
+        assert len(JSONLinesSaver(self.temp_filename).get_vacancies()) == 2
+
+        assert self.saver.clear_all() is True
+        self.saver.add_vacancy(make_vacancy(5))
+        assert self.count_lines() == 6
+        reloaded = JSONLinesSaver(self.temp_filename).get_vacancies()
+        assert [v.url for v in reloaded] == ["https://hh.ru/vacancy/5"]
+
+    def test_truncated_line_is_dropped(self):
+        """Тест восстановления после обрыва записи последней строки."""
+        self.saver.add_vacancies([make_vacancy(1), make_vacancy(2)])
+        with open(self.temp_filename, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "vacancy": {"title": "Обры')
+
+        saver = JSONLinesSaver(self.temp_filename)
+        saver.add_vacancy(make_vacancy(3))
+
+        assert len(JSONLinesSaver(self.temp_filename).get_vacancies()) == 3
+
+    def test_compaction(self):
+        """Тест компактирования журнала при большом числе лишних строк."""
+        saver = JSONLinesSaver(
+            self.temp_filename, compact_min_lines=5, background_compaction=False
+        )
+        vacancies = [make_vacancy(i) for i in range(6)]
+        saver.add_vacancies(vacancies)
+        for vacancy in vacancies[:4]:
+            saver.delete_vacancy(vacancy)
+
+        # После третьего удаления лишних строк 6 из 9 — журнал переписан
+        # до 3 записей, затем дописана отметка четвертого удаления
+        assert self.count_lines() == 4
+        reloaded = JSONLinesSaver(self.temp_filename).get_vacancies()
+        assert [v.url for v in reloaded] == [v.url for v in vacancies[4:]]
+
+    def test_background_compaction_keeps_concurrent_writes(self):
+        """Тест: записи, сделанные во время компактирования, не теряются."""
+        saver = JSONLinesSaver(self.temp_filename, compact_min_lines=1)
+        saver.add_vacancies([make_vacancy(i) for i in range(50)])
+        saver.clear_all()
+        for i in range(50, 60):
+            saver.add_vacancy(make_vacancy(i))
+        saver.close()
+        saver.compact()
+
+        assert self.count_lines() == 10
+        reloaded = JSONLinesSaver(self.temp_filename).get_vacancies()
+        assert sorted(v.salary for v in reloaded) == list(range(100050, 100060))
+
+    def test_failed_write_keeps_state(self):
+        """Тест: при ошибке записи журнала состояние в памяти не меняется."""
+        self.saver.add_vacancies([make_vacancy(1), make_vacancy(2)])
+        self.saver.filename = os.path.join(self.temp_filename, "missing.jsonl")
+
+        assert self.saver.add_vacancy(make_vacancy(3)) is False
+        assert self.saver.delete_vacancy(make_vacancy(1)) is False
+        assert self.saver.clear_all() is False
+        assert len(self.saver.get_vacancies()) == 2
+
+        self.saver.filename = self.temp_filename
+        assert self.saver.add_vacancy(make_vacancy(3)) is True
+        assert self.saver.add_vacancies([make_vacancy(4), make_vacancy(4)]) == 1
+        assert len(JSONLinesSaver(self.temp_filename).get_vacancies()) == 4
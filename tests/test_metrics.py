@@ -0,0 +1,52 @@
+import json
+from api.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Тесты для реестра метрик."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.registry = MetricsRegistry()
+
+    def test_counter(self):
+        """Тест счетчика с метками."""
+        counter = self.registry.counter("requests_total", "Запросы")
+        counter.inc(endpoint="vacancies", status=200)
+        counter.inc(2, endpoint="vacancies", status=200)
+        counter.inc(endpoint="vacancies", status=429)
+
+        assert counter.value(endpoint="vacancies", status=200) == 3
+        assert counter.value(endpoint="vacancies", status=429) == 1
+        assert self.registry.counter("requests_total") is counter
+
+    def test_histogram_json(self):
+        """Тест выгрузки гистограммы в JSON."""
+        histogram = self.registry.histogram("latency", "Задержка", buckets=(0.1, 1))
+        histogram.observe(0.05, phase="ttfb")
+        histogram.observe(0.5, phase="ttfb")
+        histogram.observe(5, phase="ttfb")
+
+        data = json.loads(self.registry.to_json())
+        series = data["latency"]["series"][0]
+
+        assert data["latency"]["type"] == "histogram"
+        assert series["labels"] == {"phase": "ttfb"}
+        assert series["buckets"] == {"0.1": 1, "1": 1, "+Inf": 1}
+        assert series["count"] == 3
+        assert series["sum"] == 5.55
+
+    def test_prometheus_format(self):
+        """Тест выгрузки в текстовом формате Prometheus."""
+        self.registry.counter("requests_total", "Запросы").inc(status=200)
+        histogram = self.registry.histogram("latency", "Задержка", buckets=(0.1,))
+        histogram.observe(0.05, phase="ttfb")
+        histogram.observe(0.2, phase="ttfb")
+
+        text = self.registry.to_prometheus()
+
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{status="200"} 1' in text
+        assert 'latency_bucket{phase="ttfb",le="0.1"} 1' in text
+        assert 'latency_bucket{phase="ttfb",le="+Inf"} 2' in text
+        assert 'latency_count{phase="ttfb"} 2' in text
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+from api.query_planner import QueryPlanner, DATE_FORMAT
+
+
+class FakeAPI:
+    """Клиент hh.ru с вакансиями в памяти для тестов планировщика."""
+
+    areas = {113: ["1", "2"], "1": [], "2": []}
+
+    def __init__(self, vacancies, max_depth):
+        self.vacancies = vacancies
+        self.max_depth = max_depth
+
+    def _matching(self, params):
+        result = []
+        for vacancy in self.vacancies:
+            area = params.get("area", 113)
+            if area != 113 and vacancy["area"] != area:
+                continue
+            published = datetime.strptime(vacancy["published_at"], DATE_FORMAT)
+            if "date_from" in params and published < datetime.strptime(
+                params["date_from"], DATE_FORMAT
+            ):
+                continue
+            if "date_to" in params and published > datetime.strptime(
+                params["date_to"], DATE_FORMAT
+            ):
+                continue
+            result.append(vacancy)
+        return result
+
+    def count_vacancies(self, search_query, **params):
+        return len(self._matching(params))
+
+    def get_area_children(self, area_id):
+        return [{"id": child} for child in self.areas[area_id]]
+
+    def get_vacancies(self, search_query, **params):
+        return self._matching(params)[: self.max_depth]
+
+    def fetch_vacancies(self, search_query, **params):
+        matching = self._matching(params)
+        return matching[: self.max_depth], len(matching) <= self.max_depth
+
+
+class TestQueryPlanner:
+    """Тесты для планировщика поисковых запросов."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        now = datetime.now(timezone.utc)
+        self.vacancies = [
+            {
+                "id": str(i),
+                "area": "1" if i % 4 else "2",
+                "published_at": (now - timedelta(hours=i)).strftime(DATE_FORMAT),
+            }
+            for i in range(100)
+        ]
+
+    def test_small_query_is_not_split(self):
+        """Тест: запрос в пределах глубины поиска не делится."""
+        planner = QueryPlanner(FakeAPI(self.vacancies, 200), max_depth=200)
+
+        assert planner.plan("Python") == [{}]
+
+    def test_split_collects_all_vacancies(self):
+        """Тест: разбиение позволяет собрать все вакансии без дубликатов."""
+        planner = QueryPlanner(FakeAPI(self.vacancies, 20), max_depth=20)
+
+        plan = planner.plan("Python")
+        vacancies = planner.get_vacancies("Python")
+
+        assert len(plan) > 2
+        assert all("area" in sub_params for sub_params in plan)
+        assert sorted(v["id"] for v in vacancies) == sorted(
+            v["id"] for v in self.vacancies
+        )
+
+    def test_parent_area_vacancies_are_kept(self):
+        """Тест: вакансии региона-родителя не теряются при делении по регионам."""
+        for vacancy in self.vacancies[::10]:
+            vacancy["area"] = 113
+        planner = QueryPlanner(FakeAPI(self.vacancies, 20), max_depth=20)
+
+        plan = planner.plan("Python")
+        vacancies = planner.get_vacancies("Python")
+
+        assert all("area" not in sub_params for sub_params in plan)
+        assert sorted(v["id"] for v in vacancies) == sorted(
+            v["id"] for v in self.vacancies
+        )
+
+    def test_fetch_vacancies_reports_completeness(self):
+        """Тест: выдача неполная, если запрос нельзя разбить до глубины поиска."""
+        planner = QueryPlanner(FakeAPI(self.vacancies, 20), max_depth=20)
+        vacancies, complete = planner.fetch_vacancies("Python")
+
+        assert complete is True
+        assert len(vacancies) == len(self.vacancies)
+
+        planner = QueryPlanner(
+            FakeAPI(self.vacancies, 20), max_depth=20, min_window=timedelta(days=60)
+        )
+        vacancies, complete = planner.fetch_vacancies("Python")
+
+        assert complete is False
+        assert len(vacancies) == 40
@@ -0,0 +1,90 @@
+import threading
+import time
+from api.rate_limiter import (
+    RequestScheduler,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_BULK,
+)
+
+
+class TestRequestScheduler:
+    """Тесты для планировщика запросов."""
+
+    def test_token_bucket_limits_rate(self):
+        """Тест ограничения частоты запросов."""
+        scheduler = RequestScheduler(rate=50, burst=1, initial_concurrency=4)
+
+        start = time.monotonic()
+        for _ in range(6):
+            with scheduler.slot() as slot:
+                slot.status_code = 200
+        elapsed = time.monotonic() - start
+
+        # Первый запрос проходит сразу, остальные пять ждут по 1/50 с
+        assert elapsed >= 5 / 50 * 0.9
+
+    def test_concurrency_decreases_on_429(self):
+        """Тест уменьшения предела параллельности при ответе 429."""
+        scheduler = RequestScheduler(initial_concurrency=8, min_concurrency=1)
+
+        with scheduler.slot() as slot:
+            slot.status_code = 429
+
+        assert scheduler.concurrency == 4
+        assert scheduler.in_flight == 0
+
+    def test_concurrency_increases_on_success(self):
+        """Тест увеличения предела параллельности при успешных ответах."""
+        scheduler = RequestScheduler(
+            rate=1000, initial_concurrency=2, max_concurrency=3
+        )
+
+        for _ in range(10):
+            with scheduler.slot() as slot:
+                slot.status_code = 200
+
+        assert scheduler.concurrency == 3
+
+    def test_concurrency_unchanged_on_server_error(self):
+        """Тест: ошибки сервера не влияют на предел параллельности."""
+        scheduler = RequestScheduler(initial_concurrency=4)
+
+        with scheduler.slot() as slot:
+            slot.status_code = 503
+        with scheduler.slot():
+            pass
+
+        assert scheduler.concurrency == 4
+
+    def test_priority_order(self):
+        """Тест обслуживания ожидающих запросов в порядке приоритета."""
+        scheduler = RequestScheduler(rate=1000, initial_concurrency=1)
+        order = []
+
+        scheduler.acquire()
+
+        def worker(name, priority):
+            with scheduler.slot(priority=priority):
+                order.append(name)
+
+        threads = [threading.Thread(target=worker, args=("bulk", PRIORITY_BULK))]
+        threads[0].start()
+        time.sleep(0.05)
+        threads.append(
+            threading.Thread(target=worker, args=("search", PRIORITY_INTERACTIVE))
+        )
+        threads[1].start()
+        time.sleep(0.05)
+
+        scheduler.release(200)
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert order == ["search", "bulk"]
+
+    def test_endpoint_priority(self):
+        """Тест приоритета по умолчанию для эндпоинта."""
+        scheduler = RequestScheduler(endpoint_priorities={"vacancies": 1})
+
+        assert scheduler._resolve_priority("vacancies", None) == 1
+        assert scheduler._resolve_priority("vacancies", 7) == 7
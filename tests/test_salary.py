@@ -0,0 +1,194 @@
+import os
+import tempfile
+import time
+from api.exchange_rates import ExchangeRates
+from api.hh_api import HeadHunterAPI
+from api.rate_limiter import RequestScheduler
+from benchmarks.mock_hh_server import MockHHServer
+from models.salary import Salary
+from models.vacancy import Vacancy
+from models.vacancy_batch import VacancyBatch
+
+RATES = {"RUR": 1.0, "USD": 0.0125, "EUR": 0.0115}
+
+
+class FakeAPI:
+    """Клиент hh.ru, отдающий справочник валют из памяти."""
+
+    def __init__(self, available=True):
+        self.available = available
+        self.requests = 0
+
+    def get_dictionaries(self):
+        self.requests += 1
+        if not self.available:
+            return None
+        return {
+            "currency": [
+                {"code": code, "abbr": code, "rate": rate}
+                for code, rate in RATES.items()
+            ]
+        }
+
+
+class TestSalary:
+    """Тесты для зарплаты с валютой."""
+
+    def test_from_json(self):
+        """Тест разбора зарплаты hh.ru."""
+        salary = Salary.from_json(
+            {"from": 1000, "to": None, "currency": "USD", "gross": True}
+        )
+
+        assert salary.salary_from == 1000
+        assert salary.salary_to is None
+        assert salary.currency == "USD"
+        assert salary.gross is True
+        assert salary.value == 1000
+        assert Salary.from_json(None) is None
+        assert Salary.from_json({"from": None, "to": None}) is None
+
+    def test_in_rub(self):
+        """Тест пересчета зарплаты в рубли."""
+        salary = Salary(1000, 2000, "USD").in_rub(RATES)
+
+        assert salary == Salary(80000, 160000, "RUR")
+        assert Salary(1000, None, "XXX").in_rub(RATES).currency == "XXX"
+
+    def test_cast_to_object_list_normalizes_currency(self):
+        """Тест сравнения зарплат в разных валютах после пересчета."""
+        vacancies_json = [
+            {
+                "name": "Remote Developer",
+                "alternate_url": "https://hh.ru/vacancy/1",
+                "salary": {"from": 3000, "to": None, "currency": "USD"},
+            },
+            {
+                "name": "Python Developer",
+                "alternate_url": "https://hh.ru/vacancy/2",
+                "salary": {"from": 150000, "to": None, "currency": "RUR"},
+            },
+        ]
+
+        raw = Vacancy.cast_to_object_list(vacancies_json)
+        normalized = Vacancy.cast_to_object_list(vacancies_json, rates=RATES)
+
+        assert raw[0] < raw[1]
+        assert normalized[0].salary == 240000
+        assert normalized[0].salary_range.currency == "RUR"
+        assert normalized[0] > normalized[1]
+
+    def test_constructor_matches_cast(self):
+        """Тест: конструктор и разбор JSON одинаково приводят зарплату."""
+        salary = {"from": 1000, "to": 1500, "currency": "USD"}
+        vacancy = Vacancy(
+            "Remote Developer", "https://hh.ru/vacancy/1", salary, "", rates=RATES
+        )
+        (expected,) = Vacancy.cast_to_object_list(
+            [
+                {
+                    "name": "Remote Developer",
+                    "alternate_url": "https://hh.ru/vacancy/1",
+                    "salary": salary,
+                }
+            ],
+            rates=RATES,
+        )
+
+        assert vacancy.salary == expected.salary == 120000
+        assert vacancy.salary_range == expected.salary_range
+        assert vacancy > Vacancy("Dev", "https://hh.ru/vacancy/2", 100000, "")
+        assert Vacancy("Dev", "https://hh.ru/vacancy/3", {"to": "n/a"}, "").salary == 0
+
+    def test_batch_normalize_matches_objects(self):
+        """Тест векторного пересчета зарплат набора вакансий."""
+        vacancies_json = [
+            {
+                "name": f"Vacancy {i}",
+                "alternate_url": f"https://hh.ru/vacancy/{i}",
+                "salary": salary,
+            }
+            for i, salary in enumerate(
+                [
+                    {"from": 1000, "to": 1500, "currency": "USD"},
+                    {"from": 90000, "to": None, "currency": "RUR"},
+                    {"from": None, "to": 2000, "currency": "EUR", "gross": True},
+                    None,
+                    {"from": 500, "to": None, "currency": "KZT"},
+                ]
+            )
+        ]
+
+        batch = VacancyBatch.from_json(vacancies_json, rates=RATES)
+        expected = Vacancy.cast_to_object_list(vacancies_json, rates=RATES)
+
+        assert batch.salaries.tolist() == [v.salary for v in expected]
+        assert batch.statistics()["max_salary"] == 173913
+        for vacancy, reference in zip(batch.to_vacancies(), expected):
+            assert vacancy.salary_range == reference.salary_range
+
+
+class TestExchangeRates:
+    """Тесты для кэша курсов валют."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        fd, self.temp_filename = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        os.unlink(self.temp_filename)
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        if os.path.exists(self.temp_filename):
+            os.unlink(self.temp_filename)
+
+    def test_rates_are_cached_in_file(self):
+        """Тест: курсы запрашиваются один раз и сохраняются в файл."""
+        api = FakeAPI()
+        rates = ExchangeRates(api, self.temp_filename)
+
+        assert rates.get() == RATES
+        assert rates.get() == RATES
+        assert api.requests == 1
+
+        other_api = FakeAPI()
+        assert ExchangeRates(other_api, self.temp_filename).get() == RATES
+        assert other_api.requests == 0
+
+    def test_refresh_after_interval(self):
+        """Тест обновления курсов после истечения интервала."""
+        api = FakeAPI()
+        rates = ExchangeRates(api, self.temp_filename, refresh_interval=0.01)
+        rates.get()
+        time.sleep(0.02)
+        rates.get()
+
+        assert api.requests == 2
+
+    def test_stale_rates_used_when_api_unavailable(self):
+        """Тест использования сохраненных курсов при недоступности hh.ru."""
+        ExchangeRates(FakeAPI(), self.temp_filename, refresh_interval=0).get()
+
+        api = FakeAPI(available=False)
+        rates = ExchangeRates(api, self.temp_filename, refresh_interval=0)
+
+        assert rates.get() == RATES
+        assert api.requests == 1
+
+    def test_no_rates(self, capsys):
+        """Тест работы без курсов: пересчитывать можно только рубли."""
+        rates = ExchangeRates(FakeAPI(available=False), self.temp_filename)
+
+        assert rates.get() == {"RUR": 1.0}
+        assert "курсы валют" in capsys.readouterr().out
+
+    def test_rates_from_mock_server(self):
+        """Тест получения курсов из справочника /dictionaries."""
+        with MockHHServer() as server:
+            api = HeadHunterAPI(
+                api_url=server.url, scheduler=RequestScheduler(rate=1000)
+            )
+            rates = ExchangeRates(api, self.temp_filename).get()
+
+        assert rates["USD"] == 0.0125
+        assert rates["RUR"] == 1.0
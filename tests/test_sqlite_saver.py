@@ -0,0 +1,186 @@
+import os
+import sqlite3
+import tempfile
+from models.vacancy import Vacancy
+from storage.json_saver import JSONSaver
+from storage.sqlite_saver import SQLiteSaver
+
+
+def make_vacancy(index: int, **kwargs) -> Vacancy:
+    """Создать тестовую вакансию."""
+    fields = {
+        "title": f"Python Developer {index}",
+        "url": f"https://hh.ru/vacancy/{index}",
+        "salary": 100000 + index,
+        "description": "Python разработка",
+        "company": "TechCorp",
+    }
+    fields.update(kwargs)
+    return Vacancy(**fields)
+
+
+class TestSQLiteSaver:
+    """Тесты для хранилища SQLiteSaver."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "vacancies.db")
+        self.saver = SQLiteSaver(self.filename)
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        self.saver.close()
+        self.temp_dir.cleanup()
+
+    def test_add_and_reopen(self):
+        """Тест добавления вакансий и чтения после переоткрытия базы."""
+        vacancy = make_vacancy(
+            1,
+            salary={"from": 1000, "to": 2000, "currency": "USD", "gross": False},
+            key_skills=["Python", "SQL"],
+            experience="От 1 года до 3 лет",
+            hh_id="101",
+            employer_id="1740",
+        )
+        assert self.saver.add_vacancy(vacancy) is True
+        self.saver.close()
+
+        self.saver = SQLiteSaver(self.filename)
+        (stored,) = self.saver.get_vacancies()
+        assert stored.hh_id == "101"
+        assert stored.salary == 2000
+        assert stored.salary_range.currency == "USD"
+        assert stored.key_skills == ("Python", "SQL")
+        assert stored.experience == "От 1 года до 3 лет"
+        assert stored.employer_id == "1740"
+
+    def test_duplicates_are_skipped(self):
+        """Тест: вакансии с тем же hh_id или ссылкой и названием не дублируются."""
+        assert self.saver.add_vacancy(make_vacancy(1, hh_id="1")) is True
+        assert self.saver.add_vacancy(make_vacancy(2, hh_id="1")) is False
+        assert self.saver.add_vacancy(make_vacancy(1)) is False
+
+        added = self.saver.add_vacancies(
+            [make_vacancy(3), make_vacancy(3), make_vacancy(4)]
+        )
+        assert added == 2
+        assert self.saver.count() == 3
+
+    def test_duplicate_without_hh_id(self):
+        """Тест: запись без hh_id и вакансия с ним совпадают по ссылке hh.ru."""
+        assert self.saver.add_vacancy(make_vacancy(1)) is True
+        assert self.saver.add_vacancy(make_vacancy(1, hh_id="1")) is False
+        assert self.saver.delete_vacancy(make_vacancy(1, hh_id="1")) is True
+        assert self.saver.count() == 0
+
+        # Другие вакансии с теми же ссылкой и названием не считаются копиями
+        url = "https://example.com/1"
+        assert self.saver.add_vacancy(make_vacancy(1, url=url, hh_id="2")) is True
+        assert self.saver.add_vacancy(make_vacancy(1, url=url, hh_id="3")) is True
+        assert self.saver.add_vacancy(make_vacancy(1, url=url)) is True
+        assert self.saver.add_vacancy(make_vacancy(1, url=url)) is False
+        assert self.saver.count() == 3
+
+    def test_filters_match_json_saver(self):
+        """Тест: фильтры дают тот же результат, что и JSONSaver."""
+        vacancies = [
+            make_vacancy(1, company="ТехКорп", description="Разработка на Django"),
+            make_vacancy(2, title="Java Developer", description="Spring"),
+            make_vacancy(3, salary=250000, company="Яндекс"),
+            make_vacancy(4, salary=0, description="Go и Python", company="AB"),
+        ]
+        self.saver.add_vacancies(vacancies)
+        json_saver = JSONSaver(os.path.join(self.temp_dir.name, "vacancies.json"))
+        json_saver.add_vacancies(vacancies)
+
+        queries = [
+            {},
+            {"keyword": "python"},
+            {"keyword": "DJANGO"},
+            {"keyword": "go"},
+            {"keyword": 'say "hi"'},
+            {"min_salary": 100002},
+            {"max_salary": 100002},
+            {"min_salary": 100001, "max_salary": 200000, "keyword": "developer"},
+            {"company": "техкорп"},
+            {"company": "b"},
+            {"company": "яндекс", "keyword": "python"},
+        ]
+        for query in queries:
+            expected = [v.url for v in json_saver.get_vacancies(**query)]
+            actual = [v.url for v in self.saver.get_vacancies(**query)]
+            assert actual == expected, query
+
+    def test_delete_and_clear(self):
+        """Тест удаления вакансии и очистки базы вместе с полнотекстовым индексом."""
+        self.saver.add_vacancies(
+            [make_vacancy(1, hh_id="1"), make_vacancy(2), make_vacancy(3)]
+        )
+
+        assert self.saver.delete_vacancy(make_vacancy(9, hh_id="1")) is True
+        assert self.saver.delete_vacancy(make_vacancy(2)) is True
+        assert self.saver.delete_vacancy(make_vacancy(2)) is False
+        assert [v.url for v in self.saver.get_vacancies(keyword="python")] == [
+            "https://hh.ru/vacancy/3"
+        ]
+
+        assert self.saver.clear_all() is True
+        assert self.saver.get_vacancies(keyword="python") == []
+        self.saver.add_vacancy(make_vacancy(1))
+        assert len(self.saver.get_vacancies(keyword="python")) == 1
+
+    def test_old_database_gets_employer_id(self):
+        """Тест: в базу без столбца employer_id столбец добавляется при открытии."""
+        self.saver.close()
+        conn = sqlite3.connect(self.filename)
+        with conn:
+            conn.execute("ALTER TABLE vacancies DROP COLUMN employer_id")
+        conn.close()
+
+        self.saver = SQLiteSaver(self.filename)
+        assert self.saver.add_vacancy(make_vacancy(1, employer_id="1740")) is True
+        (stored,) = self.saver.get_vacancies()
+        assert stored.employer_id == "1740"
+
+    def test_old_database_is_migrated(self):
+        """Тест: база с уникальными ссылкой и названием и без hh_id обновляется."""
+        self.saver.close()
+        os.unlink(self.filename)
+        conn = sqlite3.connect(self.filename)
+        with conn:
+            conn.executescript(
+                """
+                CREATE TABLE vacancies (
+                    id INTEGER PRIMARY KEY,
+                    hh_id TEXT UNIQUE,
+                    title TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    salary INTEGER NOT NULL DEFAULT 0,
+                    description TEXT NOT NULL DEFAULT '',
+                    requirements TEXT,
+                    company TEXT NOT NULL DEFAULT '',
+                    key_skills TEXT,
+                    experience TEXT,
+                    salary_range TEXT,
+                    employer_id TEXT,
+                    UNIQUE (url, title)
+                );
+                INSERT INTO vacancies (hh_id, title, url, description)
+                    VALUES (NULL, 'Python', 'https://hh.ru/vacancy/1', 'Python'),
+                           ('1', 'Senior Python', 'https://hh.ru/vacancy/1', ''),
+                           (NULL, 'Go', 'https://hh.ru/vacancy/2', 'Go');
+                """
+            )
+        conn.close()
+
+        self.saver = SQLiteSaver(self.filename)
+        stored = self.saver.get_vacancies()
+        assert sorted(v.hh_id for v in stored) == ["1", "2"]
+        assert self.saver.add_vacancy(make_vacancy(2)) is False
+        assert [v.url for v in self.saver.get_vacancies(keyword="go")] == [
+            "https://hh.ru/vacancy/2"
+        ]
+        url = "https://example.com/1"
+        assert self.saver.add_vacancy(make_vacancy(1, url=url, hh_id="3")) is True
+        assert self.saver.add_vacancy(make_vacancy(1, url=url, hh_id="4")) is True
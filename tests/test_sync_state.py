@@ -0,0 +1,57 @@
+import os
+import tempfile
+from datetime import timedelta
+from storage.sync_state import SyncState
+
+
+class TestSyncState:
+    """Тесты для хранилища отметок синхронизации."""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        fd, self.temp_filename = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        os.unlink(self.temp_filename)
+        self.state = SyncState(self.temp_filename)
+
+    def teardown_method(self):
+        """Очистка после каждого теста."""
+        if os.path.exists(self.temp_filename):
+            os.unlink(self.temp_filename)
+
+    def test_empty_state(self):
+        """Тест отсутствия отметки до первой синхронизации."""
+        assert self.state.get("company:1740") is None
+
+    def test_update_moves_forward_only(self):
+        """Тест: отметка сдвигается только вперед по времени."""
+        self.state.update("company:1740", "2024-05-13T10:00:00+0300")
+        self.state.update("company:1740", "2024-05-12T10:00:00+0300")
+        assert self.state.get("company:1740") == "2024-05-13T10:00:00+0300"
+
+        # Тот же момент времени в другом часовом поясе не считается новее
+        self.state.update("company:1740", "2024-05-13T07:00:00+0000")
+        assert self.state.get("company:1740") == "2024-05-13T10:00:00+0300"
+
+        self.state.update("company:1740", "2024-05-13T07:00:01+0000")
+        assert self.state.get("company:1740") == "2024-05-13T07:00:01+0000"
+
+    def test_update_with_overlap(self):
+        """Тест: отметка ставится с запасом раньше самой свежей вакансии."""
+        overlap = timedelta(hours=1)
+        self.state.update("company:1740", "2024-05-13T10:00:00+0300", overlap)
+        assert self.state.get("company:1740") == "2024-05-13T09:00:00+0300"
+
+        # Та же вакансия при повторной синхронизации отметку не сдвигает
+        self.state.update("company:1740", "2024-05-13T10:00:00+0300", overlap)
+        assert self.state.get("company:1740") == "2024-05-13T09:00:00+0300"
+
+    def test_state_is_persisted(self):
+        """Тест сохранения отметок в файл."""
+        self.state.update("company:3529", "2024-05-13T10:00:00+0300")
+
+        state = SyncState(self.temp_filename)
+        assert state.get("company:3529") == "2024-05-13T10:00:00+0300"
+
+        state.reset("company:3529")
+        assert SyncState(self.temp_filename).get("company:3529") is None
@@ -1,5 +1,7 @@
+import gc
 import pytest
-from models.vacancy import Vacancy
+from models.vacancy import Vacancy, ConversionReport
+from models.vacancy_batch import VacancyBatch
 
 
 class TestVacancy:
@@ -165,6 +167,31 @@ class TestVacancy:
         vacancies = Vacancy.cast_to_object_list([])
         assert len(vacancies) == 0
 
+    def test_gc_is_paused_only_for_loaded_data(self):
+        """Тест: сборщик мусора не отключается, пока данные загружаются."""
+        item = {"name": "Python", "alternate_url": "https://hh.ru/vacancy/1"}
+        states = []
+
+        def pages():
+            for _ in range(2):
+                states.append(gc.isenabled())
+                yield item
+
+        class Page(list):
+            def __iter__(self):
+                states.append(gc.isenabled())
+                return super().__iter__()
+
+        assert len(Vacancy.cast_to_object_list(pages())) == 2
+        assert len(VacancyBatch.from_json(pages())) == 2
+        assert states == [True] * 4
+
+        states.clear()
+        assert len(Vacancy.cast_to_object_list(Page([item]))) == 1
+        assert len(VacancyBatch.from_json(Page([item]))) == 1
+        assert states == [False, False]
+        assert gc.isenabled()
+
     def test_cast_to_object_list_invalid_data(self):
         """Тест обработки некорректных данных при преобразовании."""
         vacancies_json = [
@@ -186,3 +213,184 @@ class TestVacancy:
         # Должна быть создана только одна вакансия
         assert len(vacancies) == 1
         assert vacancies[0].title == "Python Developer"
+
+    def test_iter_from_json_is_lazy(self):
+        """Тест потокового преобразования JSON в объекты Vacancy."""
+
+        def source():
+            yield {
+                "name": "Python Developer",
+                "alternate_url": "https://hh.ru/vacancy/1",
+                "salary": None,
+                "snippet": {"requirement": "Python"},
+                "employer": {"name": "TechCorp"},
+            }
+            raise AssertionError("Источник прочитан раньше времени")
+
+        iterator = Vacancy.iter_from_json(source())
+        vacancy = next(iterator)
+
+        assert vacancy.title == "Python Developer"
+
+    def test_vacancy_has_no_instance_dict(self):
+        """Тест компактного представления вакансии в слотах."""
+        vacancy = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, "")
+
+        assert not hasattr(vacancy, "__dict__")
+        with pytest.raises(AttributeError):
+            vacancy.unknown = "value"
+
+    def test_salary_is_stored_in_slots(self):
+        """Тест: границы зарплаты хранятся в слотах вакансии, а не объектом."""
+        salary = {"from": 1000, "to": None, "currency": "USD", "gross": True}
+        vacancy = Vacancy("Python Developer", "https://hh.ru/vacancy/1", salary, "")
+
+        assert "salary_range" not in Vacancy.__slots__
+        assert (vacancy.salary_from, vacancy.salary_to) == (1000, None)
+        assert (vacancy.currency, vacancy.gross) == ("USD", True)
+        assert vacancy.salary == 1000
+        assert vacancy.salary_range.to_json() == salary
+
+        converted = Vacancy(
+            "Python", "https://hh.ru/vacancy/2", salary, "", rates={"USD": 0.0125}
+        )
+        assert (converted.salary, converted.currency) == (80000, "RUR")
+
+        empty = Vacancy("Python Developer", "https://hh.ru/vacancy/3", None, "")
+        assert empty.salary_range is None
+        assert empty.currency is None
+
+    def test_from_trusted(self):
+        """Тест создания вакансии из проверенных данных без валидации."""
+        vacancy = Vacancy.from_trusted(
+            title="Python Developer",
+            url="https://hh.ru/vacancy/1",
+            salary=150000,
+            description="Описание",
+            company="TechCorp",
+            key_skills=["Python", "SQL"],
+        )
+
+        assert vacancy.title == "Python Developer"
+        assert vacancy.salary == 150000
+        assert vacancy.requirements == ""
+        assert vacancy.company == "TechCorp"
+        assert list(vacancy.key_skills) == ["Python", "SQL"]
+        assert vacancy.experience == ""
+        assert vacancy > Vacancy("Junior", "https://hh.ru/vacancy/2", 50000, "")
+
+    def test_cast_to_object_list_report(self, capsys):
+        """Тест сбора отброшенных вакансий в отчет вместо вывода в консоль."""
+        vacancies_json = [
+            {
+                "name": "Python Developer",
+                "alternate_url": "https://hh.ru/vacancy/1",
+                "salary": {"from": 100000, "to": None},
+                "snippet": None,
+                "employer": None,
+            },
+            {"alternate_url": "https://hh.ru/vacancy/2"},
+            {"name": "", "alternate_url": "https://hh.ru/vacancy/3"},
+            {"name": "Java Developer"},
+            "не вакансия",
+        ]
+        report = ConversionReport(max_samples=2)
+
+        vacancies = Vacancy.cast_to_object_list(vacancies_json, report)
+
+        assert len(vacancies) == 1
+        assert vacancies[0].salary == 100000
+        assert vacancies[0].company == ""
+        assert report.total == 5
+        assert report.converted == 1
+        assert report.rejected == {
+            "Название вакансии должно быть непустой строкой": 2,
+            "URL вакансии должен быть непустой строкой": 1,
+            "Вакансия должна быть объектом JSON": 1,
+        }
+        assert len(report.samples) == 2
+        assert capsys.readouterr().out == ""
+
+    def test_iter_from_json_prints_single_summary(self, capsys):
+        """Тест вывода одной итоговой строки при отсутствии отчета."""
+        vacancies_json = [{"salary": None}] * 100
+
+        assert list(Vacancy.iter_from_json(vacancies_json)) == []
+        output = capsys.readouterr().out
+        assert output.count("\n") == 1
+        assert "Отброшено: 100" in output
+
+    def test_identity_key(self):
+        """Тест идентичности вакансии независимо от сравнения по зарплате."""
+        first = Vacancy("Python Developer", "https://example.com/1", 100000, "")
+        renamed = Vacancy(
+            "Senior Python Developer",
+            "https://hh.ru/vacancy/1",
+            200000,
+            "",
+            hh_id="1",
+        )
+        same_salary = Vacancy("Java Developer", "https://example.com/2", 100000, "")
+
+        assert first == same_salary
+        assert not first.same_as(same_salary)
+        assert first.key == ("url", "https://example.com/1", "Python Developer")
+        assert renamed.key == ("hh", "1")
+        assert renamed.same_as(Vacancy("Другое", "https://hh.ru/1", 0, "", hh_id=1))
+
+        unique = Vacancy.unique([first, same_salary, renamed, first])
+        assert [v.key for v in unique] == [first.key, same_salary.key, renamed.key]
+        assert {v.key: v for v in unique}[("hh", "1")] is renamed
+
+    def test_identity_key_mixed(self):
+        """Тест: вакансия с hh_id и та же вакансия без него идентичны."""
+        with_id = Vacancy(
+            "Python Developer", "https://hh.ru/vacancy/1", 100000, "", hh_id="1"
+        )
+        legacy = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, "")
+
+        assert with_id.key == legacy.key == ("hh", "1")
+        assert with_id.same_as(legacy) and legacy.same_as(with_id)
+        (kept,) = Vacancy.unique([legacy, with_id])
+        assert kept is legacy
+
+        # Та же ссылка и название, но другой идентификатор — другая вакансия
+        other = Vacancy(
+            "Python Developer", "https://hh.ru/vacancy/1", 100000, "", hh_id="2"
+        )
+        assert not other.same_as(with_id)
+        assert len(Vacancy.unique([with_id, other])) == 2
+
+    def test_cast_keeps_hh_id(self):
+        """Тест сохранения идентификатора hh.ru при преобразовании."""
+        vacancies = Vacancy.cast_to_object_list(
+            [
+                {
+                    "id": "93353083",
+                    "name": "Python Developer",
+                    "alternate_url": "https://hh.ru/vacancy/93353083",
+                },
+                {"name": "Без id", "alternate_url": "https://hh.ru/vacancy/2"},
+            ]
+        )
+
+        assert vacancies[0].hh_id == "93353083"
+        assert vacancies[0].key == ("hh", "93353083")
+        assert vacancies[1].hh_id is None
+
+    def test_cast_keeps_employer_id(self):
+        """Тест: идентификатор работодателя сохраняется и интернируется."""
+        data = [
+            {
+                "name": f"Python Developer {i}",
+                "alternate_url": f"https://hh.ru/vacancy/{i}",
+                "employer": {"id": 1740, "name": "Яндекс"},
+            }
+            for i in range(2)
+        ]
+        first, second = Vacancy.cast_to_object_list(data)
+        (batch_vacancy,) = VacancyBatch.from_json(data[:1]).to_vacancies()
+
+        assert first.employer_id == "1740"
+        assert first.employer_id is second.employer_id
+        assert batch_vacancy.employer_id is first.employer_id
@@ -0,0 +1,85 @@
+import pytest
+from models.vacancy import Vacancy
+from models.vacancy_batch import VacancyBatch
+from utils.filters import get_top_vacancies, get_vacancies_statistics
+
+
+class TestVacancyBatch:
+    """Тесты для колоночного набора вакансий VacancyBatch."""
+
+    def setup_method(self):
+        """Подготовка тестовых данных."""
+        self.vacancies = [
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", 150000, "Python"),
+            Vacancy("Java Developer", "https://hh.ru/vacancy/2", 120000, "Java"),
+            Vacancy("Junior", "https://hh.ru/vacancy/3", None, "Без зарплаты"),
+            Vacancy("Data Scientist", "https://hh.ru/vacancy/4", 150000, "ML"),
+            Vacancy("Team Lead", "https://hh.ru/vacancy/5", 250000, "Lead"),
+        ]
+        self.batch = VacancyBatch.from_vacancies(self.vacancies)
+
+    def test_from_json(self):
+        """Тест сборки набора из данных hh.ru по правилам cast_to_object_list."""
+        vacancies_json = [
+            {
+                "name": "Python Developer",
+                "alternate_url": "https://hh.ru/vacancy/1",
+                "salary": {"from": 100000, "to": 150000},
+                "snippet": {"requirement": "Опыт работы от 3 лет"},
+                "employer": {"name": "TechCorp"},
+            },
+            {"salary": {"from": 50000}},
+            {
+                "name": "Java Developer",
+                "alternate_url": "https://hh.ru/vacancy/2",
+                "salary": None,
+                "snippet": {"requirement": None},
+                "employer": {"name": "JavaCorp"},
+            },
+        ]
+
+        batch = VacancyBatch.from_json(vacancies_json)
+        expected = Vacancy.cast_to_object_list(vacancies_json)
+
+        assert len(batch) == 2
+        for vacancy, reference in zip(batch.to_vacancies(), expected):
+            assert vacancy.title == reference.title
+            assert vacancy.salary == reference.salary
+            assert vacancy.description == reference.description
+            assert vacancy.company == reference.company
+
+    def test_filter_salary(self):
+        """Тест векторного фильтра по диапазону зарплат."""
+        filtered = self.batch.filter_salary(120000, 150000)
+
+        assert [v.url for v in filtered.to_vacancies()] == [
+            "https://hh.ru/vacancy/1",
+            "https://hh.ru/vacancy/2",
+            "https://hh.ru/vacancy/4",
+        ]
+        assert len(self.batch.filter_salary(200000)) == 1
+
+    def test_top_matches_get_top_vacancies(self):
+        """Тест выбора топ-N в том же порядке, что и get_top_vacancies."""
+        for top_n in range(0, 7):
+            expected = get_top_vacancies(self.vacancies, top_n)
+            top = self.batch.top(top_n).to_vacancies()
+            assert [v.url for v in top] == [v.url for v in expected]
+
+    def test_statistics_matches_filters(self):
+        """Тест статистики по зарплатам."""
+        assert self.batch.statistics() == get_vacancies_statistics(self.vacancies)
+        assert self.batch.take([2]).statistics()["with_salary_count"] == 0
+
+    def test_getitem(self):
+        """Тест получения отдельной вакансии из набора."""
+        vacancy = self.batch[4]
+
+        assert isinstance(vacancy, Vacancy)
+        assert vacancy.title == "Team Lead"
+        assert vacancy.salary == 250000
+
+    def test_columns_length_mismatch(self):
+        """Тест проверки длины колонок."""
+        with pytest.raises(ValueError):
+            VacancyBatch(["A", "B"], ["url"], [1, 2], ["d", "d"])
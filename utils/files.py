@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+from typing import Any, Callable, IO, Iterator
+
+
+def atomic_write(
+    path: str,
+    writer: Callable[[IO[Any]], None],
+    binary: bool = False,
+    fsync: bool = True,
+):
+    """
+    Атомарно записать файл: через временный файл в том же каталоге.
+
+    Файл сначала целиком пишется во временный, затем заменяет исходный
+    (os.replace), поэтому читатели видят либо старое, либо новое содержимое,
+    а при ошибке исходный файл не меняется и временный удаляется.
+
+    Args:
+        path (str): Имя файла
+        writer (Callable[[IO[Any]], None]): Функция, записывающая содержимое
+            в переданный открытый файл
+        binary (bool): Открыть временный файл в двоичном режиме (иначе —
+            текстовый в UTF-8)
+        fsync (bool): Сбросить данные на диск перед заменой, чтобы после
+            сбоя питания не остался пустой файл
+
+    Raises:
+        Exception: Любая ошибка writer или записи (временный файл удаляется)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        if binary:
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding="utf-8")
+        with f:
+            writer(f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_json_lines(filename: str) -> Iterator[Any]:
+    """
+    Прочитать файл JSON Lines, в который строки только дописываются.
+
+    Последняя строка без перевода строки оборвалась при аварийном
+    завершении: она отрезается от файла, чтобы следующая запись начиналась
+    с новой строки. Поврежденные строки пропускаются.
+
+    Args:
+        filename (str): Имя файла (если его нет, строк нет)
+
+    Yields:
+        Any: Разобранные строки в порядке файла
+    """
+    try:
+        with open(filename, "rb+") as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    f.truncate(offset)
+                    break
+                offset += len(line)
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return
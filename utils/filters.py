@@ -1,5 +1,10 @@
-from typing import List
+from typing import List, Optional, Tuple
 from models.vacancy import Vacancy
+from models.vacancy_batch import (
+    salary_column,
+    salary_statistics,
+    top_positions,
+)
 
 
 def filter_vacancies(
@@ -22,7 +27,8 @@ def filter_vacancies(
     for vacancy in vacancies:
         # Проверяем, содержит ли вакансия хотя бы одно ключевое слово
         vacancy_text = (
-            f"{vacancy.title} {vacancy.description} {vacancy.requirements}".lower()
+            f"{vacancy.title} {vacancy.description} {vacancy.requirements} "
+            f"{' '.join(vacancy.key_skills)}".lower()
         )
 
         for word in filter_words:
@@ -33,6 +39,27 @@ def filter_vacancies(
     return filtered_vacancies
 
 
+def parse_salary_range(salary_range: str) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Разобрать диапазон зарплат.
+
+    Args:
+        salary_range (str): Диапазон зарплат в формате "min-max" или "min"
+
+    Returns:
+        Optional[Tuple[int, Optional[int]]]: Минимальная и максимальная
+            зарплата (None — без ограничения сверху) или None, если формат
+            неверный
+    """
+    try:
+        if "-" in salary_range:
+            min_salary, max_salary = map(int, salary_range.split("-"))
+            return min_salary, max_salary
+        return int(salary_range), None
+    except ValueError:
+        return None
+
+
 def get_vacancies_by_salary(
     vacancies: List[Vacancy], salary_range: str
 ) -> List[Vacancy]:
@@ -49,27 +76,27 @@ def get_vacancies_by_salary(
     if not salary_range:
         return vacancies
 
-    try:
-        # Парсим диапазон зарплат
-        if "-" in salary_range:
-            min_salary, max_salary = map(int, salary_range.split("-"))
-        else:
-            min_salary = int(salary_range)
-            max_salary = float("inf")
-
-        filtered_vacancies = []
-        for vacancy in vacancies:
-            if min_salary <= vacancy.salary <= max_salary:
-                filtered_vacancies.append(vacancy)
-
-        return filtered_vacancies
-
-    except ValueError:
+    # Парсим диапазон зарплат
+    bounds = parse_salary_range(salary_range)
+    if bounds is None:
         print(
             "Неверный формат диапазона зарплат. Используйте формат 'min-max' или 'min'"
         )
         return vacancies
 
+    min_salary, max_salary = bounds
+    if max_salary is None:
+        max_salary = float("inf")
+
+    # Один проход по списку: извлечение колонки зарплат для векторного
+    # сравнения стоит столько же, сколько само сравнение
+    filtered_vacancies = []
+    for vacancy in vacancies:
+        if min_salary <= vacancy.salary <= max_salary:
+            filtered_vacancies.append(vacancy)
+
+    return filtered_vacancies
+
 
 def sort_vacancies(vacancies: List[Vacancy], reverse: bool = True) -> List[Vacancy]:
     """
@@ -87,6 +114,9 @@ def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
     """
     Получить топ N вакансий по зарплате.
 
+    Выбирает N наибольших зарплат без сортировки всего списка
+    (см. VacancyBatch.top); порядок такой же, как у sort_vacancies.
+
     Args:
         vacancies (List[Vacancy]): Список вакансий
         top_n (int): Количество вакансий для вывода
@@ -94,8 +124,8 @@ def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
     Returns:
         List[Vacancy]: Топ N вакансий
     """
-    sorted_vacancies = sort_vacancies(vacancies)
-    return sorted_vacancies[:top_n]
+    positions = top_positions(salary_column(vacancies), top_n)
+    return [vacancies[i] for i in positions.tolist()]
 
 
 def print_vacancies(vacancies: List[Vacancy]):
@@ -139,32 +169,7 @@ def get_vacancies_statistics(vacancies: List[Vacancy]) -> dict:
     Returns:
         dict: Статистика по вакансиям
     """
-    if not vacancies:
-        return {
-            "total_count": 0,
-            "with_salary_count": 0,
-            "avg_salary": 0,
-            "max_salary": 0,
-            "min_salary": 0,
-        }
-
-    with_salary = [v for v in vacancies if v.salary > 0]
-
-    stats = {
-        "total_count": len(vacancies),
-        "with_salary_count": len(with_salary),
-        "avg_salary": 0,
-        "max_salary": 0,
-        "min_salary": 0,
-    }
-
-    if with_salary:
-        salaries = [v.salary for v in with_salary]
-        stats["avg_salary"] = sum(salaries) // len(salaries)
-        stats["max_salary"] = max(salaries)
-        stats["min_salary"] = min(salaries)
-
-    return stats
+    return salary_statistics(salary_column(vacancies))
 
 
 def print_statistics(vacancies: List[Vacancy]):